@@ -0,0 +1,47 @@
+"""Compare date-range reads from the memory-mapped BarStore and the SQLite PriceStore.
+
+Run with ``python -m benchmarks.bench_barstore``.
+"""
+
+import random
+import tempfile
+import timeit
+from pathlib import Path
+
+from benchmarks import payloads
+from fmp.barstore import BarStore
+from fmp.columnar import PriceColumns
+from fmp.sync import PriceStore
+
+
+def main(repeat: int = 5, queries: int = 200) -> None:
+    rows = payloads.intraday_bars()
+    dates = sorted(row["date"] for row in rows)
+    rng = random.Random(0)
+    ranges = []
+    for _ in range(queries):
+        start = rng.randrange(len(dates) - 2000)
+        ranges.append((dates[start], dates[start + 1999]))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bars = BarStore(Path(tmp) / "bars")
+        prices = PriceStore(Path(tmp) / "prices.db")
+        bars.append("AAPL", "1min", PriceColumns.from_records(rows))
+        prices.write("AAPL", "1min", rows)
+
+        def barstore_ranges():
+            return [bars.read("AAPL", "1min", start, end).close.sum() for start, end in ranges]
+
+        def pricestore_ranges():
+            return [sum(row["close"] for row in prices.read("AAPL", "1min", start, end)) for start, end in ranges]
+
+        cases = {"BarStore (memmap views)": barstore_ranges, "PriceStore (SQLite rows)": pricestore_ranges}
+        for name, run in cases.items():
+            best = min(timeit.repeat(run, number=1, repeat=repeat))
+            print(f"{name:<26} {queries} x 2000 bars  {best * 1000:>8.1f} ms")
+        bars.close()
+        prices.close()
+
+
+if __name__ == "__main__":
+    main()
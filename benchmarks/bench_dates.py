@@ -0,0 +1,42 @@
+"""Compare typed-date validation with re-parsing string dates afterwards.
+
+Run with ``python -m benchmarks.bench_dates``.
+"""
+
+import timeit
+from datetime import datetime
+
+from benchmarks import payloads
+from fmp.dates import typed_model
+from fmp.models import HistoricalPrice
+from fmp.parsing import model_list
+
+
+def main(repeat: int = 5) -> None:
+    rows = payloads.intraday_bars()
+    body = payloads.encode(rows)
+    plain = model_list(HistoricalPrice)
+    typed = model_list(typed_model(HistoricalPrice))
+    plain.from_json(body)
+    typed.from_json(body)
+
+    def strptime_after():
+        bars = plain.from_json(body)
+        return [datetime.strptime(bar.date, "%Y-%m-%d %H:%M:%S") for bar in bars]
+
+    def fromisoformat_after():
+        bars = plain.from_json(body)
+        return [datetime.fromisoformat(bar.date) for bar in bars]
+
+    cases = {
+        "strings + strptime": strptime_after,
+        "strings + fromisoformat": fromisoformat_after,
+        "typed_dates": lambda: typed.from_json(body),
+    }
+    for name, run in cases.items():
+        best = min(timeit.repeat(run, number=1, repeat=repeat))
+        print(f"{name:<28} {len(rows):>7} bars  {best * 1000:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
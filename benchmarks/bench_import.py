@@ -0,0 +1,39 @@
+"""Measure cold import time of the package in fresh interpreters.
+
+Run with ``python -m benchmarks.bench_import``.
+"""
+
+import subprocess
+import sys
+import time
+
+CASES = {
+    "import fmp": "import fmp",
+    "from fmp import FMPClient": "from fmp import FMPClient",
+    "client + Quote schema": "from fmp import FMPClient, Quote; Quote.model_rebuild()",
+    "all models built": (
+        "import fmp.models as m\n"
+        "for name in m.__all__:\n"
+        "    getattr(getattr(m, name), 'model_rebuild', lambda: None)()"
+    ),
+}
+
+
+def cold_time(code: str, repeat: int) -> float:
+    """Best wall time in seconds to start Python and run ``code``, minus bare startup."""
+    def run(source):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", source], check=True)
+        return time.perf_counter() - start
+
+    baseline = min(run("pass") for _ in range(repeat))
+    return min(run(code) for _ in range(repeat)) - baseline
+
+
+def main(repeat: int = 5) -> None:
+    for name, code in CASES.items():
+        print(f"{name:<28} {cold_time(code, repeat) * 1000:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
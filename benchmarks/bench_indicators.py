@@ -0,0 +1,76 @@
+"""Compare vectorized indicators over a symbol x time matrix with per-symbol Python loops.
+
+Run with ``python -m benchmarks.bench_indicators``.
+"""
+
+import timeit
+
+import numpy as np
+
+from fmp.indicators import EMA, RSI, ema, rsi, sma
+
+
+def loop_sma(values, window):
+    out = [float("nan")] * len(values)
+    total = 0.0
+    for i, value in enumerate(values):
+        total += value
+        if i >= window:
+            total -= values[i - window]
+        if i >= window - 1:
+            out[i] = total / window
+    return out
+
+
+def loop_ema(values, span):
+    alpha = 2 / (span + 1)
+    average, out = values[0], []
+    for value in values:
+        average = (1 - alpha) * average + alpha * value
+        out.append(average)
+    return out
+
+
+def loop_rsi(values, period=14):
+    gain = loss = None
+    out = [float("nan")]
+    for previous, value in zip(values, values[1:]):
+        change = value - previous
+        up, down = max(change, 0.0), max(-change, 0.0)
+        gain = up if gain is None else gain + (up - gain) / period
+        loss = down if loss is None else loss + (down - loss) / period
+        out.append(100 - 100 / (1 + gain / loss) if loss else 100.0)
+    return out
+
+
+def main(repeat: int = 3, symbols: int = 500, bars: int = 2000) -> None:
+    rng = np.random.default_rng(0)
+    matrix = 100 + np.cumsum(rng.normal(size=(symbols, bars)), axis=1)
+    rows = matrix.tolist()
+
+    cases = {
+        "SMA(20)": (lambda: [loop_sma(row, 20) for row in rows], lambda: sma(matrix, 20)),
+        "EMA(20)": (lambda: [loop_ema(row, 20) for row in rows], lambda: ema(matrix, 20)),
+        "RSI(14)": (lambda: [loop_rsi(row) for row in rows], lambda: rsi(matrix)),
+    }
+    print(f"{symbols} symbols x {bars} bars")
+    for name, (loop, vectorized) in cases.items():
+        slow = min(timeit.repeat(loop, number=1, repeat=repeat))
+        fast = min(timeit.repeat(vectorized, number=1, repeat=repeat))
+        print(f"{name:<8} python loops {slow * 1000:>8.1f} ms   vectorized {fast * 1000:>7.1f} ms")
+
+    ema_state, rsi_state = EMA(20), RSI(14)
+    ema_state.update(matrix)
+    rsi_state.update(matrix)
+    new_bar = matrix[:, -1:] + 0.1
+
+    def incremental():
+        ema_state.update(new_bar)
+        rsi_state.update(new_bar)
+
+    best = min(timeit.repeat(incremental, number=100, repeat=repeat)) / 100
+    print(f"one new bar for all symbols, EMA + RSI update: {best * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Compare JSON decode backends on realistic response sizes.
+
+Run with ``python -m benchmarks.bench_json_decode``.
+"""
+
+import timeit
+
+from benchmarks import payloads
+from fmp.decoding import available_backends, get_loads
+
+PAYLOADS = {
+    "stock/list": payloads.stock_list,
+    "historical-price-eod/full": payloads.historical_eod,
+    "company-screener": payloads.company_screener,
+}
+
+
+def main(repeat: int = 5) -> None:
+    backends = available_backends()
+    print(f"backends: {', '.join(backends)}")
+    for endpoint, make in PAYLOADS.items():
+        body = payloads.encode(make())
+        print(f"\n{endpoint} ({len(body) / 1e6:.1f} MB)")
+        baseline = None
+        for backend in backends[::-1]:
+            loads = get_loads(backend)
+            best = min(timeit.repeat(lambda: loads(body), number=1, repeat=repeat))
+            baseline = baseline or best
+            print(f"  {backend:<8} {best * 1000:8.1f} ms  {baseline / best:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Compare memory held by validated models and slotted records.
+
+Run with ``python -m benchmarks.bench_memory``.
+"""
+
+import gc
+import timeit
+import tracemalloc
+
+from benchmarks import payloads
+from fmp.decoding import loads
+from fmp.interning import intern_fields
+from fmp.models import CryptoHistoricalPrice, HistoricalPrice, Quote, StockNews, StockScreenerResult
+from fmp.parsing import model_list
+from fmp.records import CryptoHistoricalPriceRecord, HistoricalPriceRecord, QuoteRecord
+
+
+def crypto_prices():
+    return [
+        {"symbol": "BTCUSD", "date": row["date"], "price": row["close"], "volume": row["volume"]}
+        for row in payloads.historical_eod(symbol="BTCUSD")
+    ]
+
+
+CASES = {
+    "Quote": (Quote, QuoteRecord, payloads.quotes),
+    "HistoricalPrice": (HistoricalPrice, HistoricalPriceRecord, payloads.historical_eod),
+    "CryptoHistoricalPrice": (CryptoHistoricalPrice, CryptoHistoricalPriceRecord, crypto_prices),
+}
+
+# Label-heavy models compared with and without intern_strings, on the trusted
+# path where every decoded string is its own object.
+INTERN_CASES = {
+    "StockScreenerResult": (StockScreenerResult, payloads.company_screener),
+    "StockNews": (StockNews, payloads.stock_news),
+}
+
+
+def retained(build, body: bytes) -> int:
+    """Bytes held by the result of decoding ``body`` and building it, once the decoded rows are gone."""
+    gc.collect()
+    tracemalloc.start()
+    result = build(loads(body))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main(repeat: int = 5) -> None:
+    for name, (model, record, make) in CASES.items():
+        rows = make()
+        body = payloads.encode(rows)
+        parser = model_list(model)
+        parser(rows[:1])  # build the schema outside the measurements
+
+        model_bytes = retained(parser, body)
+        record_bytes = retained(record.from_rows, body)
+        model_time = min(timeit.repeat(lambda: parser(rows), number=1, repeat=repeat))
+        record_time = min(timeit.repeat(lambda: record.from_rows(rows), number=1, repeat=repeat))
+        print(
+            f"{name:<22} {len(rows):>6} rows  "
+            f"model {model_bytes / len(rows):>6,.0f} B/row  "
+            f"record {record_bytes / len(rows):>6,.0f} B/row ({model_bytes / record_bytes:3.1f}x smaller)  "
+            f"build {model_time / record_time:3.1f}x faster"
+        )
+
+    for name, (model, make) in INTERN_CASES.items():
+        rows = make()
+        body = payloads.encode(rows)
+        parser = model_list(model)
+        parser(rows[:1])
+
+        plain_bytes = retained(parser, body)
+        interned_bytes = retained(lambda data: intern_fields(parser(data)), body)
+        print(
+            f"{name:<22} {len(rows):>6} rows  "
+            f"plain {plain_bytes / len(rows):>6,.0f} B/row  "
+            f"interned {interned_bytes / len(rows):>6,.0f} B/row ({plain_bytes / interned_bytes:3.1f}x smaller)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Compare vectorized resampling with a per-bar Python loop.
+
+Run with ``python -m benchmarks.bench_resample``.
+"""
+
+import timeit
+from datetime import datetime
+
+from benchmarks import payloads
+from fmp.columnar import PriceColumns
+from fmp.resample import resample
+
+
+def loop_resample(rows, minutes):
+    """Group API rows into ``minutes``-wide buckets aligned to 09:30, bar by bar."""
+    buckets = {}
+    for row in sorted(rows, key=lambda row: row["date"]):
+        stamp = datetime.strptime(row["date"], "%Y-%m-%d %H:%M:%S")
+        offset = (stamp.hour * 60 + stamp.minute - 570) // minutes * minutes + 570
+        key = (stamp.date(), max(offset, 0))
+        bar = buckets.get(key)
+        if bar is None:
+            buckets[key] = dict(row)
+        else:
+            bar["high"] = max(bar["high"], row["high"])
+            bar["low"] = min(bar["low"], row["low"])
+            bar["close"] = row["close"]
+            bar["volume"] += row["volume"]
+    return list(buckets.values())
+
+
+def main(repeat: int = 5) -> None:
+    rows = payloads.intraday_bars()
+    columns = PriceColumns.from_records(rows)
+    for interval, minutes in (("5min", 5), ("1hour", 60)):
+        cases = {
+            f"python loop -> {interval}": lambda: loop_resample(rows, minutes),
+            f"resample() -> {interval}": lambda: resample(columns, interval),
+        }
+        for name, run in cases.items():
+            best = min(timeit.repeat(run, number=1, repeat=repeat))
+            print(f"{name:<22} {len(rows):>7} bars  {best * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
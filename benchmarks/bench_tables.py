@@ -0,0 +1,45 @@
+"""Compare building DataFrames via models with building them straight from rows.
+
+Run with ``python -m benchmarks.bench_tables`` (needs pandas and pyarrow).
+"""
+
+import timeit
+
+from benchmarks import payloads
+from fmp.decoding import loads
+from fmp.models import BalanceSheet, CashFlowStatement, IncomeStatement
+from fmp.parsing import model_list
+from fmp.tables import require_pandas, table
+
+CASES = {
+    "IncomeStatement": (IncomeStatement, "income"),
+    "BalanceSheet": (BalanceSheet, "balance"),
+    "CashFlowStatement": (CashFlowStatement, "cashflow"),
+}
+
+
+def main(repeat: int = 5) -> None:
+    pd = require_pandas()
+    for name, (model, kind) in CASES.items():
+        rows = payloads.statements(kind)
+        body = payloads.encode(rows)
+        parser = model_list(model)
+        parser.from_json(body)
+
+        via_models = min(
+            timeit.repeat(
+                lambda: pd.DataFrame([item.model_dump() for item in parser.from_json(body)]), number=1, repeat=repeat
+            )
+        )
+        to_pandas = min(timeit.repeat(lambda: table(model).to_pandas(loads(body)), number=1, repeat=repeat))
+        to_arrow = min(timeit.repeat(lambda: table(model).to_arrow(loads(body)), number=1, repeat=repeat))
+        print(
+            f"{name:<18} {len(rows):>6} rows  "
+            f"models->DataFrame {via_models * 1000:>7.1f} ms  "
+            f"pandas {to_pandas * 1000:>7.1f} ms ({via_models / to_pandas:3.1f}x)  "
+            f"arrow {to_arrow * 1000:>7.1f} ms ({via_models / to_arrow:3.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Compare per-row model construction with bulk TypeAdapter validation.
+
+The last line times unvalidated Quote records, the ``output="records"`` path
+that ``validate_every`` samples.
+
+Run with ``python -m benchmarks.bench_validation``.
+"""
+
+import timeit
+
+from benchmarks import payloads
+from fmp.decoding import loads
+from fmp.models import BalanceSheet, IncomeStatement, Quote, StockNews, StockScreenerResult
+from fmp.parsing import model_list
+from fmp.records import QuoteRecord, record_list
+
+CASES = {
+    "IncomeStatement": (IncomeStatement, lambda: payloads.statements("income")),
+    "BalanceSheet": (BalanceSheet, lambda: payloads.statements("balance")),
+    "StockScreenerResult": (StockScreenerResult, payloads.company_screener),
+    "StockNews": (StockNews, payloads.stock_news),
+    "Quote": (Quote, payloads.quotes),
+}
+
+
+def main(repeat: int = 5) -> None:
+    for name, (model, make) in CASES.items():
+        rows = make()
+        body = payloads.encode(rows)
+        parser = model_list(model)
+        parser.from_json(body)  # build the schema outside the timed runs
+
+        per_row = min(timeit.repeat(lambda: [model(**item) for item in loads(body)], number=1, repeat=repeat))
+        bulk = min(timeit.repeat(lambda: parser.from_json(body), number=1, repeat=repeat))
+        print(
+            f"{name:<20} {len(rows):>6} rows  "
+            f"per-row {len(rows) / per_row:>9,.0f} rows/s  "
+            f"validate_json {len(rows) / bulk:>9,.0f} rows/s ({per_row / bulk:3.1f}x)"
+        )
+
+    rows = payloads.quotes()
+    body = payloads.encode(rows)
+    parser = record_list(QuoteRecord)
+    bulk = min(timeit.repeat(lambda: parser.validator.from_json(body), number=1, repeat=repeat))
+    records = min(timeit.repeat(lambda: parser(loads(body)), number=1, repeat=repeat))
+    print(
+        f"{'QuoteRecord':<20} {len(rows):>6} rows  "
+        f"records {len(rows) / records:>9,.0f} rows/s  "
+        f"validate_json {len(rows) / bulk:>9,.0f} rows/s ({bulk / records:3.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Synthetic API payloads sized like real FMP responses."""
+
+import json
+import random
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List
+
+EXCHANGES = ["NASDAQ", "NYSE", "AMEX", "LSE", "TSX", "XETRA"]
+SECTORS = ["Technology", "Healthcare", "Energy", "Financial Services", "Utilities", "Industrials"]
+INDUSTRIES = ["Software", "Biotechnology", "Oil & Gas", "Banks", "Semiconductors", "Aerospace"]
+COUNTRIES = ["US", "GB", "CA", "DE", "JP", "FR"]
+SITES = ["reuters.com", "bloomberg.com", "cnbc.com", "fool.com", "seekingalpha.com"]
+
+
+def stock_list(n: int = 80_000, seed: int = 0) -> List[Dict[str, Any]]:
+    """Rows like ``stock/list`` (about 80k symbols)."""
+    rng = random.Random(seed)
+    return [
+        {
+            "symbol": f"SYM{i}",
+            "name": f"Company {i} Inc.",
+            "price": round(rng.uniform(1, 500), 2),
+            "exchange": rng.choice(EXCHANGES),
+            "exchangeShortName": rng.choice(EXCHANGES),
+            "type": "stock",
+        }
+        for i in range(n)
+    ]
+
+
+def historical_eod(n: int = 10_000, symbol: str = "AAPL", seed: int = 0) -> List[Dict[str, Any]]:
+    """Rows like ``historical-price-eod/full`` (about 40 years of daily bars)."""
+    rng = random.Random(seed)
+    day = date(1985, 1, 2)
+    price = 10.0
+    rows = []
+    for _ in range(n):
+        open_ = price
+        close = max(0.5, open_ * (1 + rng.gauss(0, 0.02)))
+        rows.append(
+            {
+                "symbol": symbol,
+                "date": day.isoformat(),
+                "open": round(open_, 4),
+                "high": round(max(open_, close) * 1.01, 4),
+                "low": round(min(open_, close) * 0.99, 4),
+                "close": round(close, 4),
+                "volume": rng.randint(1_000_000, 90_000_000),
+                "change": round(close - open_, 4),
+                "changePercent": round((close - open_) / open_ * 100, 4),
+                "vwap": round((open_ + close) / 2, 4),
+            }
+        )
+        price = close
+        day += timedelta(days=1 if day.weekday() < 4 else 3)
+    return rows
+
+
+def intraday_bars(n: int = 100_000, seed: int = 0) -> List[Dict[str, Any]]:
+    """Rows like ``historical-chart/1min``, newest first as the API returns them."""
+    rng = random.Random(seed)
+    start = datetime(2020, 1, 2, 9, 30)
+    price = 100.0
+    rows = []
+    for i in range(n):
+        open_ = price
+        close = max(0.5, open_ * (1 + rng.gauss(0, 0.001)))
+        rows.append(
+            {
+                "date": (start + timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S"),
+                "open": round(open_, 4),
+                "high": round(max(open_, close) * 1.0005, 4),
+                "low": round(min(open_, close) * 0.9995, 4),
+                "close": round(close, 4),
+                "volume": rng.randint(100, 50_000),
+            }
+        )
+        price = close
+    rows.reverse()
+    return rows
+
+
+def quotes(n: int = 5_000, seed: int = 0) -> List[Dict[str, Any]]:
+    """Rows like ``batch-quote`` for a large watchlist."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        price = round(rng.uniform(1, 500), 2)
+        rows.append(
+            {
+                "symbol": f"SYM{i}",
+                "name": f"Company {i} Inc.",
+                "price": price,
+                "changesPercentage": round(rng.gauss(0, 2), 4),
+                "change": round(rng.gauss(0, 1), 2),
+                "dayLow": round(price * 0.98, 2),
+                "dayHigh": round(price * 1.02, 2),
+                "yearHigh": round(price * 1.4, 2),
+                "yearLow": round(price * 0.6, 2),
+                "marketCap": rng.randint(10_000_000, 3_000_000_000_000),
+                "priceAvg50": round(price * 0.99, 2),
+                "priceAvg200": round(price * 0.95, 2),
+                "exchange": rng.choice(EXCHANGES),
+                "volume": rng.randint(1_000, 100_000_000),
+                "avgVolume": rng.randint(1_000, 100_000_000),
+                "open": round(price * 0.995, 2),
+                "previousClose": round(price * 0.99, 2),
+                "eps": round(rng.uniform(-5, 20), 2),
+                "pe": round(rng.uniform(5, 80), 2),
+                "earningsAnnouncement": "2025-01-30T21:30:00.000+0000",
+                "sharesOutstanding": rng.randint(1_000_000, 16_000_000_000),
+                "timestamp": 1_729_000_000 + i,
+            }
+        )
+    return rows
+
+
+def company_screener(n: int = 10_000, seed: int = 0) -> List[Dict[str, Any]]:
+    """Rows like ``company-screener`` with a high limit."""
+    rng = random.Random(seed)
+    return [
+        {
+            "symbol": f"SYM{i}",
+            "companyName": f"Company {i} Inc.",
+            "marketCap": rng.randint(10_000_000, 3_000_000_000_000),
+            "sector": rng.choice(SECTORS),
+            "industry": rng.choice(INDUSTRIES),
+            "beta": round(rng.uniform(0, 3), 3),
+            "price": round(rng.uniform(1, 500), 2),
+            "lastAnnualDividend": round(rng.uniform(0, 5), 2),
+            "volume": rng.randint(1_000, 100_000_000),
+            "exchange": rng.choice(EXCHANGES),
+            "exchangeShortName": rng.choice(EXCHANGES),
+            "country": rng.choice(COUNTRIES),
+            "isEtf": False,
+            "isActivelyTrading": True,
+        }
+        for i in range(n)
+    ]
+
+
+def statements(kind: str, n: int = 2_000, seed: int = 0) -> List[Dict[str, Any]]:
+    """Rows like the income, balance sheet and cash flow endpoints for many symbols."""
+    from fmp.models import BalanceSheet, CashFlowStatement, IncomeStatement
+
+    model = {"income": IncomeStatement, "balance": BalanceSheet, "cashflow": CashFlowStatement}[kind]
+    rng = random.Random(seed)
+    numeric = [
+        field.alias or name
+        for name, field in model.model_fields.items()
+        if name not in {"date", "symbol", "reported_currency", "cik", "filling_date", "accepted_date",
+                        "calendar_year", "period"}
+    ]
+    rows = []
+    for i in range(n):
+        row = {
+            "date": f"{2024 - i % 20}-09-28",
+            "symbol": f"SYM{i // 20}",
+            "reportedCurrency": "USD",
+            "cik": f"{i:010d}",
+            "fillingDate": f"{2024 - i % 20}-11-01",
+            "acceptedDate": f"{2024 - i % 20}-11-01 18:01:14",
+            "calendarYear": str(2024 - i % 20),
+            "period": "FY",
+        }
+        row.update({key: rng.uniform(-1e9, 1e11) for key in numeric})
+        rows.append(row)
+    return rows
+
+
+def stock_news(n: int = 5_000, seed: int = 0) -> List[Dict[str, Any]]:
+    """Rows like ``news/stock-latest`` with a high limit."""
+    rng = random.Random(seed)
+    return [
+        {
+            "symbol": f"SYM{rng.randint(0, 500)}",
+            "publishedDate": f"2024-10-{1 + i % 28:02d} {i % 24:02d}:15:00",
+            "title": f"Headline number {i} about markets",
+            "image": f"https://images.example.com/{i}.jpg",
+            "site": rng.choice(SITES),
+            "text": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4,
+            "url": f"https://news.example.com/articles/{i}",
+        }
+        for i in range(n)
+    ]
+
+
+def encode(rows: Any) -> bytes:
+    """Serialize a payload the way the API sends it."""
+    return json.dumps(rows).encode()
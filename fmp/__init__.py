@@ -1,40 +1,145 @@
-"""FMP Python SDK - A Python wrapper for the Financial Modeling Prep API."""
+"""FMP Python SDK - A Python wrapper for the Financial Modeling Prep API.
+
+Clients, helpers and models are imported on first attribute access so that
+``import fmp`` does not pull in httpx or build any model schemas.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
 
-from fmp.client import FMPClient
 from fmp.exceptions import FMPError, FMPAPIError, FMPAuthError
-from fmp.models import (
-    CompanyProfile,
-    Quote,
-    HistoricalPrice,
-    SearchResult,
-    StockScreenerResult,
-    CryptoQuote,
-    CryptoInfo,
-    CryptoHistoricalPrice,
-    CryptoNews,
-    IncomeStatement,
-    BalanceSheet,
-    CashFlowStatement,
-    FinancialGrowth,
-)
+
+if TYPE_CHECKING:
+    from fmp.adjust import AdjustedPrices
+    from fmp.barstore import BarStore
+    from fmp.cache import ResponseCache
+    from fmp.client import FMPClient
+    from fmp.columnar import PriceColumns, PriceMatrix
+    from fmp.async_client import AsyncFMPClient
+    from fmp.rate_limit import RateLimiter
+    from fmp.ranges import PriceSeries
+    from fmp.records import CryptoHistoricalPriceRecord, CryptoQuoteRecord, HistoricalPriceRecord, QuoteRecord
+    from fmp.retry import RetryPolicy
+    from fmp.sync import PriceStore, SyncResult
+    from fmp.watch import QuoteUpdate, QuoteWatcher
+    from fmp.models import (
+        CompanyProfile,
+        Quote,
+        QuoteBatch,
+        HistoricalPrice,
+        StockSplit,
+        Dividend,
+        SectorPE,
+        IndustryPE,
+        SectorPerformance,
+        SearchResult,
+        StockScreenerResult,
+        CryptoQuote,
+        CryptoInfo,
+        CryptoHistoricalPrice,
+        CryptoNews,
+        IncomeStatement,
+        BalanceSheet,
+        CashFlowStatement,
+        FinancialGrowth,
+    )
 
 __version__ = "0.1.0"
+
+# Public name -> module that defines it.
+_LAZY = {
+    "FMPClient": "fmp.client",
+    "AsyncFMPClient": "fmp.async_client",
+    "RateLimiter": "fmp.rate_limit",
+    "RetryPolicy": "fmp.retry",
+    "ResponseCache": "fmp.cache",
+    "PriceStore": "fmp.sync",
+    "BarStore": "fmp.barstore",
+    "AdjustedPrices": "fmp.adjust",
+    "QuoteWatcher": "fmp.watch",
+    "QuoteUpdate": "fmp.watch",
+    "SyncResult": "fmp.sync",
+    "CompanyProfile": "fmp.models",
+    "Quote": "fmp.models",
+    "QuoteBatch": "fmp.models",
+    "QuoteRecord": "fmp.records",
+    "HistoricalPrice": "fmp.models",
+    "StockSplit": "fmp.models",
+    "Dividend": "fmp.models",
+    "SectorPE": "fmp.models",
+    "IndustryPE": "fmp.models",
+    "SectorPerformance": "fmp.models",
+    "HistoricalPriceRecord": "fmp.records",
+    "PriceColumns": "fmp.columnar",
+    "PriceMatrix": "fmp.columnar",
+    "PriceSeries": "fmp.ranges",
+    "SearchResult": "fmp.models",
+    "StockScreenerResult": "fmp.models",
+    "CryptoQuote": "fmp.models",
+    "CryptoQuoteRecord": "fmp.records",
+    "CryptoInfo": "fmp.models",
+    "CryptoHistoricalPrice": "fmp.models",
+    "CryptoHistoricalPriceRecord": "fmp.records",
+    "CryptoNews": "fmp.models",
+    "IncomeStatement": "fmp.models",
+    "BalanceSheet": "fmp.models",
+    "CashFlowStatement": "fmp.models",
+    "FinancialGrowth": "fmp.models",
+}
+
 __all__ = [
     "FMPClient",
+    "AsyncFMPClient",
     "FMPError",
     "FMPAPIError",
     "FMPAuthError",
+    "RateLimiter",
+    "RetryPolicy",
+    "ResponseCache",
+    "PriceStore",
+    "SyncResult",
+    "BarStore",
+    "AdjustedPrices",
+    "QuoteWatcher",
+    "QuoteUpdate",
     "CompanyProfile",
     "Quote",
+    "QuoteBatch",
+    "QuoteRecord",
     "HistoricalPrice",
+    "HistoricalPriceRecord",
+    "StockSplit",
+    "Dividend",
+    "SectorPE",
+    "IndustryPE",
+    "SectorPerformance",
+    "PriceColumns",
+    "PriceMatrix",
+    "PriceSeries",
     "SearchResult",
     "StockScreenerResult",
     "CryptoQuote",
+    "CryptoQuoteRecord",
     "CryptoInfo",
     "CryptoHistoricalPrice",
+    "CryptoHistoricalPriceRecord",
     "CryptoNews",
     "IncomeStatement",
     "BalanceSheet",
     "CashFlowStatement",
     "FinancialGrowth",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,246 @@
+"""Split and dividend adjustment of raw daily prices.
+
+``historical-price-eod`` serves unadjusted, split-adjusted and
+dividend-adjusted histories as separate full downloads. :class:`AdjustedPrices`
+instead keeps the unadjusted bars and the split and dividend events, and
+derives both adjusted series locally:
+
+- split-adjusted prices divide each bar by the product of the split ratios
+  after it, and multiply its volume by the same product;
+- dividend-adjusted prices additionally multiply each bar by
+  ``1 - dividend / previous close`` for every later ex-dividend date, the
+  usual total-return adjustment.
+
+Events dated after the last held bar (announced, not yet effective) are kept
+but ignored until bars reach them. Adjusted series are cached and recomputed
+only when the events that affect them change.
+
+NumPy is required; install it with ``pip install "fmp-python[numpy]"``.
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from fmp.columnar import PriceColumns, require_numpy
+
+# ``historical-price-eod/non-split-adjusted`` keys -> PriceColumns fields.
+RAW_KEYS = {"adjOpen": "open", "adjHigh": "high", "adjLow": "low", "adjClose": "close"}
+
+PRICE_FIELDS = ("open", "high", "low", "close", "vwap")
+
+
+def _field(event: Any, name: str) -> Any:
+    return event[name] if isinstance(event, Mapping) else getattr(event, name)
+
+
+def raw_columns(rows: List[Mapping[str, Any]]) -> PriceColumns:
+    """Build PriceColumns from ``non-split-adjusted`` rows, whose unadjusted prices use ``adj*`` keys."""
+    return PriceColumns.from_records([{RAW_KEYS.get(key, key): value for key, value in row.items()} for row in rows])
+
+
+def split_factors(dates: Any, splits: Iterable[Any]) -> Any:
+    """
+    Return, for each bar date, the product of the ratios of the splits after it.
+
+    Args:
+        dates: Bar dates, oldest first
+        splits: StockSplit models or ``splits`` rows
+    """
+    np = require_numpy()
+    events = sorted(
+        (np.datetime64(str(_field(s, "date"))[:10], "D"), _field(s, "numerator") / _field(s, "denominator"))
+        for s in splits
+    )
+    return _suffix_factors(np, dates, [date for date, _ in events], [ratio for _, ratio in events])
+
+
+def dividend_factors(dates: Any, close: Any, dividends: Iterable[Any]) -> Any:
+    """
+    Return, for each bar date, the total-return factor of the dividends after it.
+
+    Each dividend multiplies the bars before its ex-date by ``1 - dividend /
+    close``, using the close of the last bar before the ex-date. ``close``
+    and the dividends must be on the same (unadjusted) basis.
+
+    Args:
+        dates: Bar dates, oldest first
+        close: Closing prices of the bars
+        dividends: Dividend models or ``dividends`` rows
+    """
+    np = require_numpy()
+    days = np.asarray(dates).astype("datetime64[D]")
+    events = sorted((np.datetime64(str(_field(d, "date"))[:10], "D"), _field(d, "dividend")) for d in dividends)
+    event_dates = np.array([date for date, _ in events], dtype="datetime64[D]")
+    amounts = np.array([amount for _, amount in events], dtype=np.float64)
+    previous = np.searchsorted(days, event_dates, side="left") - 1
+    # Dividends before the first bar do not affect any bar.
+    keep = previous >= 0
+    prior_close = np.asarray(close, dtype=np.float64)[previous[keep]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = np.where(prior_close > 0, 1.0 - amounts[keep] / prior_close, 1.0)
+    return _suffix_factors(np, dates, event_dates[keep], np.nan_to_num(ratios, nan=1.0))
+
+
+def _suffix_factors(np: Any, dates: Any, event_dates: Any, ratios: Any) -> Any:
+    """Multiply together the ``ratios`` of the events dated after each of ``dates``."""
+    days = np.asarray(dates).astype("datetime64[D]")
+    event_dates = np.asarray(event_dates, dtype="datetime64[D]")
+    suffix = np.ones(len(event_dates) + 1)
+    if len(event_dates):
+        suffix[:-1] = np.cumprod(np.asarray(ratios, dtype=np.float64)[::-1])[::-1]
+    return suffix[np.searchsorted(event_dates, days, side="right")]
+
+
+class AdjustedPrices:
+    """
+    Unadjusted daily bars with their splits and dividends, adjusted on demand.
+
+    Built by :meth:`fmp.FMPClient.get_adjusted_prices`, or directly from
+    data already held. Adjusted series are computed on first access and
+    cached; :meth:`update_events` and :meth:`append` only drop the cache when
+    the change affects bars already held.
+
+    Args:
+        raw: Unadjusted bars, oldest first
+        splits: StockSplit models or ``splits`` rows
+        dividends: Dividend models or ``dividends`` rows
+    """
+
+    def __init__(self, raw: PriceColumns, splits: Iterable[Any] = (), dividends: Iterable[Any] = ()):
+        self.raw = raw
+        self._lock = threading.Lock()
+        self._cache: Dict[str, PriceColumns] = {}
+        self._splits = self._split_events(splits)
+        self._dividends = self._dividend_events(dividends)
+
+    @staticmethod
+    def _split_events(splits: Iterable[Any]) -> Tuple[Tuple[str, float, float], ...]:
+        return tuple(
+            sorted((str(_field(s, "date"))[:10], _field(s, "numerator"), _field(s, "denominator")) for s in splits)
+        )
+
+    @staticmethod
+    def _dividend_events(dividends: Iterable[Any]) -> Tuple[Tuple[str, float], ...]:
+        return tuple(sorted((str(_field(d, "date"))[:10], _field(d, "dividend")) for d in dividends))
+
+    @property
+    def splits(self) -> List[Dict[str, Any]]:
+        """Known splits as ``{'date', 'numerator', 'denominator'}`` dicts, oldest first."""
+        return [{"date": d, "numerator": n, "denominator": m} for d, n, m in self._splits]
+
+    @property
+    def dividends(self) -> List[Dict[str, Any]]:
+        """Known dividends as ``{'date', 'dividend'}`` dicts, oldest first."""
+        return [{"date": d, "dividend": amount} for d, amount in self._dividends]
+
+    def _adjust(self, split: Any, factors: Any) -> PriceColumns:
+        values = {name: getattr(self.raw, name) / factors for name in PRICE_FIELDS}
+        return PriceColumns(date=self.raw.date, volume=self.raw.volume * split, **values)
+
+    def _split_factors(self) -> Any:
+        events = _effective(self._splits, self._last_day())
+        return split_factors(self.raw.date, [{"date": d, "numerator": n, "denominator": m} for d, n, m in events])
+
+    def _dividend_factors(self) -> Any:
+        events = _effective(self._dividends, self._last_day())
+        return dividend_factors(self.raw.date, self.raw.close, [{"date": d, "dividend": a} for d, a in events])
+
+    def split_adjusted(self) -> PriceColumns:
+        """Return prices divided, and volumes multiplied, by the later split ratios."""
+        with self._lock:
+            cached = self._cache.get("split")
+            if cached is None:
+                split = self._split_factors()
+                cached = self._cache["split"] = self._adjust(split, split)
+            return cached
+
+    def dividend_adjusted(self) -> PriceColumns:
+        """Return split-adjusted prices further adjusted for later dividends (total return)."""
+        with self._lock:
+            cached = self._cache.get("dividend")
+            if cached is None:
+                split = self._split_factors()
+                cached = self._cache["dividend"] = self._adjust(split, split / self._dividend_factors())
+            return cached
+
+    def _last_day(self) -> Optional[str]:
+        return str(self.raw.date[-1].astype("datetime64[D]")) if len(self.raw) else None
+
+    def update_events(self, splits: Optional[Iterable[Any]] = None, dividends: Optional[Iterable[Any]] = None) -> bool:
+        """
+        Replace the known splits and/or dividends, e.g. with a fresh ``get_splits`` response.
+
+        The cache is dropped only if the events dated on or before the last
+        bar changed; announced future events are stored but do not affect any
+        bar yet.
+
+        Returns:
+            True if the adjusted series changed
+        """
+        with self._lock:
+            last = self._last_day()
+            changed = False
+            if splits is not None:
+                events = self._split_events(splits)
+                changed |= _effective(events, last) != _effective(self._splits, last)
+                self._splits = events
+            if dividends is not None:
+                events = self._dividend_events(dividends)
+                changed |= _effective(events, last) != _effective(self._dividends, last)
+                self._dividends = events
+            if changed:
+                self._cache.clear()
+            return changed
+
+    def append(self, bars: Any) -> int:
+        """
+        Add unadjusted bars newer than the last held one.
+
+        Cached series are extended with the new bars unless a known event
+        takes effect within them, which changes every earlier bar's factor and
+        drops the cache.
+
+        Args:
+            bars: PriceColumns or ``non-split-adjusted`` rows
+
+        Returns:
+            Number of bars added
+        """
+        np = require_numpy()
+        if not isinstance(bars, PriceColumns):
+            bars = raw_columns(bars)
+        with self._lock:
+            last = self.raw.date[-1] if len(self.raw) else None
+            new = bars.date > last if last is not None else np.ones(len(bars), dtype=bool)
+            if not new.any():
+                return 0
+            added = PriceColumns(**{name: getattr(bars, name)[new] for name in PriceColumns.FIELDS})
+            before = self._last_day()
+            self.raw = PriceColumns.merge([self.raw, added])
+            after = self._last_day()
+            if _effective(self._splits, after) != _effective(self._splits, before) or _effective(
+                self._dividends, after
+            ) != _effective(self._dividends, before):
+                self._cache.clear()
+            else:
+                self._extend_cache(added)
+            return len(added)
+
+    def _extend_cache(self, added: PriceColumns) -> None:
+        # Every effective event predates the new bars, so their factors are 1
+        # and the earlier bars' factors are unchanged.
+        for name, cached in list(self._cache.items()):
+            self._cache[name] = PriceColumns.merge([cached, added])
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __repr__(self) -> str:
+        return f"AdjustedPrices({len(self.raw)} bars, {len(self._splits)} splits, {len(self._dividends)} dividends)"
+
+
+def _effective(events: Tuple[Tuple[Any, ...], ...], last_day: Optional[str]) -> Tuple[Tuple[Any, ...], ...]:
+    """Return the events dated on or before ``last_day``, the ones that affect stored bars."""
+    if last_day is None:
+        return ()
+    return tuple(event for event in events if event[0] <= last_day)
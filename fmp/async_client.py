@@ -0,0 +1,297 @@
+"""Asynchronous FMP API client."""
+
+import asyncio
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import httpx
+
+from fmp.barstore import BarStore
+from fmp.cache import ResponseCache, cache_key
+from fmp.client import DEFAULT_BASE_URL, BaseClient
+from fmp.coalesce import AsyncRequestCoalescer
+from fmp.connection import ConnectionStats, build_timeout
+from fmp.exceptions import FMPAPIError
+from fmp.rate_limit import RateLimiter
+from fmp.retry import RetryPolicy
+from fmp.streaming import JSONArrayParser
+from fmp.sync import PriceStore, SyncResult, sync_steps
+
+
+class _ConcurrencyLimit:
+    """
+    Holder of the semaphore bounding requests in flight.
+
+    Copies made by :meth:`fmp.FMPClient.with_options` share the holder, so
+    they draw from the same limit even when the semaphore is created later.
+    """
+
+    __slots__ = ("limit", "_semaphore")
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so the semaphore belongs to the running event loop.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.limit)
+        return self._semaphore
+
+
+class AsyncFMPClient(BaseClient):
+    """
+    Asyncio client for the Financial Modeling Prep API.
+
+    Exposes the same endpoint methods as :class:`fmp.FMPClient`; each call
+    returns a coroutine that resolves to the same parsed result.
+
+    Args:
+        api_key: Your FMP API key
+        base_url: Base URL for the API (default: https://financialmodelingprep.com/stable)
+        timeout: Request timeout in seconds (default: 30.0)
+        max_concurrency: Maximum number of requests in flight at once (default: 100)
+        rate_limiter: Optional RateLimiter that every request waits on; may be
+            shared with other clients to enforce one quota
+        retry: Optional RetryPolicy for transient failures; without one every
+            request is attempted once
+        cache: Optional ResponseCache consulted before every GET request
+        coalesce: Share one HTTP request between concurrent identical GET calls
+            (default: True)
+        typed_dates: Return date fields of models as ``datetime.date`` /
+            ``datetime.datetime`` instead of strings (default: False)
+        intern_strings: Intern exchange, sector, industry, country, currency
+            and site names in list results so repeated values share one
+            string object (default: False)
+        bar_store: Optional BarStore; intraday chart requests for a closed
+            date range it holds finer bars for are resampled locally instead
+            of fetched (requires NumPy)
+        validate_every: Also validate one in this many ``output="records"``
+            responses into full models, so schema drift raises a pydantic
+            ``ValidationError``; 0 never validates records (default: 0)
+        max_connections: Size of the connection pool (default: max_concurrency)
+        max_keepalive_connections: Idle connections kept open for reuse (default: max_connections)
+        keepalive_expiry: Seconds an idle connection stays open (default: 5.0)
+        http2: Negotiate HTTP/2 when the server supports it; requires the
+            ``h2`` package (default: False)
+        connect_timeout: Timeout for establishing a connection; defaults to ``timeout``
+        read_timeout: Timeout for reading a response; defaults to ``timeout``
+        transport: Pre-built httpx transport to send requests through; pool
+            settings are then the transport's own
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = 30.0,
+        max_concurrency: int = 100,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = True,
+        typed_dates: bool = False,
+        intern_strings: bool = False,
+        bar_store: Optional[BarStore] = None,
+        validate_every: int = 0,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: float = 5.0,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        super().__init__(
+            api_key,
+            base_url=base_url,
+            timeout=timeout,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            cache=cache,
+            typed_dates=typed_dates,
+            intern_strings=intern_strings,
+            bar_store=bar_store,
+            validate_every=validate_every,
+        )
+        self.max_concurrency = max_concurrency
+        self.coalescer = AsyncRequestCoalescer() if coalesce else None
+        self._concurrency = _ConcurrencyLimit(max_concurrency)
+        if max_connections is None:
+            max_connections = max_concurrency
+        if max_keepalive_connections is None:
+            max_keepalive_connections = max_connections
+        self.connection_stats = ConnectionStats()
+        self._client = httpx.AsyncClient(
+            timeout=build_timeout(timeout, connect_timeout, read_timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            transport=transport,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def sync_prices(
+        self,
+        symbols: Iterable[str],
+        store: PriceStore,
+        interval: str = "1day",
+        overlap: int = 5,
+        from_date: Optional[str] = None,
+    ) -> Dict[str, SyncResult]:
+        """Bring locally stored price histories up to date; see :meth:`fmp.FMPClient.sync_prices`."""
+        steps = sync_steps(store, symbols, interval, overlap, from_date)
+        try:
+            calls = next(steps)
+            while True:
+                calls = steps.send(await self._fetch_many(calls))
+        except StopIteration as done:
+            return done.value
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        return self._concurrency.semaphore()
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a request, applying rate limiting and retries; see :meth:`fmp.FMPClient._send`."""
+        url, params = self._build_request(endpoint, params)
+        attempt = 0
+
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+
+            async with self._get_semaphore():
+                try:
+                    self.connection_stats.record_request()
+                    request = self._client.build_request(
+                        method, url, params=params, extensions={"trace": self.connection_stats.atrace}
+                    )
+                    response = await self._client.send(request, stream=stream)
+                except httpx.RequestError as e:
+                    delay = self.retry.next_delay(attempt, error=e) if self.retry is not None else None
+                    if delay is None:
+                        raise FMPAPIError(f"Request failed: {str(e)}")
+                else:
+                    delay = self.retry.next_delay(attempt, response=response) if self.retry is not None else None
+                    if delay is None:
+                        return response
+                    await response.aclose()
+
+            await asyncio.sleep(delay)
+
+    async def _request_raw(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """
+        Make a request to the FMP API.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Raw response body
+
+        Raises:
+            FMPAuthError: If authentication fails
+            FMPAPIError: If API returns an error
+        """
+        return self._handle_response(await self._send(method, endpoint, params))
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make a request to the FMP API and return the decoded JSON data."""
+        return self._decode(await self._request_raw(method, endpoint, params))
+
+    async def _get_raw(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        """Make a GET request, served from the cache when possible, and return the raw body."""
+        if self.cache is not None:
+            body = self.cache.get(endpoint, params)
+            if body is not None:
+                return body
+
+        async def fetch() -> bytes:
+            body = await self._request_raw("GET", endpoint, params)
+            if self.cache is not None:
+                self.cache.set(endpoint, params, body)
+            return body
+
+        if self.coalescer is None:
+            return await fetch()
+        return await self.coalescer.do(cache_key(endpoint, params), fetch)
+
+    async def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Make a GET request to the API."""
+        return self._decode(await self._get_raw(endpoint, params))
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        parse: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """Make a GET request and run the response through ``parse``."""
+        return self._parse(await self._get_raw(endpoint, params), parse)
+
+    async def _fetch_many(
+        self,
+        calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        parse: Optional[Callable[[Any], Any]] = None,
+        combine: Optional[Callable[[List[Any]], Any]] = None,
+    ) -> Any:
+        """Run several ``_fetch`` calls concurrently; see :meth:`fmp.FMPClient._fetch_many`."""
+        results = list(await asyncio.gather(*(self._fetch(endpoint, params, parse) for endpoint, params in calls)))
+        return combine(results) if combine is not None else results
+
+    async def _stream(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        parse: Optional[Callable[[Any], Any]] = None,
+    ) -> AsyncIterator[Any]:
+        """Make a GET request and yield its JSON array elements as they arrive; see :meth:`fmp.FMPClient._stream`."""
+        response = await self._send("GET", endpoint, params, stream=True)
+        try:
+            if response.is_error:
+                await response.aread()
+                self._handle_response(response)
+
+            parse = self._element_parser(parse)
+            parser = JSONArrayParser()
+            async for chunk in response.aiter_bytes():
+                for item in parser.feed(chunk):
+                    yield parse(item)
+            for item in self._check_stream_tail(parser, response):
+                yield parse(item)
+        except httpx.RequestError as e:
+            raise FMPAPIError(f"Request failed: {str(e)}")
+        finally:
+            await response.aclose()
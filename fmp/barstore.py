@@ -0,0 +1,255 @@
+"""Memory-mapped, append-only columnar store of price bars.
+
+Each symbol and interval is a directory of fixed-width binary files, one per
+column of :class:`fmp.columnar.PriceColumns`: ``date.bin`` holds ``int64``
+UNIX seconds and the price and volume columns hold ``float64``. Files are
+memory-mapped for reading, so a date-range query is two binary searches on
+the date column and returns views into the mapped files without copying or
+loading the rest of the history.
+
+A store only holds the bars it was given, so it also records which days were
+downloaded in full (``complete.json``, closed day ranges). Local resampling
+serves a date range only when every day in it is recorded as complete; a
+hole between appends or a day stored mid-session is fetched instead.
+
+NumPy is required; install it with ``pip install "fmp-python[numpy]"``.
+"""
+
+import json
+import os
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from urllib.parse import quote, unquote
+
+from fmp.columnar import PriceColumns, require_numpy
+
+# Bytes per value in every column file.
+ITEM_SIZE = 8
+
+# Per-directory record of the days whose bars are stored in full.
+COMPLETE_FILE = "complete.json"
+
+
+def _as_row(bar: Any) -> Mapping[str, Any]:
+    if isinstance(bar, Mapping):
+        row = bar
+    elif hasattr(bar, "to_dict"):
+        row = bar.to_dict()
+    else:
+        row = bar.model_dump()
+    if "close" not in row and "price" in row:
+        # Light EOD rows (e.g. crypto) carry a single price.
+        row = {**row, "close": row["price"]}
+    return row
+
+
+class BarStore:
+    """
+    Append-only store of OHLCV bars under a root directory.
+
+    Bars can be appended from any of the price endpoints: PriceColumns from
+    ``get_historical_chart(..., output="columns")``, the row dicts of
+    ``get_historical_price`` or the models and records of
+    ``get_historical_chart`` and ``get_crypto_historical_price``. Only bars
+    newer than the last stored one are appended, so feeding overlapping
+    downloads is safe.
+
+    Args:
+        root: Directory holding the store; created as needed
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root).expanduser()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # (symbol, interval) -> (bar count, memory-mapped columns)
+        self._maps: Dict[Tuple[str, str], Tuple[int, PriceColumns]] = {}
+
+    def _dir(self, symbol: str, interval: str) -> Path:
+        return self.root / quote(interval, safe="") / quote(symbol, safe="")
+
+    def _length(self, directory: Path) -> int:
+        # A crash mid-append can leave some files longer than others; only
+        # bars present in every column count.
+        sizes = []
+        for name in PriceColumns.FIELDS:
+            path = directory / f"{name}.bin"
+            sizes.append(path.stat().st_size if path.exists() else 0)
+        return min(sizes) // ITEM_SIZE
+
+    def symbols(self, interval: str) -> List[str]:
+        """Return the symbols stored for ``interval``, sorted."""
+        directory = self.root / quote(interval, safe="")
+        if not directory.is_dir():
+            return []
+        return sorted(unquote(path.name) for path in directory.iterdir() if path.is_dir())
+
+    def append(
+        self, symbol: str, interval: str, bars: Any, complete: Optional[Tuple[str, str]] = None
+    ) -> int:
+        """
+        Append the bars newer than the last stored one.
+
+        Args:
+            symbol: Ticker symbol
+            interval: Bar interval, e.g. '1day' or '1min'
+            bars: PriceColumns, or a list of row dicts, models or records
+            complete: ``(from_date, to_date)`` days the bars cover in full,
+                typically the range they were downloaded for; recorded with
+                :meth:`mark_complete`. Days before the previously stored last
+                bar are left out, since their bars were not appended.
+
+        Returns:
+            Number of bars appended
+        """
+        np = require_numpy()
+        if not isinstance(bars, PriceColumns):
+            bars = PriceColumns.from_records([_as_row(bar) for bar in bars])
+        dates = bars.date.astype("datetime64[s]").astype(np.int64)
+
+        directory = self._dir(symbol, interval)
+        with self._lock:
+            directory.mkdir(parents=True, exist_ok=True)
+            length = self._length(directory)
+            keep = np.ones(len(dates), dtype=bool)
+            keep[1:] = dates[1:] != dates[:-1]
+            last = None
+            if length:
+                last = np.fromfile(directory / "date.bin", dtype=np.int64, count=1, offset=(length - 1) * ITEM_SIZE)
+                keep &= dates > last[0]
+            count = int(keep.sum())
+            if count:
+                columns = {"date": dates[keep]}
+                columns.update(
+                    {name: np.asarray(getattr(bars, name), dtype=np.float64)[keep] for name in bars.FIELDS[1:]}
+                )
+                # Write the date column last so a partial append is never visible.
+                for name in bars.FIELDS[1:] + ("date",):
+                    with open(directory / f"{name}.bin", "ab") as f:
+                        f.truncate(length * ITEM_SIZE)
+                        f.write(np.ascontiguousarray(columns[name]).tobytes())
+            # Recorded only after every column is written, so a failed append never marks its days complete.
+            if complete is not None:
+                first_day = complete[0][:10]
+                if last is not None:
+                    first_day = max(first_day, str(last[0].astype("datetime64[s]").astype("datetime64[D]")))
+                self._mark_complete(directory, first_day, complete[1][:10])
+        return count
+
+    def mark_complete(self, symbol: str, interval: str, from_date: str, to_date: str) -> None:
+        """
+        Record that every bar from ``from_date`` to ``to_date`` (inclusive days) is stored.
+
+        Days from today on are never recorded, since their bars may still
+        change or grow.
+        """
+        directory = self._dir(symbol, interval)
+        with self._lock:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._mark_complete(directory, from_date[:10], to_date[:10])
+
+    def _mark_complete(self, directory: Path, first: str, last: str) -> None:
+        last = min(last, (date.today() - timedelta(days=1)).isoformat())
+        if first > last:
+            return
+        ranges = sorted(self._complete_ranges(directory) + [(first, last)])
+        merged = [ranges[0]]
+        for start, end in ranges[1:]:
+            previous_end = date.fromisoformat(merged[-1][1])
+            if date.fromisoformat(start) <= previous_end + timedelta(days=1):
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        path = directory / COMPLETE_FILE
+        temp = path.with_suffix(".tmp")
+        temp.write_text(json.dumps(merged))
+        os.replace(temp, path)
+
+    @staticmethod
+    def _complete_ranges(directory: Path) -> List[Tuple[str, str]]:
+        path = directory / COMPLETE_FILE
+        if not path.exists():
+            return []
+        return [(start, end) for start, end in json.loads(path.read_text())]
+
+    def complete_ranges(self, symbol: str, interval: str) -> List[Tuple[str, str]]:
+        """Return the ``(first day, last day)`` ranges recorded as complete, oldest first."""
+        with self._lock:
+            return self._complete_ranges(self._dir(symbol, interval))
+
+    def covers(self, symbol: str, interval: str, from_date: str, to_date: str) -> bool:
+        """Return True if every day from ``from_date`` to ``to_date`` is recorded as complete."""
+        first, last = from_date[:10], to_date[:10]
+        return any(start <= first and last <= end for start, end in self.complete_ranges(symbol, interval))
+
+    def _columns(self, symbol: str, interval: str) -> PriceColumns:
+        np = require_numpy()
+        directory = self._dir(symbol, interval)
+        key = (symbol, interval)
+        with self._lock:
+            length = self._length(directory) if directory.is_dir() else 0
+            cached = self._maps.get(key)
+            if cached is not None and cached[0] == length:
+                return cached[1]
+            if length:
+                arrays = {
+                    name: np.memmap(
+                        directory / f"{name}.bin",
+                        dtype=np.int64 if name == "date" else np.float64,
+                        mode="r",
+                        shape=(length,),
+                    )
+                    for name in PriceColumns.FIELDS
+                }
+                arrays["date"] = arrays["date"].view("datetime64[s]")
+            else:
+                arrays = {name: np.empty(0, dtype=np.float64) for name in PriceColumns.FIELDS}
+                arrays["date"] = np.empty(0, dtype="datetime64[s]")
+            columns = PriceColumns(**arrays)
+            self._maps[key] = (length, columns)
+            return columns
+
+    def read(
+        self,
+        symbol: str,
+        interval: str,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+    ) -> PriceColumns:
+        """
+        Return the stored bars between ``start`` and ``end`` (both inclusive).
+
+        The arrays are read-only views into the memory-mapped files; copy them
+        before modifying.
+
+        Args:
+            symbol: Ticker symbol
+            interval: Bar interval
+            start: Earliest timestamp, as a string, datetime or ``datetime64``
+            end: Latest timestamp; a date without a time covers the whole day
+        """
+        np = require_numpy()
+        columns = self._columns(symbol, interval)
+        lo, hi = 0, len(columns)
+        if start is not None:
+            lo = int(np.searchsorted(columns.date, np.datetime64(start, "s"), side="left"))
+        if end is not None:
+            end = np.datetime64(end)
+            if end.dtype == np.dtype("datetime64[D]"):
+                # A bare date covers every bar on that day.
+                hi = int(np.searchsorted(columns.date, (end + 1).astype("datetime64[s]"), side="left"))
+            else:
+                hi = int(np.searchsorted(columns.date, end.astype("datetime64[s]"), side="right"))
+        return PriceColumns(**{name: getattr(columns, name)[lo:hi] for name in PriceColumns.FIELDS})
+
+    def last_date(self, symbol: str, interval: str) -> Optional[Any]:
+        """Return the timestamp of the newest stored bar as ``datetime64[s]``, or None."""
+        columns = self._columns(symbol, interval)
+        return columns.date[-1] if len(columns) else None
+
+    def close(self) -> None:
+        """Drop the cached memory maps."""
+        with self._lock:
+            self._maps.clear()
@@ -0,0 +1,258 @@
+"""Response caching."""
+
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+# Default time-to-live in seconds per endpoint. Keys match either the full
+# endpoint path or its first segment (e.g. "historical-chart" covers every
+# interval). Endpoints not listed here are not cached unless ``default_ttl``
+# is set.
+DEFAULT_TTLS: Dict[str, float] = {
+    "quote": 5,
+    "batch-quote": 5,
+    "profile": 24 * 3600,
+    "stock/list": 24 * 3600,
+    "cryptocurrency-list": 24 * 3600,
+    "search-name": 24 * 3600,
+    "search-isin": 24 * 3600,
+    "cusip": 24 * 3600,
+    "cik_search": 24 * 3600,
+    "income-statement": 24 * 3600,
+    "balance-sheet-statement": 24 * 3600,
+    "cash-flow-statement": 24 * 3600,
+    "financial-growth": 24 * 3600,
+    "company-screener": 3600,
+    "news": 60,
+}
+
+
+# TTL for responses that never change, such as snapshots of past days.
+PERMANENT = math.inf
+
+
+def cache_key(endpoint: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """Build a cache key from an endpoint and its parameters, ignoring the API key."""
+    items = sorted((k, str(v)) for k, v in (params or {}).items() if k != "apikey" and v is not None)
+    key = endpoint.strip("/")
+    return f"{key}?{urlencode(items)}" if items else key
+
+
+class MemoryCache:
+    """
+    Bounded, thread-safe LRU store of response bodies with per-entry expiry.
+
+    Args:
+        max_entries: Number of responses kept before the least recently used
+            one is evicted (default: 1024)
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored body, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, body = entry
+            if expires <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return body
+
+    def set(self, key: str, body: bytes, expires: float) -> None:
+        """Store ``body`` until the ``expires`` UNIX timestamp."""
+        with self._lock:
+            self._entries[key] = (expires, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCache:
+    """
+    Persistent store of response bodies in a SQLite database.
+
+    Safe to share between threads and between processes using the same file.
+
+    Args:
+        path: Database file; parent directories are created as needed
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires REAL NOT NULL, body BLOB NOT NULL)"
+        )
+
+    def get(self, key: str) -> Optional[Tuple[float, bytes]]:
+        """Return ``(expires, body)`` for a live entry, or None."""
+        with self._lock:
+            row = self._db.execute("SELECT expires, body FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[0] <= time.time():
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            return row[0], bytes(row[1])
+
+    def set(self, key: str, body: bytes, expires: float) -> None:
+        """Store ``body`` until the ``expires`` UNIX timestamp."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, expires, body) VALUES (?, ?, ?)",
+                (key, expires, sqlite3.Binary(body)),
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired entries, returning how many were removed."""
+        with self._lock:
+            return self._db.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),)).rowcount
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+
+class ResponseCache:
+    """
+    Two-tier cache of raw API responses.
+
+    Lookups try a bounded in-memory LRU first and then, if configured, an
+    on-disk SQLite store; disk hits are promoted into memory. Entries live for
+    a time-to-live chosen per endpoint. Pass an instance to
+    :class:`fmp.FMPClient` or :class:`fmp.AsyncFMPClient` via ``cache=``.
+
+    Args:
+        max_entries: Size of the in-memory LRU (default: 1024)
+        path: SQLite file for the persistent tier; memory only if omitted
+        ttls: Time-to-live in seconds per endpoint, merged over DEFAULT_TTLS
+        default_ttl: TTL for endpoints without an entry; 0 disables caching them (default: 0)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        path: Optional[Union[str, Path]] = None,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 0,
+    ):
+        self.memory = MemoryCache(max_entries)
+        self.disk = DiskCache(path) if path is not None else None
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.default_ttl = default_ttl
+
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Return the time-to-live in seconds for ``endpoint``."""
+        endpoint = endpoint.strip("/")
+        if endpoint in self.ttls:
+            return self.ttls[endpoint]
+        return self.ttls.get(endpoint.split("/", 1)[0], self.default_ttl)
+
+    def get(
+        self, endpoint: str, params: Optional[Mapping[str, Any]] = None, ttl: Optional[float] = None
+    ) -> Optional[bytes]:
+        """Return a cached response body, or None on a miss; ``ttl`` overrides the endpoint's TTL."""
+        if (self.ttl_for(endpoint) if ttl is None else ttl) <= 0:
+            return None
+
+        key = cache_key(endpoint, params)
+        body = self.memory.get(key)
+        if body is not None:
+            with self._lock:
+                self._memory_hits += 1
+            return body
+
+        if self.disk is not None:
+            entry = self.disk.get(key)
+            if entry is not None:
+                expires, body = entry
+                self.memory.set(key, body, expires)
+                with self._lock:
+                    self._disk_hits += 1
+                return body
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def set(
+        self, endpoint: str, params: Optional[Mapping[str, Any]], body: bytes, ttl: Optional[float] = None
+    ) -> None:
+        """
+        Store a response body if ``endpoint`` is cacheable.
+
+        ``ttl`` overrides the endpoint's TTL; :data:`PERMANENT` keeps the
+        entry until it is evicted or cleared.
+        """
+        if ttl is None:
+            ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+        key = cache_key(endpoint, params)
+        expires = time.time() + ttl
+        self.memory.set(key, body, expires)
+        if self.disk is not None:
+            self.disk.set(key, body, expires)
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def close(self) -> None:
+        """Release the on-disk store."""
+        if self.disk is not None:
+            self.disk.close()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and eviction counters for tuning sizes and TTLs."""
+        with self._lock:
+            return {
+                "hits": self._memory_hits + self._disk_hits,
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "evictions": self.memory.evictions,
+                "size": len(self.memory),
+            }
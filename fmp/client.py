@@ -1,36 +1,315 @@
 """Main FMP API client."""
 
-from typing import Any, Dict, Optional
+import copy
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import httpx
 
+from fmp.barstore import BarStore
+from fmp.cache import ResponseCache, cache_key
+from fmp.columnar import PriceColumns
+from fmp.coalesce import RequestCoalescer
+from fmp.connection import ConnectionStats, build_timeout
+from fmp.decoding import loads
 from fmp.endpoints.company import CompanyEndpoints
 from fmp.endpoints.crypto import CryptoEndpoints
 from fmp.endpoints.financials import FinancialsEndpoints
 from fmp.endpoints.market import MarketEndpoints
 from fmp.exceptions import FMPAPIError, FMPAuthError
+from fmp.interning import intern_fields, intern_item
+from fmp.rate_limit import RateLimiter
+from fmp.resample import resample_stored
+from fmp.retry import RetryPolicy
+from fmp.streaming import JSONArrayParser
+from fmp.sync import PriceStore, SyncResult, sync_steps
 
+DEFAULT_BASE_URL = "https://financialmodelingprep.com/stable"
 
-class FMPClient(CompanyEndpoints, MarketEndpoints, CryptoEndpoints, FinancialsEndpoints):
+# Conservative limit that proxies and CDNs in front of the API accept.
+MAX_URL_LENGTH = 2000
+
+
+def _identity(item: Any) -> Any:
+    return item
+
+
+class BaseClient(CompanyEndpoints, MarketEndpoints, CryptoEndpoints, FinancialsEndpoints):
+    """
+    Transport-independent parts of the FMP clients.
+
+    Holds configuration and the request/response handling shared by
+    :class:`FMPClient` and :class:`fmp.async_client.AsyncFMPClient`. Subclasses
+    provide ``_get_raw``, ``_get``, ``_fetch``, ``_fetch_many`` and ``_stream``.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = 30.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        typed_dates: bool = False,
+        intern_strings: bool = False,
+        bar_store: Optional[BarStore] = None,
+        validate_every: int = 0,
+    ):
+        if validate_every < 0:
+            raise ValueError("validate_every must not be negative")
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.cache = cache
+        self.typed_dates = typed_dates
+        self.intern_strings = intern_strings
+        self.bar_store = bar_store
+        self.validate_every = validate_every
+        # Shared with with_options copies, so sampling spans all of them.
+        self._parsed_responses = itertools.count()
+
+    def with_options(self, **options: Any):
+        """
+        Return a copy of the client with some settings overridden.
+
+        The copy shares the underlying HTTP connection pool, so it is cheap to
+        create per call and must not be closed separately::
+
+            client.with_options(retry=RetryPolicy(max_attempts=10)).get_profile("AAPL")
+
+        Args:
+            **options: Attributes to override, e.g. ``retry``, ``rate_limiter``,
+                ``cache`` or ``typed_dates``
+
+        Returns:
+            A client of the same type with the overrides applied
+        """
+        clone = copy.copy(self)
+        for name, value in options.items():
+            if not hasattr(self, name) or name.startswith("_"):
+                raise TypeError(f"Unknown client option: {name!r}")
+            setattr(clone, name, value)
+        return clone
+
+    def _build_request(self, endpoint: str, params: Optional[Dict[str, Any]]):
+        """Return the URL and query parameters for an API call."""
+        params = dict(params) if params else {}
+        params["apikey"] = self.api_key
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        return url, params
+
+    def _batch_budget(self, endpoint: str) -> int:
+        """Return how many characters a comma-joined symbol list may use for ``endpoint``."""
+        url, params = self._build_request(endpoint, None)
+        overhead = len(url) + sum(len(k) + len(str(v)) + 2 for k, v in params.items()) + len("&symbols=")
+        return max(MAX_URL_LENGTH - overhead, 1)
+
+    @staticmethod
+    def _handle_response(response: httpx.Response) -> bytes:
+        """
+        Check a response for errors and return its raw body.
+
+        Raises:
+            FMPAuthError: If authentication fails
+            FMPAPIError: If API returns an error
+        """
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                raise FMPAuthError("Invalid API key", 401)
+            elif e.response.status_code == 403:
+                raise FMPAuthError("Access forbidden - check your API key permissions", 403)
+            else:
+                raise FMPAPIError(
+                    f"API request failed: {e.response.text}",
+                    e.response.status_code,
+                )
+
+        body = response.content
+
+        # Error payloads are small JSON objects; only decode bodies that may be one.
+        if body.lstrip()[:1] == b"{" and b'"Error Message"' in body:
+            data = loads(body)
+            if isinstance(data, dict) and "Error Message" in data:
+                raise FMPAPIError(data["Error Message"], response.status_code)
+
+        return body
+
+    @staticmethod
+    def _check_stream_tail(parser: JSONArrayParser, response: httpx.Response) -> List[Any]:
+        """Finish a streamed body, raising if the API sent an error object instead of an array."""
+        items = parser.close()
+        if not parser.is_array:
+            for data in items:
+                if isinstance(data, dict) and "Error Message" in data:
+                    raise FMPAPIError(data["Error Message"], response.status_code)
+        return items
+
+    @staticmethod
+    def _decode(body: bytes) -> Any:
+        """Decode a JSON response body with the fastest available backend."""
+        return loads(body)
+
+    def _sample_validation(self) -> bool:
+        """Return True for the one response in ``validate_every`` whose records are also validated."""
+        return self.validate_every > 0 and next(self._parsed_responses) % self.validate_every == 0
+
+    def _with_typed_dates(self, parse: Optional[Callable[[Any], Any]]) -> Optional[Callable[[Any], Any]]:
+        """Swap ``parse`` for its typed-date variant when ``typed_dates`` is on and it has one."""
+        if self.typed_dates:
+            with_typed_dates = getattr(parse, "with_typed_dates", None)
+            if with_typed_dates is not None:
+                return with_typed_dates()
+        return parse
+
+    def _parse(self, body: bytes, parse: Optional[Callable[[Any], Any]]) -> Any:
+        """
+        Apply a parser to a raw body.
+
+        Parsers with ``from_json`` validate the bytes directly. With
+        ``validate_every=N``, one in N bodies given to a parser with a
+        ``validator`` (the record parsers) is also validated into models,
+        raising ``ValidationError`` on schema drift. With ``typed_dates=True``, parsers with ``with_typed_dates`` are swapped for
+        their typed-date variant first. With ``intern_strings=True``, the
+        categorical fields of list results are interned.
+        """
+        parse = self._with_typed_dates(parse)
+        from_json = getattr(parse, "from_json", None)
+        validator = getattr(parse, "validator", None)
+        if validator is not None and self._sample_validation():
+            validator.from_json(body)
+        if parse is None:
+            result = self._decode(body)
+        elif from_json is not None:
+            result = from_json(body)
+        else:
+            result = parse(self._decode(body))
+        return intern_fields(result) if self.intern_strings else result
+
+    def _parse_rows(self, rows: Any, parse: Optional[Callable[[Any], Any]]) -> Any:
+        """Apply a parser to already decoded rows, e.g. ones built locally, like :meth:`_parse`."""
+        parse = self._with_typed_dates(parse)
+        if parse is None:
+            result = rows
+        else:
+            result = parse(rows)
+        return intern_fields(result) if self.intern_strings else result
+
+    def _stored_bars(
+        self,
+        symbol: str,
+        interval: str,
+        from_date: Optional[str],
+        to_date: Optional[str],
+        session_start: str,
+    ) -> Optional[PriceColumns]:
+        """Return the requested bars resampled from finer bars in ``bar_store``, or None to fetch them."""
+        if self.bar_store is None:
+            return None
+        return resample_stored(self.bar_store, symbol, interval, from_date, to_date, session_start)
+
+    def _element_parser(self, parse: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+        """Return the function ``_stream`` applies to each array element."""
+        if parse is None:
+            return intern_item if self.intern_strings else _identity
+        if self.intern_strings:
+            return lambda item: intern_item(parse(item))
+        return parse
+
+
+class FMPClient(BaseClient):
     """
     Main client for interacting with the Financial Modeling Prep API.
 
     Args:
         api_key: Your FMP API key
-        base_url: Base URL for the API (default: https://financialmodelingprep.com/api/v3)
+        base_url: Base URL for the API (default: https://financialmodelingprep.com/stable)
         timeout: Request timeout in seconds (default: 30.0)
+        max_workers: Threads used to run batched requests in parallel (default: 8)
+        rate_limiter: Optional RateLimiter that every request waits on; may be
+            shared with other clients to enforce one quota
+        retry: Optional RetryPolicy for transient failures; without one every
+            request is attempted once
+        cache: Optional ResponseCache consulted before every GET request
+        coalesce: Share one HTTP request between concurrent identical GET calls
+            (default: True)
+        typed_dates: Return date fields of models as ``datetime.date`` /
+            ``datetime.datetime`` instead of strings (default: False)
+        intern_strings: Intern exchange, sector, industry, country, currency
+            and site names in list results so repeated values share one
+            string object (default: False)
+        bar_store: Optional BarStore; intraday chart requests for a closed
+            date range it holds finer bars for are resampled locally instead
+            of fetched (requires NumPy)
+        validate_every: Also validate one in this many ``output="records"``
+            responses into full models, so schema drift raises a pydantic
+            ``ValidationError``; 0 never validates records (default: 0)
+        max_connections: Size of the connection pool (default: 100)
+        max_keepalive_connections: Idle connections kept open for reuse (default: 20)
+        keepalive_expiry: Seconds an idle connection stays open (default: 5.0)
+        http2: Negotiate HTTP/2 when the server supports it; requires the
+            ``h2`` package (default: False)
+        connect_timeout: Timeout for establishing a connection; defaults to ``timeout``
+        read_timeout: Timeout for reading a response; defaults to ``timeout``
+        transport: Pre-built httpx transport to send requests through; pool
+            settings are then the transport's own
     """
 
     def __init__(
         self,
         api_key: str,
-        base_url: str = "https://financialmodelingprep.com/stable",
+        base_url: str = DEFAULT_BASE_URL,
         timeout: float = 30.0,
+        max_workers: int = 8,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = True,
+        typed_dates: bool = False,
+        intern_strings: bool = False,
+        bar_store: Optional[BarStore] = None,
+        validate_every: int = 0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        transport: Optional[httpx.BaseTransport] = None,
     ):
-        self.api_key = api_key
-        self.base_url = base_url.rstrip("/")
-        self.timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        super().__init__(
+            api_key,
+            base_url=base_url,
+            timeout=timeout,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            cache=cache,
+            typed_dates=typed_dates,
+            intern_strings=intern_strings,
+            bar_store=bar_store,
+            validate_every=validate_every,
+        )
+        self.max_workers = max_workers
+        self.coalescer = RequestCoalescer() if coalesce else None
+        self.connection_stats = ConnectionStats()
+        self._client = httpx.Client(
+            timeout=build_timeout(timeout, connect_timeout, read_timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            transport=transport,
+        )
 
     def __enter__(self):
         return self
@@ -42,12 +321,101 @@ class FMPClient(CompanyEndpoints, MarketEndpoints, CryptoEndpoints, FinancialsEn
         """Close the HTTP client."""
         self._client.close()
 
-    def _request(
+    def sync_prices(
+        self,
+        symbols: Iterable[str],
+        store: PriceStore,
+        interval: str = "1day",
+        overlap: int = 5,
+        from_date: Optional[str] = None,
+    ) -> Dict[str, SyncResult]:
+        """
+        Bring locally stored price histories up to date.
+
+        Symbols never synced before get their history from ``from_date``.
+        Otherwise only the bars from the ``overlap`` newest stored bars onwards
+        are fetched; new bars are merged into the store, and if the re-fetched
+        bars differ from the stored ones (a split adjustment or correction) the
+        stored history is downloaded again from its oldest bar and replaces
+        the bars from that date on. Intraday ranges are fetched in windows the
+        API answers in full (see :data:`fmp.ranges.CHART_WINDOW_DAYS`).
+        Running a sync twice is harmless.
+
+        Args:
+            symbols: Ticker symbols
+            store: PriceStore holding the bars and per-symbol watermarks
+            interval: '1day' for daily history, or an intraday interval such
+                as '1min' or '1hour'
+            overlap: Stored bars to re-fetch and compare on each sync (default: 5)
+            from_date: Start of the history downloaded on a first sync
+                (YYYY-MM-DD); defaults to the full daily history, or the most
+                recent window for intraday intervals
+
+        Returns:
+            SyncResult per symbol
+        """
+        steps = sync_steps(store, symbols, interval, overlap, from_date)
+        try:
+            calls = next(steps)
+            while True:
+                calls = steps.send(self._fetch_many(calls))
+        except StopIteration as done:
+            return done.value
+
+    def _send(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-    ) -> Any:
+        stream: bool = False,
+    ) -> httpx.Response:
+        """
+        Send a request, applying rate limiting and retries.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            params: Query parameters
+            stream: Return before the body is read
+
+        Returns:
+            The final response, which may still be an error response
+
+        Raises:
+            FMPAPIError: If the request could not be sent
+        """
+        url, params = self._build_request(endpoint, params)
+        attempt = 0
+
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            try:
+                self.connection_stats.record_request()
+                request = self._client.build_request(
+                    method, url, params=params, extensions={"trace": self.connection_stats.trace}
+                )
+                response = self._client.send(request, stream=stream)
+            except httpx.RequestError as e:
+                delay = self.retry.next_delay(attempt, error=e) if self.retry is not None else None
+                if delay is None:
+                    raise FMPAPIError(f"Request failed: {str(e)}")
+            else:
+                delay = self.retry.next_delay(attempt, response=response) if self.retry is not None else None
+                if delay is None:
+                    return response
+                response.close()
+
+            time.sleep(delay)
+
+    def _request_raw(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
         """
         Make a request to the FMP API.
 
@@ -57,41 +425,109 @@ class FMPClient(CompanyEndpoints, MarketEndpoints, CryptoEndpoints, FinancialsEn
             params: Query parameters
 
         Returns:
-            JSON response data
+            Raw response body
 
         Raises:
             FMPAuthError: If authentication fails
             FMPAPIError: If API returns an error
         """
-        if params is None:
-            params = {}
-
-        params["apikey"] = self.api_key
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        return self._handle_response(self._send(method, endpoint, params))
 
-        try:
-            response = self._client.request(method, url, params=params)
-            response.raise_for_status()
-            data = response.json()
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make a request to the FMP API and return the decoded JSON data."""
+        return self._decode(self._request_raw(method, endpoint, params))
 
-            if isinstance(data, dict) and "Error Message" in data:
-                raise FMPAPIError(data["Error Message"], response.status_code)
+    def _get_raw(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        """Make a GET request, served from the cache when possible, and return the raw body."""
+        if self.cache is not None:
+            body = self.cache.get(endpoint, params)
+            if body is not None:
+                return body
 
-            return data
+        def fetch() -> bytes:
+            body = self._request_raw("GET", endpoint, params)
+            if self.cache is not None:
+                self.cache.set(endpoint, params, body)
+            return body
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise FMPAuthError("Invalid API key", 401)
-            elif e.response.status_code == 403:
-                raise FMPAuthError("Access forbidden - check your API key permissions", 403)
-            else:
-                raise FMPAPIError(
-                    f"API request failed: {e.response.text}",
-                    e.response.status_code,
-                )
-        except httpx.RequestError as e:
-            raise FMPAPIError(f"Request failed: {str(e)}")
+        if self.coalescer is None:
+            return fetch()
+        return self.coalescer.do(cache_key(endpoint, params), fetch)
 
     def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """Make a GET request to the API."""
-        return self._request("GET", endpoint, params)
+        return self._decode(self._get_raw(endpoint, params))
+
+    def _fetch(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        parse: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """Make a GET request and run the response through ``parse``."""
+        return self._parse(self._get_raw(endpoint, params), parse)
+
+    def _fetch_many(
+        self,
+        calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        parse: Optional[Callable[[Any], Any]] = None,
+        combine: Optional[Callable[[List[Any]], Any]] = None,
+    ) -> Any:
+        """
+        Run several ``_fetch`` calls in parallel threads.
+
+        Args:
+            calls: ``(endpoint, params)`` pairs
+            parse: Parser applied to each response
+            combine: Function that merges the per-call results, in call order
+
+        Returns:
+            The combined result, or the list of per-call results
+        """
+        if len(calls) <= 1:
+            results = [self._fetch(endpoint, params, parse) for endpoint, params in calls]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(calls))) as pool:
+                futures = [pool.submit(self._fetch, endpoint, params, parse) for endpoint, params in calls]
+                results = [future.result() for future in futures]
+        return combine(results) if combine is not None else results
+
+    def _stream(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        parse: Optional[Callable[[Any], Any]] = None,
+    ) -> Iterator[Any]:
+        """
+        Make a GET request and yield the elements of its JSON array as they arrive.
+
+        The body is parsed incrementally, so memory use does not grow with the
+        response size. Streaming bypasses the cache and request coalescing.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            parse: Function applied to each element before it is yielded
+        """
+        response = self._send("GET", endpoint, params, stream=True)
+        try:
+            if response.is_error:
+                response.read()
+                self._handle_response(response)
+
+            parse = self._element_parser(parse)
+            parser = JSONArrayParser()
+            for chunk in response.iter_bytes():
+                for item in parser.feed(chunk):
+                    yield parse(item)
+            for item in self._check_stream_tail(parser, response):
+                yield parse(item)
+        except httpx.RequestError as e:
+            raise FMPAPIError(f"Request failed: {str(e)}")
+        finally:
+            response.close()
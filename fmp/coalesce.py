@@ -0,0 +1,100 @@
+"""Single-flight coalescing of identical concurrent requests."""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class _Call:
+    """A request in flight and, once finished, its outcome."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """
+    Share one in-flight call between threads asking for the same key.
+
+    The first caller for a key runs the function; callers arriving while it
+    runs wait and receive the same result or exception. Nothing is remembered
+    once the call finishes, so this never serves stale data.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` unless a call for ``key`` is already in flight, then return its result."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Number of calls that piggybacked on another in-flight call."""
+        with self._lock:
+            return {"coalesced": self._coalesced, "in_flight": len(self._calls)}
+
+
+class AsyncRequestCoalescer:
+    """
+    Asyncio counterpart of :class:`RequestCoalescer` for coroutines on one event loop.
+
+    The shared call runs in its own task that every caller, the first one
+    included, awaits through :func:`asyncio.shield`. Cancelling one caller
+    therefore never cancels the call for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, "asyncio.Task[Any]"] = {}
+        self._coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``fn()`` unless a call for ``key`` is already in flight, then return its result."""
+        task = self._calls.get(key)
+        if task is not None:
+            self._coalesced += 1
+        else:
+            task = self._calls[key] = asyncio.ensure_future(self._run(key, fn))
+            # Mark the exception retrieved in case every caller was cancelled.
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return await asyncio.shield(task)
+
+    async def _run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            return await fn()
+        finally:
+            del self._calls[key]
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Number of calls that piggybacked on another in-flight call."""
+        return {"coalesced": self._coalesced, "in_flight": len(self._calls)}
@@ -0,0 +1,189 @@
+"""Columnar (struct-of-arrays) result types backed by NumPy.
+
+NumPy is an optional dependency; install it with
+``pip install "fmp-python[numpy]"``.
+"""
+
+from typing import Any, Dict, List, Mapping
+
+
+def require_numpy():
+    """Import NumPy, raising a helpful error if it is missing."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError('Columnar output requires NumPy; install it with pip install "fmp-python[numpy]"') from e
+    return numpy
+
+
+class PriceColumns:
+    """
+    OHLCV price series as contiguous NumPy arrays, oldest bar first.
+
+    Attributes:
+        date: ``datetime64[s]`` timestamps
+        open: Opening prices (float64)
+        high: High prices (float64)
+        low: Low prices (float64)
+        close: Closing prices (float64)
+        volume: Volumes (float64, so fractional crypto volumes fit)
+        vwap: Volume-weighted average prices (float64, NaN where not provided)
+        gaps: ``(from_date, to_date)`` windows of a split request that came
+            back empty (see :mod:`fmp.ranges`)
+    """
+
+    FIELDS = ("date", "open", "high", "low", "close", "volume", "vwap")
+
+    __slots__ = FIELDS + ("gaps",)
+
+    def __init__(self, date, open, high, low, close, volume, vwap, gaps=None):
+        self.date = date
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.vwap = vwap
+        self.gaps = gaps or []
+
+    @classmethod
+    def from_records(cls, rows: List[Mapping[str, Any]]) -> "PriceColumns":
+        """
+        Build columns straight from decoded API rows without creating models.
+
+        Rows may arrive in either order; the result is sorted by date.
+        """
+        np = require_numpy()
+        date = np.array([row["date"] for row in rows], dtype="datetime64[s]")
+        columns = {
+            name: np.array([row.get(name) for row in rows], dtype=np.float64)
+            for name in cls.FIELDS[1:]
+        }
+
+        order = np.argsort(date, kind="stable")
+        if not np.array_equal(order, np.arange(len(order))):
+            date = date[order]
+            columns = {name: values[order] for name, values in columns.items()}
+        return cls(date=date, **columns)
+
+    @classmethod
+    def merge(cls, parts: List["PriceColumns"]) -> "PriceColumns":
+        """Concatenate several column sets, sorted by date with duplicate dates dropped."""
+        np = require_numpy()
+        date = np.concatenate([part.date for part in parts])
+        columns = {name: np.concatenate([getattr(part, name) for part in parts]) for name in cls.FIELDS[1:]}
+
+        order = np.argsort(date, kind="stable")
+        date = date[order]
+        keep = np.ones(len(date), dtype=bool)
+        keep[1:] = date[1:] != date[:-1]
+        return cls(date=date[keep], **{name: values[order][keep] for name, values in columns.items()})
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """Return the bars as API-style row dicts, newest first, with missing values as None."""
+        dates = self.date.astype("datetime64[s]").astype(str)
+        columns = [(name, getattr(self, name).tolist()) for name in self.FIELDS[1:]]
+        rows = []
+        for i in range(len(dates) - 1, -1, -1):
+            row: Dict[str, Any] = {"date": dates[i].replace("T", " ")}
+            for name, values in columns:
+                value = values[i]
+                row[name] = None if value != value else value
+            rows.append(row)
+        return rows
+
+    def to_pandas(self):
+        """
+        Return the bars as a DataFrame, oldest first, with a ``datetime64[s]``
+        ``date`` column and float64 price and volume columns (requires pandas).
+        """
+        from fmp.tables import require_pandas
+
+        pd = require_pandas()
+        np = require_numpy()
+        data = {"date": np.asarray(self.date).astype("datetime64[s]")}
+        data.update({name: np.asarray(getattr(self, name), dtype=np.float64) for name in self.FIELDS[1:]})
+        return pd.DataFrame(data, columns=list(self.FIELDS))
+
+    def to_arrow(self):
+        """
+        Return the bars as a ``pyarrow.Table``, oldest first, with a
+        ``timestamp[s]`` ``date`` column and float64 price and volume columns
+        in which missing values are null (requires pyarrow).
+        """
+        from fmp.tables import require_pyarrow
+
+        pa = require_pyarrow()
+        np = require_numpy()
+        columns = [pa.array(np.asarray(self.date).astype("datetime64[s]"), type=pa.timestamp("s"))]
+        columns += [pa.array(np.asarray(getattr(self, name), dtype=np.float64), from_pandas=True) for name in self.FIELDS[1:]]
+        return pa.Table.from_arrays(columns, names=list(self.FIELDS))
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "PriceColumns(0 bars)"
+        return f"PriceColumns({len(self)} bars, {self.date[0]} .. {self.date[-1]})"
+
+
+class PriceMatrix:
+    """
+    Price series of many symbols aligned on one time axis, as ``(symbols, time)`` arrays.
+
+    Built from per-symbol :class:`PriceColumns` for the vectorized indicators
+    in :mod:`fmp.indicators`. Bars a symbol has no data for are NaN.
+
+    Attributes:
+        symbols: Symbols, one per row
+        date: ``datetime64[s]`` timestamps shared by all rows, oldest first
+        open, high, low, close, volume, vwap: float64 arrays of shape
+            ``(len(symbols), len(date))``
+    """
+
+    FIELDS = PriceColumns.FIELDS
+
+    __slots__ = ("symbols",) + FIELDS
+
+    def __init__(self, symbols, date, open, high, low, close, volume, vwap):
+        self.symbols = symbols
+        self.date = date
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.vwap = vwap
+
+    @classmethod
+    def from_columns(cls, series: Mapping[str, PriceColumns]) -> "PriceMatrix":
+        """Align per-symbol columns on the union of their dates."""
+        np = require_numpy()
+        symbols = list(series)
+        parts = [series[symbol] for symbol in symbols]
+        if parts:
+            date = np.unique(np.concatenate([part.date.astype("datetime64[s]") for part in parts]))
+        else:
+            date = np.empty(0, dtype="datetime64[s]")
+        columns = {name: np.full((len(symbols), len(date)), np.nan) for name in cls.FIELDS[1:]}
+        for row, part in enumerate(parts):
+            positions = np.searchsorted(date, part.date.astype("datetime64[s]"))
+            for name, values in columns.items():
+                values[row, positions] = getattr(part, name)
+        return cls(symbols=symbols, date=date, **columns)
+
+    def row(self, symbol: str) -> PriceColumns:
+        """Return one symbol's bars as PriceColumns, dropping the dates it has no close for."""
+        np = require_numpy()
+        index = self.symbols.index(symbol)
+        present = ~np.isnan(self.close[index])
+        return PriceColumns(
+            date=self.date[present], **{name: getattr(self, name)[index][present] for name in self.FIELDS[1:]}
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __repr__(self) -> str:
+        return f"PriceMatrix({len(self.symbols)} symbols x {len(self.date)} bars)"
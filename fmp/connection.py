@@ -0,0 +1,69 @@
+"""HTTP connection pool configuration and statistics."""
+
+import threading
+from typing import Any, Dict, Optional
+
+import httpx
+
+
+def build_timeout(
+    timeout: float,
+    connect_timeout: Optional[float] = None,
+    read_timeout: Optional[float] = None,
+) -> httpx.Timeout:
+    """Build an httpx timeout, overriding the connect and read phases when given."""
+    overrides = {}
+    if connect_timeout is not None:
+        overrides["connect"] = connect_timeout
+    if read_timeout is not None:
+        overrides["read"] = read_timeout
+    return httpx.Timeout(timeout, **overrides)
+
+
+class ConnectionStats:
+    """
+    Counts requests against newly opened connections and TLS handshakes.
+
+    Fed by httpcore trace events, so the numbers reflect the real connection
+    pool. A reuse ratio close to 1 means keep-alive is amortizing handshakes;
+    custom transports that do not emit trace events report no connections.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._connections = 0
+        self._tls_handshakes = 0
+
+    def _record(self, event_name: str) -> None:
+        with self._lock:
+            if event_name == "connection.connect_tcp.complete":
+                self._connections += 1
+            elif event_name == "connection.start_tls.complete":
+                self._tls_handshakes += 1
+
+    def record_request(self) -> None:
+        """Count a request sent through the pool."""
+        with self._lock:
+            self._requests += 1
+
+    def trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace hook for synchronous transports."""
+        self._record(event_name)
+
+    async def atrace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace hook for asynchronous transports."""
+        self._record(event_name)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Requests sent, connections opened, TLS handshakes and the share of requests on reused connections."""
+        with self._lock:
+            reused = max(self._requests - self._connections, 0)
+            return {
+                "requests": self._requests,
+                "connections_opened": self._connections,
+                "tls_handshakes": self._tls_handshakes,
+                "reused": reused,
+                "reuse_ratio": reused / self._requests if self._requests else 0.0,
+            }
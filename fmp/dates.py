@@ -0,0 +1,75 @@
+"""Typed date and timestamp fields.
+
+Models keep dates as the strings the API sends. With ``typed_dates=True`` on a
+client, responses are validated into variants of the models whose date fields
+are ``datetime.date`` / ``datetime.datetime`` instead, parsed by pydantic-core
+in the same pass that validates the rest of the response.
+"""
+
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional, Type, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, BeforeValidator, Field, create_model
+
+from fmp.models.crypto import CryptoHistoricalPrice
+from fmp.models.market import HistoricalPrice
+
+try:
+    from typing import Annotated
+except ImportError:  # Python 3.8
+    from typing_extensions import Annotated
+
+M = TypeVar("M", bound=BaseModel)
+
+# Field names holding calendar dates and timestamps across the models.
+DATE_FIELDS = frozenset(
+    {"date", "filling_date", "ipo_date", "ico_date", "record_date", "payment_date", "declaration_date"}
+)
+DATETIME_FIELDS = frozenset({"accepted_date", "published_date"})
+
+# Price bar models are shared between daily and intraday series, so their
+# ``date`` can carry a time of day.
+TIMESTAMPED_MODELS = frozenset({HistoricalPrice, CryptoHistoricalPrice})
+
+
+def date_kind(model: Type[BaseModel], name: str) -> Optional[str]:
+    """Return ``'date'``, ``'datetime'`` or None for field ``name`` of ``model``."""
+    if name in DATETIME_FIELDS or (name == "date" and model in TIMESTAMPED_MODELS):
+        return "datetime"
+    if name in DATE_FIELDS:
+        return "date"
+    return None
+
+
+def _blank_to_none(value: Any) -> Any:
+    # The API sends "" rather than null for some missing dates.
+    return None if value == "" else value
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        return next(arg for arg in get_args(annotation) if arg is not type(None))
+    return annotation
+
+
+@lru_cache(maxsize=None)
+def typed_model(model: Type[M]) -> Type[M]:
+    """
+    Return a subclass of ``model`` whose date fields are typed.
+
+    Instances still pass ``isinstance(obj, model)`` and keep every other
+    field unchanged.
+    """
+    fields: Dict[str, Any] = {}
+    for name, info in model.model_fields.items():
+        kind = date_kind(model, name)
+        if kind is None or _unwrap_optional(info.annotation) is not str:
+            continue
+        annotation: Any = date if kind == "date" else datetime
+        if not info.is_required():
+            annotation = Annotated[Optional[annotation], BeforeValidator(_blank_to_none)]
+        fields[name] = (annotation, Field(info.default, alias=info.alias))
+    typed = create_model(model.__name__, __base__=model, __module__=model.__module__, **fields)
+    typed.__qualname__ = f"typed_model({model.__qualname__})"
+    return typed
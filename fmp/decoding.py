@@ -0,0 +1,80 @@
+"""JSON decoding backends.
+
+The fastest installed decoder is used for response bodies: ``orjson``, then
+``msgspec``, then the standard library. Install one with
+``pip install "fmp-python[fast]"``. Bodies a fast decoder rejects (for
+example ones containing ``NaN``) are retried with the standard library, so
+results never depend on which backend is active.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+Loads = Callable[[bytes], Any]
+
+
+def _stdlib_loads(body: bytes) -> Any:
+    return json.loads(body)
+
+
+def _orjson_backend() -> Optional[Loads]:
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson.loads
+
+
+def _msgspec_backend() -> Optional[Loads]:
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    return msgspec.json.Decoder().decode
+
+
+_BACKENDS: Dict[str, Callable[[], Optional[Loads]]] = {
+    "orjson": _orjson_backend,
+    "msgspec": _msgspec_backend,
+    "json": lambda: _stdlib_loads,
+}
+
+
+def available_backends() -> List[str]:
+    """Return the names of the installed decoders, fastest first."""
+    return [name for name, load in _BACKENDS.items() if load() is not None]
+
+
+def get_loads(backend: Optional[str] = None) -> Loads:
+    """
+    Return a ``bytes -> object`` JSON decoder.
+
+    Args:
+        backend: 'orjson', 'msgspec' or 'json'; the fastest installed one if omitted
+
+    Raises:
+        ValueError: If the backend is unknown
+        ImportError: If the backend is not installed
+    """
+    if backend is None:
+        backend = available_backends()[0]
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown JSON backend {backend!r}; expected one of {sorted(_BACKENDS)}")
+
+    fast = _BACKENDS[backend]()
+    if fast is None:
+        raise ImportError(f"JSON backend {backend!r} is not installed")
+    if fast is _stdlib_loads:
+        return fast
+
+    def loads(body: bytes) -> Any:
+        try:
+            return fast(body)
+        except ValueError:
+            return json.loads(body)
+
+    return loads
+
+
+BACKEND = available_backends()[0]
+loads = get_loads(BACKEND)
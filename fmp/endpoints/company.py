@@ -1,18 +1,20 @@
 """Company-related API endpoints."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 from fmp.models.company import (
     CompanyProfile,
     SearchResult,
     StockScreenerResult,
     StockNews,
 )
+from fmp.parsing import model_list, select_output
+from fmp.tables import table_outputs
 
 
 class CompanyEndpoints:
     """Company profile, search, and screening endpoints."""
 
-    def get_profile(self, symbol: str) -> List[CompanyProfile]:
+    def get_profile(self, symbol: str, output: str = "models") -> Union[List[CompanyProfile], Any]:
         """
         Get detailed company profile information.
 
@@ -21,12 +23,15 @@ class CompanyEndpoints:
 
         Args:
             symbol: Stock ticker symbol (e.g., 'AAPL')
+            output: 'models' for CompanyProfile objects, or 'pandas' / 'arrow'
+                for a DataFrame / pyarrow Table with categorical labels
+                (requires pandas / pyarrow)
 
         Returns:
-            List of CompanyProfile objects
+            List of CompanyProfile objects, or a DataFrame / Table
         """
-        data = self._get("profile", params={"symbol": symbol})
-        return [CompanyProfile(**item) for item in data]
+        parse = select_output(output, models=model_list(CompanyProfile), **table_outputs(CompanyProfile))
+        return self._fetch("profile", params={"symbol": symbol}, parse=parse)
 
     def search_symbol(self, query: str) -> List[SearchResult]:
         """
@@ -38,8 +43,7 @@ class CompanyEndpoints:
         Returns:
             List of SearchResult objects
         """
-        data = self._get("search-name", params={"query": query})
-        return [SearchResult(**item) for item in data]
+        return self._fetch("search-name", params={"query": query}, parse=model_list(SearchResult))
 
     def search_by_name(self, query: str) -> List[SearchResult]:
         """
@@ -51,8 +55,7 @@ class CompanyEndpoints:
         Returns:
             List of SearchResult objects
         """
-        data = self._get("search-name", params={"query": query})
-        return [SearchResult(**item) for item in data]
+        return self._fetch("search-name", params={"query": query}, parse=model_list(SearchResult))
 
     def search_by_cik(self, cik: str) -> List[Dict[str, Any]]:
         """
@@ -99,6 +102,19 @@ class CompanyEndpoints:
         """
         return self._get("stock/list")
 
+    def iter_stock_list(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the list of all available financial symbols.
+
+        The response is parsed incrementally and records are yielded one at a
+        time, so memory use stays flat regardless of the universe size. On
+        :class:`fmp.AsyncFMPClient` this returns an async iterator.
+
+        Returns:
+            Iterator of stock records with symbol, name, price, exchange, and country information
+        """
+        return self._stream("stock/list")
+
     def screen_stocks(
         self,
         market_cap_more_than: Optional[int] = None,
@@ -119,7 +135,8 @@ class CompanyEndpoints:
         is_fund: Optional[bool] = None,
         is_actively_trading: Optional[bool] = None,
         limit: Optional[int] = None,
-    ) -> List[StockScreenerResult]:
+        output: str = "models",
+    ) -> Union[List[StockScreenerResult], Any]:
         """
         Screen stocks based on various financial and market criteria.
 
@@ -142,10 +159,15 @@ class CompanyEndpoints:
             is_fund: Filter for mutual funds
             is_actively_trading: Filter for actively trading stocks
             limit: Maximum number of results
+            output: 'models' for StockScreenerResult objects, or 'pandas' /
+                'arrow' for a DataFrame / pyarrow Table with categorical
+                sector, industry, exchange and country columns
+                (requires pandas / pyarrow)
 
         Returns:
-            List of StockScreenerResult objects
+            List of StockScreenerResult objects, or a DataFrame / Table
         """
+        parse = select_output(output, models=model_list(StockScreenerResult), **table_outputs(StockScreenerResult))
         params = {}
 
         if market_cap_more_than is not None:
@@ -185,15 +207,15 @@ class CompanyEndpoints:
         if limit is not None:
             params["limit"] = limit
 
-        data = self._get("company-screener", params=params)
-        return [StockScreenerResult(**item) for item in data]
+        return self._fetch("company-screener", params=params, parse=parse)
 
     def search_stock_news(
         self,
         symbols: str,
         page: Optional[int] = None,
         limit: Optional[int] = None,
-    ) -> List[StockNews]:
+        output: str = "models",
+    ) -> Union[List[StockNews], Any]:
         """
         Search for news articles related to specific stock symbols.
 
@@ -204,10 +226,14 @@ class CompanyEndpoints:
             symbols: Stock ticker symbol(s) to search for news (e.g., 'AAPL')
             page: Page number for pagination (default: 0)
             limit: Number of results per page (default: 20)
+            output: 'models' for StockNews objects, or 'pandas' / 'arrow' for a
+                DataFrame / pyarrow Table with a categorical site column
+                (requires pandas / pyarrow)
 
         Returns:
-            List of StockNews objects containing news articles
+            List of StockNews objects containing news articles, or a DataFrame / Table
         """
+        parse = select_output(output, models=model_list(StockNews), **table_outputs(StockNews))
         params = {"symbols": symbols}
 
         if page is not None:
@@ -215,53 +241,60 @@ class CompanyEndpoints:
         if limit is not None:
             params["limit"] = limit
 
-        data = self._get("news/stock", params=params)
-        return [StockNews(**item) for item in data]
+        return self._fetch("news/stock", params=params, parse=parse)
 
     def get_general_news_latest(
         self,
         page: Optional[int] = None,
         limit: Optional[int] = None,
-    ) -> List[StockNews]:
+        output: str = "models",
+    ) -> Union[List[StockNews], Any]:
         """
         Get latest general market news.
 
         Args:
             page: Page number for pagination (default: 0)
             limit: Number of results per page (default: 20, max: 250)
+            output: 'models' for StockNews objects, or 'pandas' / 'arrow' for a
+                DataFrame / pyarrow Table with a categorical site column
+                (requires pandas / pyarrow)
 
         Returns:
-            List of StockNews objects containing general news articles
+            List of StockNews objects containing general news articles, or a DataFrame / Table
         """
+        parse = select_output(output, models=model_list(StockNews), **table_outputs(StockNews))
         params = {}
         if page is not None:
             params["page"] = page
         if limit is not None:
             params["limit"] = limit
 
-        data = self._get("news/general-latest", params=params)
-        return [StockNews(**item) for item in data]
+        return self._fetch("news/general-latest", params=params, parse=parse)
 
     def get_stock_news_latest(
         self,
         page: Optional[int] = None,
         limit: Optional[int] = None,
-    ) -> List[StockNews]:
+        output: str = "models",
+    ) -> Union[List[StockNews], Any]:
         """
         Get latest stock market news.
 
         Args:
             page: Page number for pagination (default: 0)
             limit: Number of results per page (default: 20, max: 250)
+            output: 'models' for StockNews objects, or 'pandas' / 'arrow' for a
+                DataFrame / pyarrow Table with a categorical site column
+                (requires pandas / pyarrow)
 
         Returns:
-            List of StockNews objects containing stock news articles
+            List of StockNews objects containing stock news articles, or a DataFrame / Table
         """
+        parse = select_output(output, models=model_list(StockNews), **table_outputs(StockNews))
         params = {}
         if page is not None:
             params["page"] = page
         if limit is not None:
             params["limit"] = limit
 
-        data = self._get("news/stock-latest", params=params)
-        return [StockNews(**item) for item in data]
+        return self._fetch("news/stock-latest", params=params, parse=parse)
@@ -1,24 +1,62 @@
 """Cryptocurrency API endpoints."""
 
-from typing import List, Optional
+from functools import partial
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Union
+from fmp.dates import typed_model
 from fmp.models.crypto import CryptoQuote, CryptoInfo, CryptoHistoricalPrice, CryptoNews
+from fmp.models.market import QuoteBatch
+from fmp.parsing import batch_calls, model_list, select_output
+from fmp.ranges import date_windows, merge_windows
+from fmp.records import CryptoHistoricalPriceRecord, CryptoQuoteRecord, record_list
+from fmp.resample import CRYPTO_SESSION_START
 
 
 class CryptoEndpoints:
     """Cryptocurrency quotes, historical data, and news endpoints."""
 
-    def get_crypto_quote(self, symbol: str) -> List[CryptoQuote]:
+    def get_crypto_quote(
+        self, symbol: str, output: str = "models"
+    ) -> Union[List[CryptoQuote], List[CryptoQuoteRecord]]:
         """
         Get real-time quote for a cryptocurrency.
 
         Args:
             symbol: Cryptocurrency symbol (e.g., 'BTCUSD', 'ETHUSD')
+            output: 'models' for CryptoQuote objects or 'records' for compact,
+                unvalidated CryptoQuoteRecord objects
 
         Returns:
-            List of CryptoQuote objects
+            List of CryptoQuote (or CryptoQuoteRecord) objects
         """
-        data = self._get("quote", params={"symbol": symbol})
-        return [CryptoQuote(**item) for item in data]
+        parse = select_output(output, models=model_list(CryptoQuote), records=record_list(CryptoQuoteRecord))
+        return self._fetch("quote", params={"symbol": symbol}, parse=parse)
+
+    def get_crypto_quotes(self, symbols: Iterable[str], output: str = "models") -> QuoteBatch:
+        """
+        Get real-time quotes for many cryptocurrencies.
+
+        Symbols are packed into comma-separated batch requests that stay under a
+        safe URL length, and the batches are fetched in parallel.
+
+        Args:
+            symbols: Cryptocurrency symbols (e.g., ['BTCUSD', 'ETHUSD'])
+            output: 'models' for CryptoQuote objects or 'records' for compact,
+                unvalidated CryptoQuoteRecord objects
+
+        Returns:
+            QuoteBatch mapping each symbol to its CryptoQuote (or
+            CryptoQuoteRecord), with symbols the API returned nothing for
+            listed in ``missing``
+        """
+        parse = select_output(output, models=model_list(CryptoQuote), records=record_list(CryptoQuoteRecord))
+        requested = list(dict.fromkeys(symbols))
+        calls = batch_calls("batch-quote", requested, self._batch_budget("batch-quote"))
+        return self._fetch_many(
+            calls,
+            parse=parse,
+            combine=lambda results: QuoteBatch(chain.from_iterable(results), requested),
+        )
 
     def get_crypto_list(self) -> List[CryptoInfo]:
         """
@@ -27,15 +65,29 @@ class CryptoEndpoints:
         Returns:
             List of CryptoInfo objects
         """
-        data = self._get("cryptocurrency-list")
-        return [CryptoInfo(**item) for item in data]
+        return self._fetch("cryptocurrency-list", parse=model_list(CryptoInfo))
+
+    def iter_crypto_list(self) -> Iterator[CryptoInfo]:
+        """
+        Stream the list of all available cryptocurrencies.
+
+        The response is parsed incrementally and each CryptoInfo is built as
+        its record arrives, so memory use stays flat regardless of the list
+        size. On :class:`fmp.AsyncFMPClient` this returns an async iterator.
+
+        Returns:
+            Iterator of CryptoInfo objects
+        """
+        model = typed_model(CryptoInfo) if self.typed_dates else CryptoInfo
+        return self._stream("cryptocurrency-list", parse=model.model_validate)
 
     def get_crypto_historical_price(
         self,
         symbol: str,
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> List[CryptoHistoricalPrice]:
+        output: str = "models",
+    ) -> Union[List[CryptoHistoricalPrice], List[CryptoHistoricalPriceRecord]]:
         """
         Get historical end-of-day prices for a cryptocurrency.
 
@@ -43,18 +95,22 @@ class CryptoEndpoints:
             symbol: Cryptocurrency symbol (e.g., 'BTCUSD')
             from_date: Start date (YYYY-MM-DD format)
             to_date: End date (YYYY-MM-DD format)
+            output: 'models' for CryptoHistoricalPrice objects or 'records' for
+                compact, unvalidated CryptoHistoricalPriceRecord objects
 
         Returns:
-            List of CryptoHistoricalPrice objects
+            List of CryptoHistoricalPrice (or CryptoHistoricalPriceRecord) objects
         """
+        parse = select_output(
+            output, models=model_list(CryptoHistoricalPrice), records=record_list(CryptoHistoricalPriceRecord)
+        )
         params = {"symbol": symbol}
         if from_date:
             params["from"] = from_date
         if to_date:
             params["to"] = to_date
 
-        data = self._get("historical-price-eod/light", params=params)
-        return [CryptoHistoricalPrice(**item) for item in data]
+        return self._fetch("historical-price-eod/light", params=params, parse=parse)
 
     def get_crypto_intraday(
         self,
@@ -62,7 +118,8 @@ class CryptoEndpoints:
         interval: str = "1min",
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> List[CryptoHistoricalPrice]:
+        output: str = "models",
+    ) -> Union[List[CryptoHistoricalPrice], List[CryptoHistoricalPriceRecord]]:
         """
         Get intraday price data for a cryptocurrency.
 
@@ -71,24 +128,49 @@ class CryptoEndpoints:
             interval: Time interval - '1min', '5min', '15min', '30min', '1hour'
             from_date: Start date (YYYY-MM-DD format)
             to_date: End date (YYYY-MM-DD format)
+            output: 'models' for CryptoHistoricalPrice objects or 'records' for
+                compact, unvalidated CryptoHistoricalPriceRecord objects
+
+        Long ranges are split into concurrently fetched windows and merged as
+        in :meth:`get_historical_chart`, with empty windows listed in the
+        result's ``gaps``. Ranges the client's ``bar_store`` holds finer bars
+        for are resampled locally, with buckets aligned to midnight.
 
         Returns:
-            List of CryptoHistoricalPrice objects with intraday data
+            List of CryptoHistoricalPrice (or CryptoHistoricalPriceRecord)
+            objects with intraday data, newest first
         """
+        model = typed_model(CryptoHistoricalPrice) if self.typed_dates else CryptoHistoricalPrice
+        row_type = select_output(output, models=model, records=CryptoHistoricalPriceRecord)
+
+        def parse(data):
+            result = []
+            for item in data:
+                result.append(
+                    row_type(
+                        symbol=symbol, date=item["date"], price=item["close"], volume=item.get("volume")
+                    )
+                )
+            return result
+
+        local = self._stored_bars(symbol, interval, from_date, to_date, CRYPTO_SESSION_START)
+        if local is not None:
+            result = self._parse_rows(local.to_rows(), parse)
+            return self._fetch_many([], combine=lambda _: result)
+
+        endpoint = f"historical-chart/{interval}"
+        windows = date_windows(interval, from_date, to_date)
+        if windows:
+            calls = [(endpoint, {"symbol": symbol, "from": start, "to": end}) for start, end in windows]
+            return self._fetch_many(calls, parse=parse, combine=partial(merge_windows, windows))
+
         params = {"symbol": symbol}
         if from_date:
             params["from"] = from_date
         if to_date:
             params["to"] = to_date
 
-        data = self._get(f"historical-chart/{interval}", params=params)
-
-        result = []
-        for item in data:
-            result.append(
-                CryptoHistoricalPrice(symbol=symbol, date=item["date"], price=item["close"], volume=item.get("volume"))
-            )
-        return result
+        return self._fetch(endpoint, params=params, parse=parse)
 
     def get_crypto_news_latest(
         self,
@@ -106,8 +188,7 @@ class CryptoEndpoints:
             List of CryptoNews objects
         """
         params = {"page": page, "limit": limit}
-        data = self._get("news/crypto-latest", params=params)
-        return [CryptoNews(**item) for item in data]
+        return self._fetch("news/crypto-latest", params=params, parse=model_list(CryptoNews))
 
     def search_crypto_news(
         self,
@@ -140,5 +221,4 @@ class CryptoEndpoints:
         if to_date:
             params["to"] = to_date
 
-        data = self._get("news/crypto", params=params)
-        return [CryptoNews(**item) for item in data]
+        return self._fetch("news/crypto", params=params, parse=model_list(CryptoNews))
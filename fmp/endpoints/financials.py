@@ -1,12 +1,14 @@
 """Financial statements API endpoints."""
 
-from typing import List, Optional
+from typing import Any, List, Optional, Union
 from fmp.models.financials import (
     IncomeStatement,
     BalanceSheet,
     CashFlowStatement,
     FinancialGrowth,
 )
+from fmp.parsing import model_list, select_output
+from fmp.tables import table_outputs
 
 
 class FinancialsEndpoints:
@@ -17,7 +19,8 @@ class FinancialsEndpoints:
         symbol: str,
         period: str = "annual",
         limit: Optional[int] = None,
-    ) -> List[IncomeStatement]:
+        output: str = "models",
+    ) -> Union[List[IncomeStatement], Any]:
         """
         Get income statement for a company.
 
@@ -25,23 +28,27 @@ class FinancialsEndpoints:
             symbol: Stock ticker symbol
             period: 'annual' or 'quarter' (default: 'annual')
             limit: Number of statements to return
+            output: 'models' for IncomeStatement objects, or 'pandas' / 'arrow' for a
+                DataFrame / pyarrow Table built without per-row models
+                (requires pandas / pyarrow)
 
         Returns:
-            List of IncomeStatement objects
+            List of IncomeStatement objects, or a DataFrame / Table with one row per period
         """
+        parse = select_output(output, models=model_list(IncomeStatement), **table_outputs(IncomeStatement))
         params = {"symbol": symbol, "period": period}
         if limit:
             params["limit"] = limit
 
-        data = self._get("income-statement", params=params)
-        return [IncomeStatement(**item) for item in data]
+        return self._fetch("income-statement", params=params, parse=parse)
 
     def get_balance_sheet(
         self,
         symbol: str,
         period: str = "annual",
         limit: Optional[int] = None,
-    ) -> List[BalanceSheet]:
+        output: str = "models",
+    ) -> Union[List[BalanceSheet], Any]:
         """
         Get balance sheet for a company.
 
@@ -49,23 +56,27 @@ class FinancialsEndpoints:
             symbol: Stock ticker symbol
             period: 'annual' or 'quarter' (default: 'annual')
             limit: Number of statements to return
+            output: 'models' for BalanceSheet objects, or 'pandas' / 'arrow' for a
+                DataFrame / pyarrow Table built without per-row models
+                (requires pandas / pyarrow)
 
         Returns:
-            List of BalanceSheet objects
+            List of BalanceSheet objects, or a DataFrame / Table with one row per period
         """
+        parse = select_output(output, models=model_list(BalanceSheet), **table_outputs(BalanceSheet))
         params = {"symbol": symbol, "period": period}
         if limit:
             params["limit"] = limit
 
-        data = self._get("balance-sheet-statement", params=params)
-        return [BalanceSheet(**item) for item in data]
+        return self._fetch("balance-sheet-statement", params=params, parse=parse)
 
     def get_cash_flow_statement(
         self,
         symbol: str,
         period: str = "annual",
         limit: Optional[int] = None,
-    ) -> List[CashFlowStatement]:
+        output: str = "models",
+    ) -> Union[List[CashFlowStatement], Any]:
         """
         Get cash flow statement for a company.
 
@@ -73,23 +84,27 @@ class FinancialsEndpoints:
             symbol: Stock ticker symbol
             period: 'annual' or 'quarter' (default: 'annual')
             limit: Number of statements to return
+            output: 'models' for CashFlowStatement objects, or 'pandas' / 'arrow' for a
+                DataFrame / pyarrow Table built without per-row models
+                (requires pandas / pyarrow)
 
         Returns:
-            List of CashFlowStatement objects
+            List of CashFlowStatement objects, or a DataFrame / Table with one row per period
         """
+        parse = select_output(output, models=model_list(CashFlowStatement), **table_outputs(CashFlowStatement))
         params = {"symbol": symbol, "period": period}
         if limit:
             params["limit"] = limit
 
-        data = self._get("cash-flow-statement", params=params)
-        return [CashFlowStatement(**item) for item in data]
+        return self._fetch("cash-flow-statement", params=params, parse=parse)
 
     def get_financial_growth(
         self,
         symbol: str,
         period: str = "annual",
         limit: Optional[int] = None,
-    ) -> List[FinancialGrowth]:
+        output: str = "models",
+    ) -> Union[List[FinancialGrowth], Any]:
         """
         Get financial growth metrics for a company.
 
@@ -97,13 +112,16 @@ class FinancialsEndpoints:
             symbol: Stock ticker symbol
             period: 'annual' or 'quarter' (default: 'annual')
             limit: Number of periods to return
+            output: 'models' for FinancialGrowth objects, or 'pandas' / 'arrow' for a
+                DataFrame / pyarrow Table built without per-row models
+                (requires pandas / pyarrow)
 
         Returns:
-            List of FinancialGrowth objects
+            List of FinancialGrowth objects, or a DataFrame / Table with one row per period
         """
+        parse = select_output(output, models=model_list(FinancialGrowth), **table_outputs(FinancialGrowth))
         params = {"symbol": symbol, "period": period}
         if limit:
             params["limit"] = limit
 
-        data = self._get("financial-growth", params=params)
-        return [FinancialGrowth(**item) for item in data]
+        return self._fetch("financial-growth", params=params, parse=parse)
@@ -1,24 +1,91 @@
 """Market data API endpoints."""
 
-from typing import Any, Dict, List, Optional
-from fmp.models.market import Quote, HistoricalPrice
+from datetime import date
+from functools import partial
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Union
+from fmp.adjust import RAW_KEYS, AdjustedPrices, raw_columns
+from fmp.cache import PERMANENT
+from fmp.columnar import PriceColumns
+from fmp.market_calendar import trading_days
+from fmp.models.market import (
+    Dividend,
+    HistoricalPrice,
+    IndustryPE,
+    Quote,
+    QuoteBatch,
+    SectorPE,
+    SectorPerformance,
+    StockSplit,
+)
+from fmp.parsing import batch_calls, model_list, raw_body, select_output
+from fmp.ranges import date_windows, merge_windows
+from fmp.records import HistoricalPriceRecord, QuoteRecord, record_list
+from fmp.resample import STOCK_SESSION_START
+from fmp.tables import table_outputs
+
+# ``historical-price-eod`` keys of the adjusted and light variants -> PriceColumns fields.
+EOD_KEYS = {**RAW_KEYS, "price": "close"}
+
+# Conversions of merged PriceColumns for the table outputs of the price endpoints.
+PRICE_TABLES = {"pandas": PriceColumns.to_pandas, "arrow": PriceColumns.to_arrow}
+
+
+def _eod_columns(rows: List[Dict[str, Any]]) -> PriceColumns:
+    """Build PriceColumns from the rows of any ``historical-price-eod`` variant."""
+    return PriceColumns.from_records([{EOD_KEYS.get(key, key): value for key, value in row.items()} for row in rows])
+
+
+def _eod_pandas(rows: List[Dict[str, Any]]):
+    return _eod_columns(rows).to_pandas()
+
+
+def _eod_arrow(rows: List[Dict[str, Any]]):
+    return _eod_columns(rows).to_arrow()
 
 
 class MarketEndpoints:
     """Market data, historical prices, and industry performance endpoints."""
 
-    def get_quote(self, symbol: str) -> List[Quote]:
+    def get_quote(self, symbol: str, output: str = "models") -> Union[List[Quote], List[QuoteRecord]]:
         """
         Get real-time stock quote.
 
         Args:
             symbol: Stock ticker symbol
+            output: 'models' for Quote objects or 'records' for compact,
+                unvalidated QuoteRecord objects
+
+        Returns:
+            List of Quote (or QuoteRecord) objects
+        """
+        parse = select_output(output, models=model_list(Quote), records=record_list(QuoteRecord))
+        return self._fetch("quote", params={"symbol": symbol}, parse=parse)
+
+    def get_quotes(self, symbols: Iterable[str], output: str = "models") -> QuoteBatch:
+        """
+        Get real-time stock quotes for many symbols.
+
+        Symbols are packed into comma-separated batch requests that stay under a
+        safe URL length, and the batches are fetched in parallel.
+
+        Args:
+            symbols: Stock ticker symbols
+            output: 'models' for Quote objects or 'records' for compact,
+                unvalidated QuoteRecord objects
 
         Returns:
-            List of Quote objects
+            QuoteBatch mapping each symbol to its Quote (or QuoteRecord), with
+            symbols the API returned nothing for listed in ``missing``
         """
-        data = self._get("quote", params={"symbol": symbol})
-        return [Quote(**item) for item in data]
+        parse = select_output(output, models=model_list(Quote), records=record_list(QuoteRecord))
+        requested = list(dict.fromkeys(symbols))
+        calls = batch_calls("batch-quote", requested, self._batch_budget("batch-quote"))
+        return self._fetch_many(
+            calls,
+            parse=parse,
+            combine=lambda results: QuoteBatch(chain.from_iterable(results), requested),
+        )
 
     def get_historical_chart(
         self,
@@ -26,7 +93,8 @@ class MarketEndpoints:
         interval: str = "1day",
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> List[HistoricalPrice]:
+        output: str = "models",
+    ) -> Union[List[HistoricalPrice], List[HistoricalPriceRecord], PriceColumns, Any]:
         """
         Get historical price data for a symbol.
 
@@ -35,18 +103,67 @@ class MarketEndpoints:
             interval: Time interval - '1min', '5min', '15min', '30min', '1hour', '4hour', '1day'
             from_date: Start date (YYYY-MM-DD format)
             to_date: End date (YYYY-MM-DD format)
+            output: 'models' for HistoricalPrice objects, 'records' for compact,
+                unvalidated HistoricalPriceRecord objects, 'columns' for a
+                PriceColumns of NumPy arrays built without per-row objects
+                (requires NumPy), or 'pandas' / 'arrow' for a DataFrame or
+                ``pyarrow.Table`` converted from those columns
+
+        Long intraday ranges are split into windows the API answers in full
+        (see :data:`fmp.ranges.CHART_WINDOW_DAYS`). The windows are fetched
+        concurrently and merged, de-duplicated on the bar date, into a
+        :class:`fmp.ranges.PriceSeries` whose ``gaps`` lists the windows that
+        came back empty (PriceColumns carry the same ``gaps`` attribute).
+
+        With a ``bar_store`` on the client, intraday bars for a closed range
+        it holds finer bars for are resampled locally from those (see
+        :func:`fmp.resample.resample_stored`) and no request is made.
 
         Returns:
-            List of HistoricalPrice objects
+            List of HistoricalPrice (or HistoricalPriceRecord) objects newest
+            first, or PriceColumns, a DataFrame or an Arrow table sorted
+            oldest first
         """
+        parse = select_output(
+            output,
+            models=model_list(HistoricalPrice),
+            records=record_list(HistoricalPriceRecord),
+            columns=PriceColumns.from_records,
+            pandas=PriceColumns.from_records,
+            arrow=PriceColumns.from_records,
+        )
+        # Table outputs are built from the merged columns, so windows merge as for 'columns'.
+        to_table = PRICE_TABLES.get(output)
+
+        local = self._stored_bars(symbol, interval, from_date, to_date, STOCK_SESSION_START)
+        if local is not None:
+            if to_table is not None:
+                result = to_table(local)
+            elif output == "columns":
+                result = local
+            else:
+                result = self._parse_rows(local.to_rows(), parse)
+            # Without calls, _fetch_many hands back the local result from either client.
+            return self._fetch_many([], combine=lambda _: result)
+
+        endpoint = f"historical-chart/{interval}"
+        windows = date_windows(interval, from_date, to_date)
+        if windows:
+            calls = [(endpoint, {"symbol": symbol, "from": start, "to": end}) for start, end in windows]
+            combine = partial(merge_windows, windows)
+            if to_table is not None:
+                return self._fetch_many(calls, parse=parse, combine=lambda parts: to_table(combine(parts)))
+            return self._fetch_many(calls, parse=parse, combine=combine)
+
         params = {"symbol": symbol}
         if from_date:
             params["from"] = from_date
         if to_date:
             params["to"] = to_date
 
-        data = self._get(f"historical-chart/{interval}", params=params)
-        return [HistoricalPrice(**item) for item in data]
+        if to_table is not None:
+            return self._fetch_many([(endpoint, params)], parse=parse, combine=lambda parts: to_table(parts[0]))
+        return self._fetch(endpoint, params=params, parse=parse)
 
     def get_historical_price(
         self,
@@ -55,7 +172,8 @@ class MarketEndpoints:
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
         timeseries: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
+        output: str = "raw",
+    ) -> Union[List[Dict[str, Any]], PriceColumns, Any]:
         """
         Get daily historical price data.
 
@@ -65,10 +183,17 @@ class MarketEndpoints:
             from_date: Start date (YYYY-MM-DD format)
             to_date: End date (YYYY-MM-DD format)
             timeseries: Number of days to retrieve
+            output: 'raw' for the API's row dicts, 'columns' for a
+                PriceColumns (requires NumPy), or 'pandas' / 'arrow' for a
+                DataFrame or ``pyarrow.Table`` converted from those columns.
+                The ``adj*`` prices of the adjusted variants fill the
+                open/high/low/close columns and the ``light`` price fills close.
 
         Returns:
-            Dictionary containing symbol and historical price data
+            Dictionary containing symbol and historical price data, or
+            PriceColumns, a DataFrame or an Arrow table sorted oldest first
         """
+        parse = select_output(output, raw=None, columns=_eod_columns, pandas=_eod_pandas, arrow=_eod_arrow)
         params = {"symbol": symbol}
         if from_date:
             params["from"] = from_date
@@ -77,7 +202,73 @@ class MarketEndpoints:
         if timeseries:
             params["timeseries"] = timeseries
 
-        return self._get(f"historical-price-eod/{price_type}", params=params)
+        if parse is None:
+            return self._get(f"historical-price-eod/{price_type}", params=params)
+        return self._fetch(f"historical-price-eod/{price_type}", params=params, parse=parse)
+
+    def get_splits(self, symbol: str) -> List[StockSplit]:
+        """
+        Get the stock split history of a symbol.
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            List of StockSplit objects, newest first
+        """
+        return self._fetch("splits", params={"symbol": symbol}, parse=model_list(StockSplit))
+
+    def get_dividends(self, symbol: str) -> List[Dividend]:
+        """
+        Get the dividend history of a symbol, including announced dividends.
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            List of Dividend objects, newest first
+        """
+        return self._fetch("dividends", params={"symbol": symbol}, parse=model_list(Dividend))
+
+    def get_adjusted_prices(
+        self,
+        symbol: str,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+    ) -> AdjustedPrices:
+        """
+        Get unadjusted daily prices with the splits and dividends needed to adjust them locally.
+
+        One history download replaces separate ``full``, ``non-split-adjusted``
+        and ``dividend-adjusted`` requests: the split- and dividend-adjusted
+        series are computed from the unadjusted bars and cached on the result
+        (requires NumPy). The three requests are sent concurrently.
+
+        Args:
+            symbol: Stock ticker symbol
+            from_date: Start date (YYYY-MM-DD format)
+            to_date: End date (YYYY-MM-DD format); dividend factors need the
+                close before each ex-date, so leave it open for exact
+                adjustment of the latest dividends
+
+        Returns:
+            AdjustedPrices with ``raw``, ``split_adjusted()`` and
+            ``dividend_adjusted()`` series
+        """
+        params = {"symbol": symbol}
+        if from_date:
+            params["from"] = from_date
+        if to_date:
+            params["to"] = to_date
+        calls = [
+            ("historical-price-eod/non-split-adjusted", params),
+            ("splits", {"symbol": symbol}),
+            ("dividends", {"symbol": symbol}),
+        ]
+        return self._fetch_many(
+            calls,
+            combine=lambda results: AdjustedPrices(raw_columns(results[0]), results[1], results[2]),
+        )
 
     def get_industry_pe(
         self,
@@ -182,3 +373,146 @@ class MarketEndpoints:
             params["to"] = to_date
 
         return self._get("historical-sector-performance", params=params)
+
+    def _snapshot_range(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        from_date: str,
+        to_date: str,
+        parse: Any,
+    ) -> Any:
+        """
+        Fetch a daily snapshot endpoint for every trading day in a range and concatenate the rows.
+
+        Days are fetched concurrently. With a client ``cache``, days before
+        today are kept permanently and served from it on later calls; today's
+        snapshot may still change and uses the endpoint's normal TTL. Empty
+        responses are not kept, since the day may not have been published yet.
+        """
+        today = date.today().isoformat()
+        calls = [(endpoint, {**params, "date": day}) for day in trading_days(from_date, to_date)]
+        held: Dict[str, Any] = {}
+        if self.cache is not None:
+            for _, call_params in calls:
+                if call_params["date"] < today:
+                    body = self.cache.get(endpoint, call_params, ttl=PERMANENT)
+                    if body is not None:
+                        held[call_params["date"]] = self._decode(body)
+        missing = [call for call in calls if call[1]["date"] not in held]
+
+        def combine(bodies: List[bytes]) -> Any:
+            for (_, call_params), body in zip(missing, bodies):
+                day = call_params["date"]
+                rows = held[day] = self._decode(body)
+                if self.cache is not None and day < today and rows:
+                    self.cache.set(endpoint, call_params, body, ttl=PERMANENT)
+            table = []
+            for _, call_params in calls:
+                day = call_params["date"]
+                for row in held[day] or ():
+                    if not row.get("date"):
+                        row = {**row, "date": day}
+                    table.append(row)
+            return self._parse_rows(table, parse)
+
+        return self._fetch_many(missing, parse=raw_body, combine=combine)
+
+    def get_sector_pe_range(
+        self,
+        from_date: str,
+        to_date: str,
+        exchange: Optional[str] = None,
+        sector: Optional[str] = None,
+        output: str = "models",
+    ) -> Any:
+        """
+        Get sector P/E ratios for every trading day in a date range as one table.
+
+        Weekends and US market holidays are skipped, and the remaining days
+        are fetched concurrently within the client's ``rate_limiter`` budget.
+        With a client ``cache``, past days are cached permanently, so
+        extending a history only requests the new days.
+
+        Args:
+            from_date: Start date (YYYY-MM-DD format)
+            to_date: End date (YYYY-MM-DD format)
+            exchange: Stock exchange (e.g., 'NASDAQ', 'NYSE')
+            sector: Specific sector to filter by
+            output: 'models' for SectorPE objects, 'pandas' for a DataFrame
+                or 'arrow' for a pyarrow Table
+
+        Returns:
+            One row per day and sector, oldest first
+        """
+        params = {}
+        if exchange:
+            params["exchange"] = exchange
+        if sector:
+            params["sector"] = sector
+        parse = select_output(output, models=model_list(SectorPE), **table_outputs(SectorPE))
+        return self._snapshot_range("sector_pe", params, from_date, to_date, parse)
+
+    def get_industry_pe_range(
+        self,
+        from_date: str,
+        to_date: str,
+        exchange: Optional[str] = None,
+        industry: Optional[str] = None,
+        output: str = "models",
+    ) -> Any:
+        """
+        Get industry P/E ratios for every trading day in a date range as one table.
+
+        Fetched and cached like :meth:`get_sector_pe_range`.
+
+        Args:
+            from_date: Start date (YYYY-MM-DD format)
+            to_date: End date (YYYY-MM-DD format)
+            exchange: Stock exchange (e.g., 'NASDAQ', 'NYSE')
+            industry: Specific industry to filter by
+            output: 'models' for IndustryPE objects, 'pandas' for a DataFrame
+                or 'arrow' for a pyarrow Table
+
+        Returns:
+            One row per day and industry, oldest first
+        """
+        params = {}
+        if exchange:
+            params["exchange"] = exchange
+        if industry:
+            params["industry"] = industry
+        parse = select_output(output, models=model_list(IndustryPE), **table_outputs(IndustryPE))
+        return self._snapshot_range("industry_pe", params, from_date, to_date, parse)
+
+    def get_industry_performance_range(
+        self,
+        from_date: str,
+        to_date: str,
+        exchange: Optional[str] = None,
+        industry: Optional[str] = None,
+        output: str = "models",
+    ) -> Any:
+        """
+        Get daily industry performance for every trading day in a date range as one table.
+
+        Fetched and cached like :meth:`get_sector_pe_range`.
+
+        Args:
+            from_date: Start date (YYYY-MM-DD format)
+            to_date: End date (YYYY-MM-DD format)
+            exchange: Stock exchange to filter by
+            industry: Specific industry to filter by
+            output: 'models' for SectorPerformance objects, 'pandas' for a
+                DataFrame or 'arrow' for a pyarrow Table
+
+        Returns:
+            One row per day and industry, oldest first
+        """
+        params = {}
+        if exchange:
+            params["exchange"] = exchange
+        if industry:
+            params["industry"] = industry
+        parse = select_output(output, models=model_list(SectorPerformance), **table_outputs(SectorPerformance))
+        return self._snapshot_range("sector-performance", params, from_date, to_date, parse)
@@ -0,0 +1,403 @@
+"""Vectorized technical indicators over price arrays.
+
+Indicators take the arrays of :class:`fmp.PriceColumns` (one symbol, shape
+``(time,)``) or of :class:`fmp.PriceMatrix` (many symbols, shape
+``(symbols, time)``) and compute every symbol at once with NumPy; time is
+always the last axis. Missing bars are NaN: they produce NaN output and are
+skipped by the running averages.
+
+Each indicator is a class whose :meth:`update` takes the next bars and
+returns the indicator for those bars only, keeping just the state needed to
+continue. The first call processes the history; later calls with newly
+appended bars cost time proportional to the new bars, not the history::
+
+    rsi = RSI(14)
+    history = rsi.update(columns.close)
+    latest = rsi.update(new_bars.close)
+
+The functions :func:`sma`, :func:`ema`, :func:`rsi`, :func:`atr`,
+:func:`bollinger` and :func:`vwap` compute an indicator over a full series
+in one call.
+
+NumPy is required; install it with ``pip install "fmp-python[numpy]"``.
+"""
+
+import math
+from typing import Any, Optional, Tuple
+
+from fmp.columnar import require_numpy
+
+# exp(-27) bounds the dynamic range of the weights in one exponential-average
+# block, so float64 sums keep ~4 significant digits more than a price needs.
+_BLOCK_DECAY = 27.0
+
+
+def _rows(values: Any) -> Tuple[Any, bool]:
+    """Return ``values`` as a float64 ``(symbols, time)`` array and whether it was 1-D."""
+    np = require_numpy()
+    array = np.asarray(values, dtype=np.float64)
+    if array.ndim not in (1, 2):
+        raise ValueError("Indicators take 1-D (time) or 2-D (symbols x time) arrays")
+    return np.atleast_2d(array), array.ndim == 1
+
+
+def _shape(result: Any, flat: bool) -> Any:
+    return result[0] if flat else result
+
+
+def _check_rows(state: Any, rows: int) -> None:
+    if state is not None and len(state) != rows:
+        raise ValueError(f"Expected {len(state)} symbols, got {rows}")
+
+
+def _first_valid(x: Any) -> Any:
+    """Return the first non-NaN value of each row (NaN for rows without one)."""
+    np = require_numpy()
+    valid = ~np.isnan(x)
+    first = x[np.arange(len(x)), valid.argmax(axis=1)] if x.shape[1] else np.full(len(x), np.nan)
+    return np.where(valid.any(axis=1), first, np.nan)
+
+
+def _forward_fill(x: Any, last: Any) -> Any:
+    """Replace NaNs by the previous valid value in each row, starting from ``last``."""
+    np = require_numpy()
+    filled = np.concatenate([last[:, None], x], axis=1)
+    index = np.where(~np.isnan(filled), np.arange(filled.shape[1]), 0)
+    np.maximum.accumulate(index, axis=1, out=index)
+    return np.take_along_axis(filled, index, axis=1)
+
+
+def _ewm(x: Any, alpha: float, state: Any) -> Tuple[Any, Any]:
+    """
+    Exponentially weighted mean ``y = (1 - alpha) * y_prev + alpha * x`` along each row.
+
+    NaN inputs leave the average unchanged and give NaN output. ``state`` is
+    the previous average per row; rows without one start from their first
+    valid value. The recursion is evaluated in blocks as a scaled cumulative
+    sum, so the only Python loop is over blocks, not bars.
+
+    Returns:
+        The averages and the new state
+    """
+    np = require_numpy()
+    decay = 1.0 - alpha
+    y = np.where(np.isnan(state), _first_valid(x), state)
+    out = np.full(x.shape, np.nan)
+    if decay == 0.0:
+        valid = ~np.isnan(x)
+        out[valid] = x[valid]
+        last = _forward_fill(x, y)[:, -1]
+        return out, last
+
+    block = max(1, int(_BLOCK_DECAY / -math.log(decay)))
+    for start in range(0, x.shape[1], block):
+        chunk = x[:, start : start + block]
+        valid = ~np.isnan(chunk)
+        if valid.all():
+            # No gaps: every row decays by the same powers, computed once.
+            steps = np.arange(1, chunk.shape[1] + 1)
+            values = decay**steps * (y[:, None] + alpha * np.cumsum(chunk * decay**-steps, axis=1))
+            out[:, start : start + block] = values
+        else:
+            steps = np.cumsum(valid, axis=1)
+            weighted = np.cumsum(np.where(valid, chunk * decay**-steps, 0.0), axis=1)
+            values = decay**steps * (y[:, None] + alpha * weighted)
+            out[:, start : start + block] = np.where(valid, values, np.nan)
+        y = values[:, -1]
+    return out, y
+
+
+def _window_sums(x: Any, window: int, power: int = 1) -> Tuple[Any, Any]:
+    """Return rolling sums of ``x ** power`` over ``window`` bars and whether each window is free of NaN."""
+    np = require_numpy()
+    valid = ~np.isnan(x)
+    gaps = not valid.all()
+    sums = np.zeros((len(x), x.shape[1] + 1))
+    np.cumsum(np.where(valid, x, 0.0) ** power if gaps else x**power, axis=1, out=sums[:, 1:])
+    totals = sums[:, window:] - sums[:, :-window]
+    if not gaps:
+        return totals, True
+    counts = np.zeros((len(x), x.shape[1] + 1))
+    np.cumsum(valid, axis=1, out=counts[:, 1:])
+    return totals, counts[:, window:] - counts[:, :-window] == window
+
+
+class _Windowed:
+    """Base for indicators over a trailing window, which keep the last ``window - 1`` inputs."""
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self._tail: Optional[Any] = None
+
+    def _moments(self, values: Any, variance: bool = False) -> Tuple[Any, Any, bool]:
+        """
+        Return the window mean and variance for the bars in ``values`` and whether the input was 1-D.
+
+        The variance is only computed when ``variance`` is True, and is None otherwise.
+        """
+        np = require_numpy()
+        x, flat = _rows(values)
+        _check_rows(self._tail, len(x))
+        tail = self._tail if self._tail is not None else np.empty((len(x), 0))
+        full = np.concatenate([tail, x], axis=1)
+        self._tail = full[:, full.shape[1] - min(self.window - 1, full.shape[1]) :]
+
+        mean = np.full(full.shape, np.nan)
+        spread = np.full(full.shape, np.nan) if variance else None
+        if full.shape[1] >= self.window:
+            # Centre each row on a reference value so the running sums stay small.
+            reference = np.nan_to_num(_first_valid(full))[:, None]
+            centred = full - reference
+            sums, complete = _window_sums(centred, self.window)
+            centred_mean = sums / self.window
+            mean[:, self.window - 1 :] = np.where(complete, centred_mean + reference, np.nan)
+            if variance:
+                squares, _ = _window_sums(centred, self.window, power=2)
+                spread[:, self.window - 1 :] = np.where(
+                    complete, np.maximum(squares / self.window - centred_mean**2, 0.0), np.nan
+                )
+        skip = tail.shape[1]
+        return mean[:, skip:], spread[:, skip:] if variance else None, flat
+
+
+class SMA(_Windowed):
+    """
+    Simple moving average over ``window`` bars; NaN until a full window of valid bars.
+
+    Args:
+        window: Bars per average
+    """
+
+    def update(self, values: Any) -> Any:
+        """Return the averages for ``values``, the bars following those of earlier calls."""
+        mean, _, flat = self._moments(values)
+        return _shape(mean, flat)
+
+
+class Bollinger(_Windowed):
+    """
+    Bollinger Bands: the ``window``-bar SMA and ``k`` population standard deviations either side.
+
+    Args:
+        window: Bars per band (default: 20)
+        k: Band width in standard deviations (default: 2.0)
+    """
+
+    def __init__(self, window: int = 20, k: float = 2.0):
+        super().__init__(window)
+        self.k = k
+
+    def update(self, values: Any) -> Tuple[Any, Any, Any]:
+        """Return ``(middle, upper, lower)`` for ``values``, the bars following those of earlier calls."""
+        np = require_numpy()
+        mean, variance, flat = self._moments(values, variance=True)
+        width = self.k * np.sqrt(variance)
+        return _shape(mean, flat), _shape(mean + width, flat), _shape(mean - width, flat)
+
+
+class EMA:
+    """
+    Exponential moving average with ``alpha = 2 / (span + 1)``, starting from the first value.
+
+    Args:
+        span: Decay span in bars (at least 2)
+    """
+
+    def __init__(self, span: int):
+        if span < 2:
+            raise ValueError("span must be at least 2")
+        self.span = span
+        self.alpha = 2.0 / (span + 1)
+        self._state: Optional[Any] = None
+
+    def update(self, values: Any) -> Any:
+        """Return the averages for ``values``, the bars following those of earlier calls."""
+        np = require_numpy()
+        x, flat = _rows(values)
+        _check_rows(self._state, len(x))
+        state = self._state if self._state is not None else np.full(len(x), np.nan)
+        out, self._state = _ewm(x, self.alpha, state)
+        return _shape(out, flat)
+
+
+class _Wilder:
+    """Base for indicators smoothed with Wilder's average (``alpha = 1 / period``)."""
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError("period must be at least 1")
+        self.period = period
+        self.alpha = 1.0 / period
+        self._state: Optional[Any] = None
+
+    def _start(self, rows: int, names: Tuple[str, ...]) -> dict:
+        np = require_numpy()
+        _check_rows(None if self._state is None else self._state["count"], rows)
+        if self._state is None:
+            self._state = {name: np.full(rows, np.nan) for name in names}
+            self._state["count"] = np.zeros(rows)
+        return self._state
+
+    def _warm(self, values: Any, valid: Any) -> Any:
+        """Mask output until ``period`` valid inputs have been averaged in each row."""
+        np = require_numpy()
+        counts = self._state["count"][:, None] + np.cumsum(valid, axis=1)
+        self._state["count"] = counts[:, -1] if counts.shape[1] else self._state["count"]
+        return np.where(counts >= self.period, values, np.nan)
+
+
+class RSI(_Wilder):
+    """
+    Relative Strength Index over ``period`` bars with Wilder smoothing.
+
+    Average gains and losses start from the first price change and the
+    output is NaN for the first ``period`` changes, while they settle.
+
+    Args:
+        period: Smoothing period (default: 14)
+    """
+
+    def __init__(self, period: int = 14):
+        super().__init__(period)
+
+    def update(self, close: Any) -> Any:
+        """Return the RSI (0-100) for ``close``, the bars following those of earlier calls."""
+        np = require_numpy()
+        x, flat = _rows(close)
+        state = self._start(len(x), ("close", "gain", "loss"))
+        prior = _forward_fill(x, state["close"])
+        change = x - prior[:, :-1]
+        state["close"] = prior[:, -1]
+
+        # np.maximum keeps NaN, so missing bars stay missing in both series.
+        gain, state["gain"] = _ewm(np.maximum(change, 0.0), self.alpha, state["gain"])
+        loss, state["loss"] = _ewm(np.maximum(-change, 0.0), self.alpha, state["loss"])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            strength = np.where(loss == 0, np.where(gain == 0, 50.0, 100.0), 100.0 - 100.0 / (1.0 + gain / loss))
+        strength = np.where(np.isnan(change), np.nan, strength)
+        return _shape(self._warm(strength, ~np.isnan(change)), flat)
+
+
+class ATR(_Wilder):
+    """
+    Average True Range over ``period`` bars with Wilder smoothing.
+
+    The true range of the first bar is its high-low range. The output is NaN
+    until ``period`` bars have been averaged.
+
+    Args:
+        period: Smoothing period (default: 14)
+    """
+
+    def __init__(self, period: int = 14):
+        super().__init__(period)
+
+    def update(self, high: Any, low: Any, close: Any) -> Any:
+        """Return the ATR for the given bars, which follow those of earlier calls."""
+        np = require_numpy()
+        hi, flat = _rows(high)
+        lo, _ = _rows(low)
+        c, _ = _rows(close)
+        state = self._start(len(hi), ("close", "atr"))
+        prior = _forward_fill(c, state["close"])
+        previous = prior[:, :-1]
+        state["close"] = prior[:, -1]
+
+        with np.errstate(invalid="ignore"):
+            gaps = np.fmax(np.abs(hi - previous), np.abs(lo - previous))
+            true_range = np.where(np.isnan(hi - lo), np.nan, np.fmax(hi - lo, gaps))
+        out, state["atr"] = _ewm(true_range, self.alpha, state["atr"])
+        return _shape(self._warm(out, ~np.isnan(true_range)), flat)
+
+
+class VWAP:
+    """
+    Running volume-weighted average of the typical price ``(high + low + close) / 3``.
+
+    With ``dates`` passed to :meth:`update`, the average restarts at each
+    calendar day (a session VWAP for intraday bars); without, it runs over
+    the whole series. Bars without volume do not move the average.
+    """
+
+    def __init__(self):
+        self._value: Optional[Any] = None
+        self._volume: Optional[Any] = None
+        self._day: Optional[Any] = None
+
+    def update(self, high: Any, low: Any, close: Any, volume: Any, dates: Optional[Any] = None) -> Any:
+        """
+        Return the VWAP for the given bars, which follow those of earlier calls.
+
+        Args:
+            high, low, close, volume: Bar arrays, 1-D or ``(symbols, time)``
+            dates: Timestamps of the bars (1-D, shared by all symbols) to
+                restart the average each day
+        """
+        np = require_numpy()
+        hi, flat = _rows(high)
+        lo, _ = _rows(low)
+        c, _ = _rows(close)
+        v, _ = _rows(volume)
+        _check_rows(self._value, len(hi))
+        volume_ = np.nan_to_num(v)
+        value = np.nan_to_num((hi + lo + c) / 3 * volume_)
+        if self._value is None:
+            self._value = np.zeros(len(hi))
+            self._volume = np.zeros(len(hi))
+
+        rows, length = hi.shape
+        starts = np.zeros(1, dtype=np.int64)
+        carry = True
+        if dates is not None and length:
+            days = np.asarray(dates).astype("datetime64[D]")
+            starts = np.flatnonzero(np.concatenate([[True], days[1:] != days[:-1]]))
+            carry = self._day is not None and days[0] == self._day
+            self._day = days[-1]
+
+        cumulative = []
+        for total, state in ((value, self._value), (volume_, self._volume)):
+            sums = np.cumsum(total, axis=1)
+            before = np.concatenate([np.zeros((rows, 1)), sums], axis=1)[:, starts]
+            segment = np.cumsum(np.isin(np.arange(length), starts)) - 1
+            running = sums - before[:, segment] if length else sums
+            if carry and length:
+                running[:, : starts[1] if len(starts) > 1 else length] += state[:, None]
+            cumulative.append(running)
+        if length:
+            self._value, self._volume = cumulative[0][:, -1], cumulative[1][:, -1]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = np.where(cumulative[1] > 0, cumulative[0] / cumulative[1], np.nan)
+        return _shape(out, flat)
+
+
+def sma(values: Any, window: int) -> Any:
+    """Return the ``window``-bar simple moving average of ``values``."""
+    return SMA(window).update(values)
+
+
+def ema(values: Any, span: int) -> Any:
+    """Return the exponential moving average of ``values`` with the given span."""
+    return EMA(span).update(values)
+
+
+def rsi(close: Any, period: int = 14) -> Any:
+    """Return the Relative Strength Index of ``close``."""
+    return RSI(period).update(close)
+
+
+def atr(high: Any, low: Any, close: Any, period: int = 14) -> Any:
+    """Return the Average True Range of the bars."""
+    return ATR(period).update(high, low, close)
+
+
+def bollinger(values: Any, window: int = 20, k: float = 2.0) -> Tuple[Any, Any, Any]:
+    """Return the ``(middle, upper, lower)`` Bollinger Bands of ``values``."""
+    return Bollinger(window, k).update(values)
+
+
+def vwap(high: Any, low: Any, close: Any, volume: Any, dates: Optional[Any] = None) -> Any:
+    """Return the running VWAP of the bars, restarted each day when ``dates`` is given."""
+    return VWAP().update(high, low, close, volume, dates)
@@ -0,0 +1,56 @@
+"""Interning of low-cardinality string fields.
+
+Screener, stock list, profile and news responses repeat a handful of
+exchange, sector, industry, country, currency and site names across thousands
+of rows. With ``intern_strings=True`` on a client, those values are replaced
+by one shared string object each, which saves memory and makes equality
+checks in group-bys an identity comparison.
+"""
+
+import sys
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Type
+
+from pydantic import BaseModel
+
+# Model field names holding low-cardinality labels.
+CATEGORICAL_FIELDS = frozenset(
+    {"exchange", "exchange_short_name", "stock_exchange", "sector", "industry", "country", "currency", "site", "type"}
+)
+
+# The same fields under their JSON keys, for responses returned as plain dicts.
+CATEGORICAL_KEYS = frozenset(
+    {"exchange", "exchangeShortName", "stockExchange", "sector", "industry", "country", "currency", "site", "type"}
+)
+
+
+@lru_cache(maxsize=None)
+def categorical_fields(model: Type[BaseModel]) -> Tuple[str, ...]:
+    """Return the fields of ``model`` that hold low-cardinality labels."""
+    return tuple(name for name in model.model_fields if name in CATEGORICAL_FIELDS)
+
+
+def intern_item(item: Any) -> Any:
+    """Intern the categorical string fields of one model or dict in place and return it."""
+    intern = sys.intern
+    if isinstance(item, BaseModel):
+        values: Dict[str, Any] = item.__dict__
+        names = categorical_fields(type(item))
+    elif isinstance(item, dict):
+        values = item
+        names = CATEGORICAL_KEYS.intersection(item)
+    else:
+        return item
+    for name in names:
+        value = values[name]
+        if type(value) is str:
+            values[name] = intern(value)
+    return item
+
+
+def intern_fields(result: Any) -> Any:
+    """Intern the categorical fields of every item in a list result; other results are returned as is."""
+    if type(result) is list:
+        for item in result:
+            intern_item(item)
+    return result
@@ -0,0 +1,94 @@
+"""Trading days of the US stock market.
+
+Daily snapshot endpoints such as ``sector_pe`` have no data on weekends and
+exchange holidays, so date-range helpers skip those days instead of spending
+requests on them. Holidays follow the NYSE's regular rules: a holiday falling
+on a Saturday is observed on the Friday before and one falling on a Sunday on
+the Monday after, except New Year's Day, which is not moved back into the
+previous year. One-off closures (national days of mourning, weather) are not
+included.
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import FrozenSet, List, Union
+
+
+def _easter(year: int) -> date:
+    """Return Easter Sunday of ``year`` (Gregorian calendar)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    shift = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * shift) // 451
+    month, day = divmod(h + shift - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """Return the ``n``-th ``weekday`` (0 = Monday) of a month; ``n = -1`` for the last one."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(day: date) -> date:
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=None)
+def market_holidays(year: int) -> FrozenSet[date]:
+    """Return the days of ``year`` on which the US stock market is closed for a holiday."""
+    days = {
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observed(date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving Day
+        _observed(date(year, 12, 25)),  # Christmas Day
+    }
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        days.add(_observed(new_year))
+    if year >= 2022:
+        days.add(_observed(date(year, 6, 19)))  # Juneteenth
+    return frozenset(days)
+
+
+def is_trading_day(day: date) -> bool:
+    """Return True if the US stock market is open on ``day``."""
+    return day.weekday() < 5 and day not in market_holidays(day.year)
+
+
+def trading_days(from_date: Union[str, date], to_date: Union[str, date]) -> List[str]:
+    """
+    Return the trading days from ``from_date`` to ``to_date`` (both inclusive).
+
+    Args:
+        from_date: First day, as a date or YYYY-MM-DD string
+        to_date: Last day, as a date or YYYY-MM-DD string
+
+    Returns:
+        YYYY-MM-DD strings, oldest first
+    """
+    first = date.fromisoformat(str(from_date)[:10])
+    last = date.fromisoformat(str(to_date)[:10])
+    days = []
+    day = first
+    while day <= last:
+        if is_trading_day(day):
+            days.append(day.isoformat())
+        day += timedelta(days=1)
+    return days
@@ -1,28 +1,68 @@
-"""Response models for FMP API."""
-
-from fmp.models.company import CompanyProfile, SearchResult, StockScreenerResult, StockNews
-from fmp.models.market import Quote, HistoricalPrice
-from fmp.models.crypto import CryptoQuote, CryptoInfo, CryptoHistoricalPrice, CryptoNews
-from fmp.models.financials import (
-    IncomeStatement,
-    BalanceSheet,
-    CashFlowStatement,
-    FinancialGrowth,
-)
-
-__all__ = [
-    "CompanyProfile",
-    "SearchResult",
-    "StockScreenerResult",
-    "StockNews",
-    "Quote",
-    "HistoricalPrice",
-    "CryptoQuote",
-    "CryptoInfo",
-    "CryptoHistoricalPrice",
-    "CryptoNews",
-    "IncomeStatement",
-    "BalanceSheet",
-    "CashFlowStatement",
-    "FinancialGrowth",
-]
+"""Response models for FMP API.
+
+Model modules are imported on first attribute access, and each model builds
+its validation schema on first use, so importing the package stays cheap.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from fmp.models.company import CompanyProfile, SearchResult, StockScreenerResult, StockNews
+    from fmp.models.market import (
+        Quote,
+        QuoteBatch,
+        HistoricalPrice,
+        StockSplit,
+        Dividend,
+        SectorPE,
+        IndustryPE,
+        SectorPerformance,
+    )
+    from fmp.models.crypto import CryptoQuote, CryptoInfo, CryptoHistoricalPrice, CryptoNews
+    from fmp.models.financials import (
+        IncomeStatement,
+        BalanceSheet,
+        CashFlowStatement,
+        FinancialGrowth,
+    )
+
+# Public name -> module that defines it.
+_LAZY = {
+    "CompanyProfile": "fmp.models.company",
+    "SearchResult": "fmp.models.company",
+    "StockScreenerResult": "fmp.models.company",
+    "StockNews": "fmp.models.company",
+    "Quote": "fmp.models.market",
+    "QuoteBatch": "fmp.models.market",
+    "HistoricalPrice": "fmp.models.market",
+    "StockSplit": "fmp.models.market",
+    "Dividend": "fmp.models.market",
+    "SectorPE": "fmp.models.market",
+    "IndustryPE": "fmp.models.market",
+    "SectorPerformance": "fmp.models.market",
+    "CryptoQuote": "fmp.models.crypto",
+    "CryptoInfo": "fmp.models.crypto",
+    "CryptoHistoricalPrice": "fmp.models.crypto",
+    "CryptoNews": "fmp.models.crypto",
+    "IncomeStatement": "fmp.models.financials",
+    "BalanceSheet": "fmp.models.financials",
+    "CashFlowStatement": "fmp.models.financials",
+    "FinancialGrowth": "fmp.models.financials",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
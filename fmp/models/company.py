@@ -44,7 +44,7 @@ class CompanyProfile(BaseModel):
     is_adr: Optional[bool] = Field(None, alias="isAdr")
     is_fund: Optional[bool] = Field(None, alias="isFund")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class SearchResult(BaseModel):
@@ -56,7 +56,7 @@ class SearchResult(BaseModel):
     stock_exchange: Optional[str] = Field(None, alias="stockExchange")
     exchange_short_name: Optional[str] = Field(None, alias="exchangeShortName")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class StockScreenerResult(BaseModel):
@@ -77,7 +77,7 @@ class StockScreenerResult(BaseModel):
     is_etf: Optional[bool] = Field(None, alias="isEtf")
     is_actively_trading: Optional[bool] = Field(None, alias="isActivelyTrading")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class StockNews(BaseModel):
@@ -91,4 +91,4 @@ class StockNews(BaseModel):
     text: str
     url: str
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
@@ -25,7 +25,7 @@ class CryptoQuote(BaseModel):
     previous_close: Optional[float] = Field(None, alias="previousClose")
     timestamp: Optional[int] = None
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class CryptoInfo(BaseModel):
@@ -38,7 +38,7 @@ class CryptoInfo(BaseModel):
     circulating_supply: Optional[float] = Field(None, alias="circulatingSupply")
     total_supply: Optional[float] = Field(None, alias="totalSupply")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class CryptoHistoricalPrice(BaseModel):
@@ -49,7 +49,7 @@ class CryptoHistoricalPrice(BaseModel):
     price: float
     volume: Optional[float] = None
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class CryptoNews(BaseModel):
@@ -64,4 +64,4 @@ class CryptoNews(BaseModel):
     text: str
     url: str
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
@@ -44,7 +44,7 @@ class IncomeStatement(BaseModel):
     weighted_average_shs_out: Optional[float] = Field(None, alias="weightedAverageShsOut")
     weighted_average_shs_out_dil: Optional[float] = Field(None, alias="weightedAverageShsOutDil")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class BalanceSheet(BaseModel):
@@ -103,7 +103,7 @@ class BalanceSheet(BaseModel):
     total_debt: Optional[float] = Field(None, alias="totalDebt")
     net_debt: Optional[float] = Field(None, alias="netDebt")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class CashFlowStatement(BaseModel):
@@ -148,7 +148,7 @@ class CashFlowStatement(BaseModel):
     capital_expenditure: Optional[float] = Field(None, alias="capitalExpenditure")
     free_cash_flow: Optional[float] = Field(None, alias="freeCashFlow")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class FinancialGrowth(BaseModel):
@@ -174,4 +174,4 @@ class FinancialGrowth(BaseModel):
     rd_expense_growth: Optional[float] = Field(None, alias="rdexpenseGrowth")
     sga_expenses_growth: Optional[float] = Field(None, alias="sgaexpensesGrowth")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
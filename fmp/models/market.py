@@ -30,7 +30,7 @@ class Quote(BaseModel):
     shares_outstanding: Optional[int] = Field(None, alias="sharesOutstanding")
     timestamp: Optional[int] = None
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class HistoricalPrice(BaseModel):
@@ -50,4 +50,81 @@ class HistoricalPrice(BaseModel):
     label: Optional[str] = None
     change_over_time: Optional[float] = Field(None, alias="changeOverTime")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+
+class StockSplit(BaseModel):
+    """Stock split event; each old share became ``numerator / denominator`` shares."""
+
+    symbol: str
+    date: str
+    numerator: float
+    denominator: float
+
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+
+class Dividend(BaseModel):
+    """Dividend event; ``date`` is the ex-dividend date."""
+
+    symbol: str
+    date: str
+    record_date: Optional[str] = Field(None, alias="recordDate")
+    payment_date: Optional[str] = Field(None, alias="paymentDate")
+    declaration_date: Optional[str] = Field(None, alias="declarationDate")
+    adj_dividend: Optional[float] = Field(None, alias="adjDividend")
+    dividend: float
+    dividend_yield: Optional[float] = Field(None, alias="yield")
+    frequency: Optional[str] = None
+
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+
+class SectorPE(BaseModel):
+    """Price-to-earnings ratio of a sector on one day."""
+
+    date: str
+    sector: Optional[str] = None
+    exchange: Optional[str] = None
+    pe: Optional[float] = None
+
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+
+class IndustryPE(BaseModel):
+    """Price-to-earnings ratio of an industry on one day."""
+
+    date: str
+    industry: Optional[str] = None
+    exchange: Optional[str] = None
+    pe: Optional[float] = None
+
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+
+class SectorPerformance(BaseModel):
+    """Average percentage change of a sector or industry on one day."""
+
+    date: str
+    sector: Optional[str] = None
+    industry: Optional[str] = None
+    exchange: Optional[str] = None
+    average_change: Optional[float] = Field(None, alias="averageChange")
+
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+
+class QuoteBatch(dict):
+    """
+    Quotes from a batched request, keyed by symbol.
+
+    Attributes:
+        missing: Requested symbols the API returned no quote for
+    """
+
+    def __init__(self, quotes=(), requested=()):
+        super().__init__((quote.symbol, quote) for quote in quotes)
+        self.missing = [symbol for symbol in requested if symbol not in self]
+
+    def __repr__(self):
+        return f"QuoteBatch({dict.__repr__(self)}, missing={self.missing!r})"
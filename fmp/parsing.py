@@ -0,0 +1,117 @@
+"""Helpers that turn API responses into models.
+
+Endpoint methods describe how to parse a response instead of parsing it
+themselves, so the same method body works for both the synchronous and the
+asynchronous client. A parser is any callable taking decoded JSON data;
+parsers that also provide ``from_json`` are handed the raw response bytes
+instead, skipping the intermediate Python dicts.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+from fmp.dates import typed_model
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[M]) -> TypeAdapter:
+    """Return the cached ``TypeAdapter`` for ``List[model]``."""
+    return TypeAdapter(List[model])
+
+
+class ModelList:
+    """
+    Parser that validates a JSON array into a list of ``model``.
+
+    Raw bodies are validated in one pass by pydantic-core with
+    ``TypeAdapter.validate_json``, which is considerably faster than decoding
+    to dicts and calling ``model(**item)`` per row.
+    """
+
+    __slots__ = ("model",)
+
+    def __init__(self, model: Type[M]):
+        self.model = model
+
+    def __call__(self, data: Any) -> List[M]:
+        return list_adapter(self.model).validate_python(data)
+
+    def from_json(self, body: bytes) -> List[M]:
+        return list_adapter(self.model).validate_json(body)
+
+    def with_typed_dates(self) -> "ModelList":
+        """Return the parser for the variant of ``model`` with typed date fields."""
+        return model_list(typed_model(self.model))
+
+
+@lru_cache(maxsize=None)
+def model_list(model: Type[M]) -> ModelList:
+    """Return a parser that builds a list of ``model`` from a JSON array."""
+    return ModelList(model)
+
+
+class RawBody:
+    """Parser that returns the raw response bytes, for callers that decode or store them themselves."""
+
+    __slots__ = ()
+
+    def __call__(self, data: Any) -> Any:
+        return data
+
+    def from_json(self, body: bytes) -> bytes:
+        return body
+
+
+raw_body = RawBody()
+
+
+def chunk_symbols(symbols: Iterable[str], max_chars: int) -> List[List[str]]:
+    """
+    Split symbols into groups whose comma-joined form fits in ``max_chars``.
+
+    Duplicates are dropped while preserving first-seen order. Separators are
+    counted as their URL-encoded length (``%2C``) so the estimate holds
+    whether or not the HTTP layer escapes commas.
+    """
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    length = 0
+    seen = set()
+
+    for symbol in symbols:
+        if symbol in seen:
+            continue
+        seen.add(symbol)
+        extra = len(symbol) + (3 if current else 0)
+        if current and length + extra > max_chars:
+            chunks.append(current)
+            current, length, extra = [], 0, len(symbol)
+        current.append(symbol)
+        length += extra
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def batch_calls(endpoint: str, symbols: List[str], max_chars: int) -> List[Tuple[str, Dict[str, Any]]]:
+    """Build ``(endpoint, params)`` pairs that request ``symbols`` in comma-separated batches."""
+    return [(endpoint, {"symbols": ",".join(chunk)}) for chunk in chunk_symbols(symbols, max_chars)]
+
+
+def select_output(output: str, **parsers: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    Pick the parser for an endpoint's ``output`` argument.
+
+    Raises:
+        ValueError: If ``output`` is not one of the keyword names
+    """
+    try:
+        return parsers[output]
+    except KeyError:
+        choices = ", ".join(repr(name) for name in parsers)
+        raise ValueError(f"output must be one of {choices}, not {output!r}") from None
@@ -0,0 +1,82 @@
+"""Splitting long intraday date ranges into requests the API answers in full.
+
+``historical-chart/{interval}`` returns at most a few thousand bars per
+request and silently drops the rest. Ranges longer than one window of
+:data:`CHART_WINDOW_DAYS` are therefore fetched as several consecutive
+windows and merged back into one series.
+"""
+
+from datetime import date, timedelta
+from typing import Any, Iterable, List, Optional, Tuple
+
+from fmp.columnar import PriceColumns
+
+# Calendar days per request for each intraday interval, sized so that even a
+# 24/7 crypto market stays under the per-request bar cap.
+CHART_WINDOW_DAYS = {
+    "1min": 3,
+    "5min": 15,
+    "15min": 45,
+    "30min": 90,
+    "1hour": 180,
+    "4hour": 720,
+}
+
+
+def date_windows(interval: str, from_date: Optional[str], to_date: Optional[str]) -> List[Tuple[str, str]]:
+    """
+    Split ``from_date``..``to_date`` (inclusive, YYYY-MM-DD) into windows for ``interval``.
+
+    Returns an empty list when the range does not need splitting: the
+    interval has no window size, no ``from_date`` is given, or the range fits
+    in one window. A missing ``to_date`` means today.
+    """
+    days = CHART_WINDOW_DAYS.get(interval)
+    if days is None or not from_date:
+        return []
+    start = date.fromisoformat(from_date[:10])
+    end = date.fromisoformat(to_date[:10]) if to_date else date.today()
+    if (end - start).days < days:
+        return []
+
+    windows = []
+    while start <= end:
+        stop = min(start + timedelta(days=days - 1), end)
+        windows.append((start.isoformat(), stop.isoformat()))
+        start = stop + timedelta(days=1)
+    return windows
+
+
+class PriceSeries(list):
+    """
+    Bars merged from several windowed requests, newest first like a single response.
+
+    Attributes:
+        gaps: ``(from_date, to_date)`` windows for which the API returned no
+            bars, e.g. market holidays or history the API does not have
+    """
+
+    def __init__(self, bars: Iterable[Any] = (), gaps: Optional[List[Tuple[str, str]]] = None):
+        super().__init__(bars)
+        self.gaps = gaps or []
+
+
+def merge_windows(windows: List[Tuple[str, str]], parts: List[Any]) -> Any:
+    """
+    Merge the parsed responses of consecutive windows.
+
+    Bars are de-duplicated on their date. Lists of models or records become a
+    :class:`PriceSeries` ordered newest first; :class:`PriceColumns` parts are
+    concatenated oldest first. Empty windows are reported in ``gaps``.
+    """
+    gaps = [window for window, part in zip(windows, parts) if not len(part)]
+    if parts and all(isinstance(part, PriceColumns) for part in parts):
+        columns = PriceColumns.merge(parts)
+        columns.gaps = gaps
+        return columns
+
+    by_date = {}
+    for part in parts:
+        for bar in part:
+            by_date.setdefault(bar.date, bar)
+    return PriceSeries((by_date[key] for key in sorted(by_date, reverse=True)), gaps)
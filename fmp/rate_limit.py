@@ -0,0 +1,108 @@
+"""Client-side rate limiting."""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter shared across threads and event loops.
+
+    Each request takes one token. Tokens refill continuously at
+    ``calls / period`` per second up to ``burst``. When the bucket is empty the
+    caller reserves the next token and sleeps until it is due, so callers are
+    served in arrival order and the lock is never held while waiting. One
+    instance can be passed to several :class:`fmp.FMPClient` and
+    :class:`fmp.AsyncFMPClient` objects to enforce a single quota.
+
+    Args:
+        calls: Number of calls allowed per ``period``
+        period: Length of the quota window in seconds (default: 60.0)
+        burst: Maximum number of calls that may be made back to back
+            (default: ``calls``)
+    """
+
+    def __init__(self, calls: int, period: float = 60.0, burst: Optional[int] = None):
+        if calls < 1:
+            raise ValueError("calls must be at least 1")
+        if period <= 0:
+            raise ValueError("period must be positive")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.calls = calls
+        self.period = period
+        self.burst = burst if burst is not None else calls
+        self.rate = calls / period
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._acquired = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @classmethod
+    def per_second(cls, calls: int, burst: Optional[int] = None) -> "RateLimiter":
+        """Create a limiter allowing ``calls`` requests per second."""
+        return cls(calls, period=1.0, burst=burst)
+
+    @classmethod
+    def per_minute(cls, calls: int, burst: Optional[int] = None) -> "RateLimiter":
+        """Create a limiter allowing ``calls`` requests per minute."""
+        return cls(calls, period=60.0, burst=burst)
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            self._acquired += 1
+            if wait > 0:
+                self._delayed += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            return wait
+
+    def acquire(self) -> float:
+        """
+        Block the current thread until a request may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """
+        Suspend the current coroutine until a request may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Counters for tuning: requests admitted, how many had to wait, and wait times in seconds."""
+        with self._lock:
+            return {
+                "acquired": self._acquired,
+                "delayed": self._delayed,
+                "total_wait": self._total_wait,
+                "max_wait": self._max_wait,
+                "avg_wait": self._total_wait / self._acquired if self._acquired else 0.0,
+            }
@@ -0,0 +1,125 @@
+"""Compact slotted record types for high-volume results.
+
+Records carry the same attribute names as their pydantic models but store
+values in ``__slots__`` with no validation or per-instance dict, which cuts
+memory and construction time for millions of quotes or bars. Convert
+individual records with :meth:`Record.to_model` when a full model is needed.
+"""
+
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, List, Tuple, Type
+
+from pydantic import BaseModel
+
+from fmp.models.crypto import CryptoHistoricalPrice, CryptoQuote
+from fmp.models.market import HistoricalPrice, Quote
+from fmp.parsing import ModelList, model_list
+
+
+class Record:
+    """Base class for slotted records mirroring a pydantic model."""
+
+    __slots__ = ()
+
+    model: ClassVar[Type[BaseModel]]
+    # (attribute name, JSON key) pairs in model field order.
+    _keys: ClassVar[Tuple[Tuple[str, str], ...]]
+
+    def __init__(self, **values: Any):
+        for name, _ in self._keys:
+            setattr(self, name, values.get(name))
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]):
+        """Build a record from a decoded API row keyed by JSON field names."""
+        record = cls.__new__(cls)
+        get = row.get
+        for name, key in cls._keys:
+            setattr(record, name, get(key))
+        return record
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict[str, Any]]) -> list:
+        """Build records from a decoded JSON array."""
+        from_row = cls.from_row
+        return [from_row(row) for row in rows]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the values keyed by attribute name."""
+        return {name: getattr(self, name) for name, _ in self._keys}
+
+    def to_model(self) -> BaseModel:
+        """Validate the record into its pydantic model."""
+        return self.model.model_validate(self.to_dict())
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name, _ in self._keys)
+        return f"{type(self).__name__}({values})"
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name, _ in self._keys)
+
+    def __setstate__(self, state):
+        for (name, _), value in zip(self._keys, state):
+            setattr(self, name, value)
+
+
+def _record_type(name: str, model: Type[BaseModel], doc: str) -> Type[Record]:
+    keys = tuple((field, info.alias or field) for field, info in model.model_fields.items())
+    namespace = {
+        "__slots__": tuple(field for field, _ in keys),
+        "__doc__": doc,
+        "__module__": __name__,
+        "model": model,
+        "_keys": keys,
+    }
+    return type(name, (Record,), namespace)
+
+
+class RecordList:
+    """
+    Parser that builds a list of ``record_type`` records from a JSON array.
+
+    ``validator`` is the parser for the full models; clients created with
+    ``validate_every=N`` run one response in N through it as well, so a
+    changed schema raises a ``ValidationError`` instead of going unnoticed.
+    """
+
+    __slots__ = ("record_type",)
+
+    def __init__(self, record_type: Type[Record]):
+        self.record_type = record_type
+
+    def __call__(self, data: Any) -> list:
+        return self.record_type.from_rows(data)
+
+    @property
+    def validator(self) -> ModelList:
+        return model_list(self.record_type.model)
+
+
+@lru_cache(maxsize=None)
+def record_list(record_type: Type[Record]) -> RecordList:
+    """Return a parser that builds a list of ``record_type`` records from a JSON array."""
+    return RecordList(record_type)
+
+
+QuoteRecord = _record_type("QuoteRecord", Quote, "Slotted, unvalidated counterpart of :class:`fmp.models.Quote`.")
+CryptoQuoteRecord = _record_type(
+    "CryptoQuoteRecord", CryptoQuote, "Slotted, unvalidated counterpart of :class:`fmp.models.CryptoQuote`."
+)
+HistoricalPriceRecord = _record_type(
+    "HistoricalPriceRecord",
+    HistoricalPrice,
+    "Slotted, unvalidated counterpart of :class:`fmp.models.HistoricalPrice`.",
+)
+CryptoHistoricalPriceRecord = _record_type(
+    "CryptoHistoricalPriceRecord",
+    CryptoHistoricalPrice,
+    "Slotted, unvalidated counterpart of :class:`fmp.models.CryptoHistoricalPrice`.",
+)
@@ -0,0 +1,133 @@
+"""Deriving coarser price bars from finer ones.
+
+``historical-chart`` serves every interval as a separate request. Bars of a
+coarser interval can instead be aggregated locally from finer bars already
+held, e.g. 5-minute, hourly and 4-hour bars from 1-minute bars: the first open,
+highest high, lowest low and last close of each bucket, the summed volume and
+the volume-weighted VWAP. Buckets are aligned to the session open of each day,
+so hourly stock bars start at 09:30, 10:30, ... like the API's.
+
+NumPy is required; install it with ``pip install "fmp-python[numpy]"``.
+"""
+
+from datetime import date
+from typing import Any, Optional
+
+from fmp.columnar import PriceColumns, require_numpy
+
+# Length of each chart interval in seconds.
+INTERVAL_SECONDS = {
+    "1min": 60,
+    "5min": 5 * 60,
+    "15min": 15 * 60,
+    "30min": 30 * 60,
+    "1hour": 3600,
+    "4hour": 4 * 3600,
+    "1day": 24 * 3600,
+}
+
+# Session open used to align intraday buckets: US equities trade from 09:30,
+# crypto around the clock from midnight.
+STOCK_SESSION_START = "09:30"
+CRYPTO_SESSION_START = "00:00"
+
+
+def _seconds_of_day(clock: str) -> int:
+    hours, minutes = clock.split(":")[:2]
+    return int(hours) * 3600 + int(minutes) * 60
+
+
+def resample(bars: PriceColumns, interval: str, session_start: str = STOCK_SESSION_START) -> PriceColumns:
+    """
+    Aggregate bars sorted oldest first into bars of ``interval``.
+
+    Intraday buckets are laid out every ``interval`` from ``session_start``
+    on each day and never span midnight; bars before the session open fall
+    into the buckets preceding it. Daily buckets cover a calendar day. The
+    VWAP of a bucket weights each bar's own VWAP, or its typical price
+    ``(high + low + close) / 3`` where the bar has none, by its volume.
+
+    Args:
+        bars: Finer bars, e.g. from ``output="columns"`` or :class:`fmp.BarStore`
+        interval: Target interval, one of :data:`INTERVAL_SECONDS`
+        session_start: Session open as ``HH:MM`` in the bars' time zone
+
+    Returns:
+        PriceColumns with one bar per non-empty bucket, stamped with the
+        bucket start
+    """
+    np = require_numpy()
+    if interval not in INTERVAL_SECONDS:
+        raise ValueError(f"Unknown interval: {interval!r}")
+    width = INTERVAL_SECONDS[interval]
+    anchor = 0 if interval == "1day" else _seconds_of_day(session_start)
+
+    seconds = bars.date.astype("datetime64[s]").astype(np.int64)
+    day = seconds - seconds % 86400
+    bucket = day + anchor + (seconds - day - anchor) // width * width
+    np.maximum(bucket, day, out=bucket)
+
+    if not len(bucket):
+        return PriceColumns(date=bucket.astype("datetime64[s]"), **{name: np.empty(0) for name in bars.FIELDS[1:]})
+    starts = np.flatnonzero(np.concatenate(([True], bucket[1:] != bucket[:-1])))
+    ends = np.append(starts[1:], len(bucket)) - 1
+
+    high = np.asarray(bars.high, dtype=np.float64)
+    low = np.asarray(bars.low, dtype=np.float64)
+    close = np.asarray(bars.close, dtype=np.float64)
+    volume = np.nan_to_num(np.asarray(bars.volume, dtype=np.float64))
+    price = np.asarray(bars.vwap, dtype=np.float64)
+    price = np.where(np.isnan(price), (high + low + close) / 3, price)
+
+    total = np.add.reduceat(volume, starts)
+    weighted = np.add.reduceat(np.nan_to_num(price * volume), starts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        vwap = np.where(total > 0, weighted / total, np.nan)
+
+    return PriceColumns(
+        date=bucket[starts].astype("datetime64[s]"),
+        open=np.asarray(bars.open, dtype=np.float64)[starts],
+        high=np.fmax.reduceat(high, starts),
+        low=np.fmin.reduceat(low, starts),
+        close=close[ends],
+        volume=total,
+        vwap=vwap,
+    )
+
+
+def resample_stored(
+    store: Any,
+    symbol: str,
+    interval: str,
+    from_date: Optional[str],
+    to_date: Optional[str],
+    session_start: str = STOCK_SESSION_START,
+) -> Optional[PriceColumns]:
+    """
+    Derive ``from_date``..``to_date`` bars of ``interval`` from finer bars in a :class:`fmp.BarStore`.
+
+    The coarsest stored interval that evenly divides ``interval`` is used. The
+    range must be closed, end before today and consist of days the store
+    records as complete (see :meth:`fmp.BarStore.mark_complete`), so neither
+    a hole between appends nor a day stored mid-session is served.
+
+    Returns:
+        The resampled bars, or None if the store cannot serve the range
+    """
+    width = INTERVAL_SECONDS.get(interval)
+    if width is None or interval == "1day" or not from_date or not to_date:
+        return None
+    first, last = date.fromisoformat(from_date[:10]), date.fromisoformat(to_date[:10])
+    if last >= date.today():
+        return None
+
+    sources = sorted(
+        (name for name, seconds in INTERVAL_SECONDS.items() if seconds < width and width % seconds == 0),
+        key=INTERVAL_SECONDS.get,
+        reverse=True,
+    )
+    for source in sources:
+        if not store.covers(symbol, source, first.isoformat(), last.isoformat()):
+            continue
+        return resample(store.read(symbol, source, first.isoformat(), last.isoformat()), interval, session_start)
+    return None
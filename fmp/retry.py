@@ -0,0 +1,141 @@
+"""Retry policy for transient request failures."""
+
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional
+
+import httpx
+
+# Authentication failures are never transient and must surface immediately.
+NON_RETRYABLE_STATUSES = frozenset({401, 403})
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with jitter for failed requests.
+
+    The delay before retry ``n`` (1-based) is
+    ``min(max_backoff, backoff_factor * 2 ** (n - 1))``, reduced by a random
+    fraction of up to ``jitter`` so that many clients do not retry in lockstep.
+    When ``respect_retry_after`` is set and the server sends a ``Retry-After``
+    header, that value is used instead (still capped at ``max_backoff``).
+    401 and 403 responses are never retried.
+
+    Args:
+        max_attempts: Total attempts per request, including the first (default: 3)
+        backoff_factor: Base delay in seconds (default: 0.5)
+        max_backoff: Upper bound on any single delay in seconds (default: 30.0)
+        jitter: Fraction of each delay that is randomised, 0 to 1 (default: 0.5)
+        retry_statuses: HTTP status codes that trigger a retry
+            (default: 429, 500, 502, 503, 504)
+        retry_network_errors: Whether connection errors and timeouts are retried (default: True)
+        respect_retry_after: Whether to honour the ``Retry-After`` header (default: True)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: float = 0.5,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        retry_network_errors: bool = True,
+        respect_retry_after: bool = True,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if backoff_factor < 0 or max_backoff < 0:
+            raise ValueError("backoff_factor and max_backoff must not be negative")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses) - NON_RETRYABLE_STATUSES
+        self.retry_network_errors = retry_network_errors
+        self.respect_retry_after = respect_retry_after
+
+        self._lock = threading.Lock()
+        self._retries = 0
+        self._exhausted = 0
+        self._by_reason: Dict[str, int] = {}
+
+    def backoff(self, retry: int) -> float:
+        """Return the jittered delay before the ``retry``-th retry."""
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (retry - 1))
+        return delay * (1 - self.jitter * random.random())
+
+    def _retry_after(self, response: httpx.Response) -> Optional[float]:
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            # "-0000" dates parse as naive; HTTP dates are always UTC.
+            when = when.replace(tzinfo=timezone.utc)
+        return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    def next_delay(
+        self,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+        error: Optional[httpx.RequestError] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether a failed attempt should be retried.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            response: Response received, if any
+            error: Transport error raised, if any
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if error is not None:
+            if not self.retry_network_errors:
+                return None
+            reason = "network"
+        elif response is not None and response.status_code in self.retry_statuses:
+            reason = str(response.status_code)
+        else:
+            return None
+
+        if attempt >= self.max_attempts:
+            with self._lock:
+                self._exhausted += 1
+            return None
+
+        delay = None
+        if response is not None and self.respect_retry_after:
+            delay = self._retry_after(response)
+            if delay is not None:
+                delay = min(delay, self.max_backoff)
+        if delay is None:
+            delay = self.backoff(attempt)
+
+        with self._lock:
+            self._retries += 1
+            self._by_reason[reason] = self._by_reason.get(reason, 0) + 1
+        return delay
+
+    @property
+    def stats(self) -> Dict[str, object]:
+        """Counters of retries performed, by reason, and of requests that ran out of attempts."""
+        with self._lock:
+            return {
+                "retries": self._retries,
+                "exhausted": self._exhausted,
+                "by_reason": dict(self._by_reason),
+            }
@@ -0,0 +1,103 @@
+"""Incremental parsing of large JSON array responses."""
+
+import codecs
+import json
+from typing import Any, Iterable, List
+
+from fmp.exceptions import FMPAPIError
+
+_WHITESPACE = " \t\n\r"
+
+
+class JSONArrayParser:
+    """
+    Push parser that yields the elements of a top-level JSON array.
+
+    Feed it response chunks as they arrive; each call returns the elements
+    completed so far. Only the unparsed tail of the body is buffered, so
+    memory stays proportional to the largest single element rather than the
+    whole payload. A top-level value that is not an array (such as an API
+    error object) is buffered and returned whole by :meth:`close`.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+        self.is_array = True
+
+    def _skip_whitespace(self, pos: int) -> int:
+        buffer = self._buffer
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        return pos
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add a chunk of the body and return the elements it completed."""
+        self._buffer += self._text.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> List[Any]:
+        """Signal the end of the body and return any remaining elements."""
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._drain(final=True)
+
+        if not self.is_array:
+            return [json.loads(self._buffer)] if self._buffer.strip() else []
+        if self._started and not self._finished:
+            raise FMPAPIError("Response body ended in the middle of a JSON array")
+        return items
+
+    def _drain(self, final: bool) -> List[Any]:
+        items: List[Any] = []
+        pos = self._skip_whitespace(0)
+
+        if not self._started:
+            if pos >= len(self._buffer):
+                return items
+            if self._buffer[pos] != "[":
+                self.is_array = False
+                return items
+            self._started = True
+            pos = self._skip_whitespace(pos + 1)
+        if not self.is_array or self._finished:
+            self._buffer = self._buffer[pos:]
+            return items
+
+        while pos < len(self._buffer):
+            char = self._buffer[pos]
+            if char == "]":
+                self._finished = True
+                pos += 1
+                break
+            if char == ",":
+                pos = self._skip_whitespace(pos + 1)
+                continue
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, pos)
+            except json.JSONDecodeError as e:
+                if final:
+                    raise FMPAPIError(f"Malformed JSON array in response body: {e}")
+                break
+            # An element is only complete once its delimiter has arrived;
+            # until then a number such as "2" may still grow into "2.5".
+            after = self._skip_whitespace(end)
+            if after >= len(self._buffer) or self._buffer[after] not in ",]":
+                if final:
+                    raise FMPAPIError("Malformed JSON array in response body")
+                break
+            items.append(item)
+            pos = after
+
+        self._buffer = self._buffer[pos:]
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterable[Any]:
+    """Yield the elements of a JSON array delivered as byte chunks."""
+    parser = JSONArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
@@ -0,0 +1,344 @@
+"""Incremental download of price histories into a local store.
+
+:meth:`fmp.FMPClient.sync_prices` keeps a :class:`PriceStore` up to date by
+fetching only the bars after the last stored date per symbol and interval.
+Each delta request re-fetches a few already stored bars as well; if the API
+now reports different values for them (a split adjustment or a late
+correction), the symbol's stored history is downloaded again from its oldest
+bar and replaces the stored bars from that date on. Intraday requests are
+split into :func:`fmp.ranges.date_windows`, since a single
+``historical-chart`` response is capped and would silently drop bars.
+"""
+
+import math
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Generator, Iterable, List, Mapping, Optional, Tuple, Union
+
+from fmp.columnar import PriceColumns
+from fmp.ranges import CHART_WINDOW_DAYS, date_windows
+
+# Stored per bar besides the date, matching the columnar price fields.
+BAR_FIELDS = PriceColumns.FIELDS[1:]
+
+
+def price_endpoint(interval: str) -> str:
+    """Return the endpoint serving bars of ``interval`` ('1day' maps to the daily EOD history)."""
+    return "historical-price-eod/full" if interval == "1day" else f"historical-chart/{interval}"
+
+
+class PriceStore:
+    """
+    Local SQLite store of price bars with a per-symbol, per-interval watermark.
+
+    Safe to share between threads and between processes using the same file.
+
+    Args:
+        path: Database file; parent directories are created as needed
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        columns = ", ".join(f"{name} REAL" for name in BAR_FIELDS)
+        self._db.execute(
+            f"CREATE TABLE IF NOT EXISTS bars (symbol TEXT NOT NULL, interval TEXT NOT NULL, date TEXT NOT NULL, "
+            f"{columns}, PRIMARY KEY (symbol, interval, date)) WITHOUT ROWID"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS watermarks (symbol TEXT NOT NULL, interval TEXT NOT NULL, "
+            "last_date TEXT NOT NULL, synced_at REAL NOT NULL, PRIMARY KEY (symbol, interval))"
+        )
+
+    def last_date(self, symbol: str, interval: str) -> Optional[str]:
+        """Return the date of the newest stored bar, or None if the symbol was never synced."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT last_date FROM watermarks WHERE symbol = ? AND interval = ?", (symbol, interval)
+            ).fetchone()
+        return row[0] if row else None
+
+    def first_date(self, symbol: str, interval: str) -> Optional[str]:
+        """Return the date of the oldest stored bar, or None if none are stored."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT MIN(date) FROM bars WHERE symbol = ? AND interval = ?", (symbol, interval)
+            ).fetchone()
+        return row[0]
+
+    def overlap_start(self, symbol: str, interval: str, bars: int) -> Optional[str]:
+        """Return the date of the ``bars``-th newest stored bar (or the oldest, if fewer are stored)."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT date FROM bars WHERE symbol = ? AND interval = ? ORDER BY date DESC LIMIT ?",
+                (symbol, interval, max(bars, 1)),
+            ).fetchall()
+        return rows[-1][0] if rows else None
+
+    def read(
+        self,
+        symbol: str,
+        interval: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return stored bars oldest first, keyed like API rows.
+
+        Args:
+            symbol: Ticker symbol
+            interval: Bar interval, e.g. '1day' or '5min'
+            start: Earliest date to include (inclusive)
+            end: Latest date to include (inclusive)
+        """
+        query = f"SELECT date, {', '.join(BAR_FIELDS)} FROM bars WHERE symbol = ? AND interval = ?"
+        params: List[Any] = [symbol, interval]
+        if start is not None:
+            query += " AND date >= ?"
+            params.append(start)
+        if end is not None:
+            query += " AND date <= ?"
+            params.append(end)
+        with self._lock:
+            rows = self._db.execute(query + " ORDER BY date", params).fetchall()
+        keys = ("date",) + BAR_FIELDS
+        return [dict(zip(keys, row)) for row in rows]
+
+    def write(
+        self,
+        symbol: str,
+        interval: str,
+        rows: List[Mapping[str, Any]],
+        replace: bool = False,
+        replace_from: Optional[str] = None,
+    ) -> int:
+        """
+        Insert or overwrite bars and advance the watermark, in one transaction.
+
+        Writing the same bars twice leaves the store unchanged.
+
+        Args:
+            symbol: Ticker symbol
+            interval: Bar interval
+            rows: API rows with a ``date`` and the bar fields
+            replace: Drop every stored bar of the symbol and interval first
+            replace_from: Drop the stored bars dated on or after this date
+                first, keeping older ones
+
+        Returns:
+            Number of rows written
+        """
+        values = [(symbol, interval, row["date"]) + tuple(row.get(name) for name in BAR_FIELDS) for row in rows]
+        placeholders = ", ".join("?" * (3 + len(BAR_FIELDS)))
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                if replace:
+                    self._db.execute("DELETE FROM bars WHERE symbol = ? AND interval = ?", (symbol, interval))
+                elif replace_from is not None:
+                    self._db.execute(
+                        "DELETE FROM bars WHERE symbol = ? AND interval = ? AND date >= ?",
+                        (symbol, interval, replace_from),
+                    )
+                self._db.executemany(
+                    f"INSERT OR REPLACE INTO bars (symbol, interval, date, {', '.join(BAR_FIELDS)}) "
+                    f"VALUES ({placeholders})",
+                    values,
+                )
+                last = self._db.execute(
+                    "SELECT MAX(date) FROM bars WHERE symbol = ? AND interval = ?", (symbol, interval)
+                ).fetchone()[0]
+                if last is not None:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO watermarks (symbol, interval, last_date, synced_at) VALUES (?, ?, ?, ?)",
+                        (symbol, interval, last, time.time()),
+                    )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return len(values)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+
+class SyncResult:
+    """
+    Outcome of syncing one symbol.
+
+    Attributes:
+        symbol: Ticker symbol
+        written: Bars written to the store
+        revised: True if a revision was detected and the stored history re-downloaded
+        last_date: Date of the newest stored bar afterwards (None if nothing is stored)
+    """
+
+    __slots__ = ("symbol", "written", "revised", "last_date")
+
+    def __init__(self, symbol: str, written: int, revised: bool, last_date: Optional[str]):
+        self.symbol = symbol
+        self.written = written
+        self.revised = revised
+        self.last_date = last_date
+
+    def __repr__(self) -> str:
+        return (
+            f"SyncResult(symbol={self.symbol!r}, written={self.written}, revised={self.revised}, "
+            f"last_date={self.last_date!r})"
+        )
+
+
+def _same_bar(stored: Mapping[str, Any], fetched: Mapping[str, Any]) -> bool:
+    for name in BAR_FIELDS:
+        a, b = stored.get(name), fetched.get(name)
+        if a is None or b is None:
+            if a is not b:
+                return False
+        elif not math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-12):
+            return False
+    return True
+
+
+Call = Tuple[str, Dict[str, Any]]
+
+
+class SyncPlan:
+    """
+    The requests and merge logic for syncing one symbol; driven by :func:`sync_steps`.
+
+    Args:
+        store: Store to update
+        symbol: Ticker symbol
+        interval: Bar interval
+        overlap: Already stored bars to re-fetch and compare on each delta
+        from_date: Start of the history to download on a first sync; intraday
+            intervals default to the most recent :data:`fmp.ranges.CHART_WINDOW_DAYS`
+            window and daily bars to the full history
+    """
+
+    def __init__(self, store: PriceStore, symbol: str, interval: str, overlap: int, from_date: Optional[str] = None):
+        self.store = store
+        self.symbol = symbol
+        self.interval = interval
+        self.endpoint = price_endpoint(interval)
+        self.from_date = from_date
+        self.watermark = store.last_date(symbol, interval)
+        self.window_start: Optional[str] = None
+        self.refetch_start: Optional[str] = None
+        if self.watermark is not None:
+            start = store.overlap_start(symbol, interval, overlap) or self.watermark
+            # ``from`` takes a calendar date; intraday bars earlier that day are compared too.
+            self.window_start = start[:10]
+
+    def _calls(self, start: Optional[str]) -> List[Call]:
+        """Return the requests for the bars from ``start`` onwards, windowed for intraday intervals."""
+        params: Dict[str, Any] = {"symbol": self.symbol}
+        if start is None:
+            return [(self.endpoint, params)]
+        windows = date_windows(self.interval, start, None)
+        if windows:
+            return [(self.endpoint, {**params, "from": first, "to": last}) for first, last in windows]
+        return [(self.endpoint, {**params, "from": start})]
+
+    def delta_calls(self) -> List[Call]:
+        """Return the requests for new bars, or for the initial history on a first sync."""
+        if self.window_start is not None:
+            return self._calls(self.window_start)
+        start = self.from_date
+        if start is None and self.interval in CHART_WINDOW_DAYS:
+            # One response is capped, so an open-ended first sync takes the most recent full window.
+            start = (date.today() - timedelta(days=CHART_WINDOW_DAYS[self.interval] - 1)).isoformat()
+        return self._calls(start)
+
+    def refetch_calls(self) -> List[Call]:
+        """Return the requests that re-download the stored history from its oldest bar."""
+        oldest = self.store.first_date(self.symbol, self.interval)
+        self.refetch_start = oldest[:10] if oldest is not None else self.window_start
+        return self._calls(self.refetch_start)
+
+    def merge(self, rows: List[Mapping[str, Any]]) -> Optional[SyncResult]:
+        """
+        Merge a delta response into the store.
+
+        Returns:
+            The result, or None if the overlap disagrees with the stored bars
+            and :meth:`refetch_calls` must be fetched and passed to :meth:`replace`
+        """
+        if self.watermark is None:
+            return self.replace(rows, revised=False)
+        if not rows:
+            # Nothing new (e.g. a holiday); an empty body is not evidence of a revision.
+            return SyncResult(self.symbol, 0, False, self.watermark)
+
+        stored = {row["date"]: row for row in self.store.read(self.symbol, self.interval, start=self.window_start)}
+        overlap = {row["date"]: row for row in rows if self.window_start <= row["date"] <= self.watermark}
+        if stored.keys() != overlap.keys() or not all(_same_bar(stored[d], overlap[d]) for d in stored):
+            return None
+
+        new = [row for row in rows if row["date"] > self.watermark]
+        written = self.store.write(self.symbol, self.interval, new) if new else 0
+        return SyncResult(self.symbol, written, False, self.store.last_date(self.symbol, self.interval))
+
+    def replace(self, rows: List[Mapping[str, Any]], revised: bool = True) -> SyncResult:
+        """Replace the stored bars from :attr:`refetch_start` on with a re-download."""
+        written = 0
+        if rows:
+            written = self.store.write(self.symbol, self.interval, rows, replace_from=self.refetch_start)
+        return SyncResult(self.symbol, written, revised, self.store.last_date(self.symbol, self.interval))
+
+
+def _combined_rows(parts: List[List[Mapping[str, Any]]]) -> List[Mapping[str, Any]]:
+    """Merge the responses of one symbol's windows, dropping bars repeated at window edges."""
+    if len(parts) == 1:
+        return parts[0]
+    by_date: Dict[str, Mapping[str, Any]] = {}
+    for part in parts:
+        for row in part:
+            by_date.setdefault(row["date"], row)
+    return list(by_date.values())
+
+
+def _fetch_round(calls: List[List[Call]]) -> Generator[List[Call], List[Any], List[Any]]:
+    """Yield the flattened requests of several plans and return each plan's combined rows."""
+    responses = iter((yield [call for plan_calls in calls for call in plan_calls]))
+    return [_combined_rows([next(responses) for _ in plan_calls]) for plan_calls in calls]
+
+
+def sync_steps(
+    store: PriceStore,
+    symbols: Iterable[str],
+    interval: str,
+    overlap: int,
+    from_date: Optional[str] = None,
+) -> Generator[List[Call], List[Any], Dict[str, SyncResult]]:
+    """
+    Run the clients' ``sync_prices`` as a generator independent of how requests are sent.
+
+    Each step yields the ``(endpoint, params)`` calls to fetch and must be sent
+    their decoded responses in order; the generator returns the result per
+    symbol. :class:`fmp.FMPClient` and :class:`fmp.AsyncFMPClient` drive it
+    with their ``_fetch_many``.
+    """
+    plans = [SyncPlan(store, symbol, interval, overlap, from_date) for symbol in dict.fromkeys(symbols)]
+    results: Dict[str, SyncResult] = {}
+    revised = []
+    deltas = yield from _fetch_round([plan.delta_calls() for plan in plans])
+    for plan, rows in zip(plans, deltas):
+        result = plan.merge(rows)
+        if result is None:
+            revised.append(plan)
+        else:
+            results[plan.symbol] = result
+    if revised:
+        downloads = yield from _fetch_round([plan.refetch_calls() for plan in revised])
+        for plan, rows in zip(revised, downloads):
+            results[plan.symbol] = plan.replace(rows)
+    return {plan.symbol: results[plan.symbol] for plan in plans}
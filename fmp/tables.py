@@ -0,0 +1,131 @@
+"""Tabular (pandas / Arrow) output built straight from decoded API rows.
+
+Both libraries are optional dependencies; install them with
+``pip install "fmp-python[pandas]"`` or ``pip install "fmp-python[arrow]"``.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from fmp.columnar import require_numpy
+from fmp.dates import date_kind
+from fmp.interning import CATEGORICAL_FIELDS
+
+
+def require_pandas():
+    """Import pandas, raising a helpful error if it is missing."""
+    try:
+        import pandas
+    except ImportError as e:
+        raise ImportError('DataFrame output requires pandas; install it with pip install "fmp-python[pandas]"') from e
+    return pandas
+
+
+def require_pyarrow():
+    """Import pyarrow, raising a helpful error if it is missing."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError('Arrow output requires pyarrow; install it with pip install "fmp-python[arrow]"') from e
+    return pyarrow
+
+
+def _kind(model: Type[BaseModel], name: str, annotation: Any) -> str:
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    if annotation in (float, int):
+        return "float"
+    if annotation is bool:
+        return "bool"
+    if name in CATEGORICAL_FIELDS:
+        return "category"
+    return date_kind(model, name) or "string"
+
+
+@lru_cache(maxsize=None)
+def table_columns(model: Type[BaseModel]) -> Tuple[Tuple[str, str, str], ...]:
+    """Return ``(column name, JSON key, kind)`` for each field of ``model``, in field order."""
+    return tuple(
+        (name, info.alias or name, _kind(model, name, info.annotation)) for name, info in model.model_fields.items()
+    )
+
+
+def _values(rows: List[Mapping[str, Any]], key: str, kind: str) -> List[Any]:
+    values = [row.get(key) for row in rows]
+    if kind in ("date", "datetime"):
+        # The API sends "" rather than null for some missing dates.
+        values = [value or None for value in values]
+    return values
+
+
+class Table:
+    """Parser that turns decoded rows into a pandas DataFrame or Arrow table for one model's fields."""
+
+    __slots__ = ("model", "columns")
+
+    def __init__(self, model: Type[BaseModel]):
+        self.model = model
+        self.columns = table_columns(model)
+
+    def to_pandas(self, rows: List[Mapping[str, Any]]):
+        """
+        Build a DataFrame with float64 numbers, ``datetime64`` dates, nullable
+        booleans and categorical exchange/sector/industry-style labels.
+
+        Columns use the model's snake_case field names.
+        """
+        pd = require_pandas()
+        np = require_numpy()
+        dtypes = {"float": np.float64, "date": "datetime64[D]", "datetime": "datetime64[s]"}
+        data: Dict[str, Any] = {}
+        for name, key, kind in self.columns:
+            values = _values(rows, key, kind)
+            if kind in dtypes:
+                data[name] = np.array(values, dtype=dtypes[kind])
+            elif kind == "bool":
+                data[name] = pd.array(values, dtype="boolean")
+            elif kind == "category":
+                data[name] = pd.Categorical(values)
+            else:
+                data[name] = values
+        return pd.DataFrame(data, columns=[name for name, _, _ in self.columns])
+
+    def to_arrow(self, rows: List[Mapping[str, Any]]):
+        """
+        Build a ``pyarrow.Table`` with float64 numbers, ``date32`` dates,
+        ``timestamp[s]`` times and dictionary-encoded categorical labels.
+
+        Columns use the model's snake_case field names.
+        """
+        pa = require_pyarrow()
+        import pyarrow.compute as pc
+
+        # Let Arrow convert the rows in one pass as a struct array keyed by the
+        # JSON names, then rename the fields and parse the date strings.
+        scalar_types = {"float": pa.float64(), "bool": pa.bool_()}
+        struct = pa.struct([(key, scalar_types.get(kind, pa.string())) for _, key, kind in self.columns])
+        columns = pa.array(rows, type=struct).flatten()
+        types = {"date": pa.date32(), "datetime": pa.timestamp("s")}
+        for i, (_, _, kind) in enumerate(self.columns):
+            if kind == "category":
+                columns[i] = columns[i].dictionary_encode()
+            elif kind in types:
+                # The API sends "" rather than null for some missing dates.
+                values = columns[i]
+                values = pc.if_else(pc.equal(values, ""), pa.scalar(None, pa.string()), values)
+                columns[i] = values.cast(types[kind])
+        return pa.Table.from_arrays(columns, names=[name for name, _, _ in self.columns])
+
+
+@lru_cache(maxsize=None)
+def table(model: Type[BaseModel]) -> Table:
+    """Return the shared :class:`Table` parser for ``model``."""
+    return Table(model)
+
+
+def table_outputs(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Parsers for the ``'pandas'`` and ``'arrow'`` output choices of ``model``, for :func:`select_output`."""
+    parser = table(model)
+    return {"pandas": parser.to_pandas, "arrow": parser.to_arrow}
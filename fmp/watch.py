@@ -0,0 +1,342 @@
+"""Polling a watchlist of quotes and reporting what changed.
+
+:class:`QuoteWatcher` fetches the quotes of its symbols in batched requests
+and calls subscribers with only the fields that changed since the previous
+poll. Each symbol has its own polling interval: it drops to ``min_interval``
+when the quote changes and backs off towards ``max_interval`` while it stays
+the same, so quiet symbols cost fewer requests. Polls never exceed the
+watcher's request budget; symbols that do not fit wait for the next poll,
+most overdue first.
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from fmp.parsing import chunk_symbols
+
+# Fields that change on every poll without the quote itself moving.
+DEFAULT_IGNORED_FIELDS = frozenset({"timestamp"})
+
+
+class QuoteUpdate:
+    """
+    Changed fields of one symbol's quote.
+
+    Attributes:
+        symbol: Ticker symbol
+        changes: New values of the fields that changed, keyed by field name
+            (every field with a value on the first poll of a symbol)
+        previous: Values of the same fields before the change
+        quote: The full quote (model or record) just received
+    """
+
+    __slots__ = ("symbol", "changes", "previous", "quote")
+
+    def __init__(self, symbol: str, changes: Dict[str, Any], previous: Dict[str, Any], quote: Any):
+        self.symbol = symbol
+        self.changes = changes
+        self.previous = previous
+        self.quote = quote
+
+    def __repr__(self) -> str:
+        return f"QuoteUpdate(symbol={self.symbol!r}, changes={self.changes!r})"
+
+
+def _quote_fields(quote: Any) -> Dict[str, Any]:
+    if hasattr(quote, "to_dict"):
+        return quote.to_dict()
+    return dict(quote.__dict__)
+
+
+class QuoteWatcher:
+    """
+    Poll quotes for a set of symbols and notify subscribers of changes.
+
+    Works with both clients: :meth:`run` and :meth:`start` poll from a thread
+    with an :class:`fmp.FMPClient`, :meth:`run_async` from a task with an
+    :class:`fmp.AsyncFMPClient`.
+
+    Args:
+        client: Client used for ``get_quotes`` / ``get_crypto_quotes``
+        symbols: Initial symbols to watch
+        crypto: Poll cryptocurrency quotes instead of stock quotes (default: False)
+        min_interval: Seconds between polls of a symbol whose quote just
+            changed (default: 1.0)
+        max_interval: Longest interval an unchanged symbol backs off to
+            (default: 30.0)
+        backoff: Factor the interval grows by after each unchanged poll
+            (default: 2.0)
+        requests_per_minute: Requests the watcher may send per minute;
+            defaults to the rate of the client's ``rate_limiter``, or no limit
+            without one
+        ignore: Fields not compared for changes (default: ``timestamp``)
+        output: 'models' or 'records', passed to the quote endpoint
+        on_error: Called with exceptions raised while polling; without it the
+            runner stops and re-raises
+
+    Attributes:
+        requests: Batch requests sent so far
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        symbols: Iterable[str] = (),
+        crypto: bool = False,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 2.0,
+        requests_per_minute: Optional[float] = None,
+        ignore: Iterable[str] = DEFAULT_IGNORED_FIELDS,
+        output: str = "models",
+        on_error: Optional[Callable[[Exception], Any]] = None,
+    ):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("intervals must satisfy 0 < min_interval <= max_interval")
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        if requests_per_minute is None and client.rate_limiter is not None:
+            requests_per_minute = client.rate_limiter.rate * 60
+        if requests_per_minute is not None and requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+
+        self.client = client
+        self.crypto = crypto
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.requests_per_minute = requests_per_minute
+        self.ignore = frozenset(ignore)
+        self.output = output
+        self.on_error = on_error
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._subscribers: List[Tuple[Callable[[QuoteUpdate], Any], Optional[Set[str]]]] = []
+        # symbol -> (polling interval, monotonic time of the next poll)
+        self._schedule: Dict[str, Tuple[float, float]] = {}
+        self._last: Dict[str, Dict[str, Any]] = {}
+        self._tokens = self._capacity()
+        self._refilled = time.monotonic()
+        self.requests = 0
+        self.add(symbols)
+
+    def _capacity(self) -> float:
+        # Allow one poll's worth of requests per ``min_interval`` to accumulate.
+        if self.requests_per_minute is None:
+            return 0.0
+        return max(1.0, self.requests_per_minute * self.min_interval / 60)
+
+    def add(self, symbols: Iterable[str]) -> None:
+        """Start watching ``symbols``; they are polled on the next cycle."""
+        now = time.monotonic()
+        with self._lock:
+            for symbol in symbols:
+                self._schedule.setdefault(symbol, (self.min_interval, now))
+
+    def remove(self, symbols: Iterable[str]) -> None:
+        """Stop watching ``symbols``."""
+        with self._lock:
+            for symbol in symbols:
+                self._schedule.pop(symbol, None)
+                self._last.pop(symbol, None)
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols currently watched."""
+        with self._lock:
+            return list(self._schedule)
+
+    def interval(self, symbol: str) -> float:
+        """Return the current polling interval of ``symbol`` in seconds."""
+        with self._lock:
+            return self._schedule[symbol][0]
+
+    def subscribe(
+        self, callback: Callable[[QuoteUpdate], Any], symbols: Optional[Iterable[str]] = None
+    ) -> Callable[[QuoteUpdate], Any]:
+        """
+        Call ``callback`` with a :class:`QuoteUpdate` for every change.
+
+        Callbacks run on the polling thread or task; under :meth:`run_async`
+        they may be coroutine functions.
+
+        Args:
+            callback: Function receiving each update
+            symbols: Only report changes for these symbols (default: all)
+
+        Returns:
+            ``callback``, so this can be used as a decorator
+        """
+        with self._lock:
+            self._subscribers.append((callback, set(symbols) if symbols is not None else None))
+        return callback
+
+    def unsubscribe(self, callback: Callable[[QuoteUpdate], Any]) -> None:
+        """Stop calling ``callback``."""
+        with self._lock:
+            self._subscribers = [entry for entry in self._subscribers if entry[0] is not callback]
+
+    def _due(self, now: float) -> List[str]:
+        """Return the symbols to poll now, most overdue first, within the request budget."""
+        with self._lock:
+            due = sorted((at, symbol) for symbol, (_, at) in self._schedule.items() if at <= now)
+            if not due:
+                return []
+            chunks = chunk_symbols([symbol for _, symbol in due], self.client._batch_budget("batch-quote"))
+            if self.requests_per_minute is not None:
+                rate = self.requests_per_minute / 60
+                self._tokens = min(self._capacity(), self._tokens + (now - self._refilled) * rate)
+                self._refilled = now
+                chunks = chunks[: int(self._tokens)]
+                self._tokens -= len(chunks)
+            self.requests += len(chunks)
+            return [symbol for chunk in chunks for symbol in chunk]
+
+    def _updates(self, symbols: List[str], quotes: Dict[str, Any], now: float) -> List[QuoteUpdate]:
+        """Record a poll's quotes, reschedule the polled symbols and return the changes."""
+        updates = []
+        with self._lock:
+            for symbol in symbols:
+                if symbol not in self._schedule:
+                    continue
+                interval = self._schedule[symbol][0]
+                quote = quotes.get(symbol)
+                changes: Dict[str, Any] = {}
+                previous: Dict[str, Any] = {}
+                if quote is not None:
+                    fields = _quote_fields(quote)
+                    last = self._last.get(symbol, {})
+                    for name, value in fields.items():
+                        if name in self.ignore or last.get(name) == value:
+                            continue
+                        if value is None and name not in last:
+                            continue
+                        changes[name] = value
+                        previous[name] = last.get(name)
+                    self._last[symbol] = fields
+                if changes:
+                    interval = self.min_interval
+                    updates.append(QuoteUpdate(symbol, changes, previous, quote))
+                else:
+                    interval = min(interval * self.backoff, self.max_interval)
+                self._schedule[symbol] = (interval, now + interval)
+        return updates
+
+    def _failed(self, symbols: List[str], now: float) -> None:
+        """Back off the symbols of a failed poll so errors are not retried immediately."""
+        with self._lock:
+            for symbol in symbols:
+                if symbol in self._schedule:
+                    interval = min(self._schedule[symbol][0] * self.backoff, self.max_interval)
+                    self._schedule[symbol] = (interval, now + interval)
+
+    def _delay(self, now: float) -> float:
+        """Seconds until the next symbol is due or the budget allows a request, at most ``min_interval``."""
+        with self._lock:
+            if not self._schedule:
+                return self.min_interval
+            delay = min(at for _, at in self._schedule.values()) - now
+            if self.requests_per_minute is not None and self._tokens < 1:
+                delay = max(delay, (1 - self._tokens) * 60 / self.requests_per_minute)
+        return min(max(delay, 0.0), self.min_interval)
+
+    def _fetch_quotes(self, symbols: List[str]) -> Any:
+        if self.crypto:
+            return self.client.get_crypto_quotes(symbols, output=self.output)
+        return self.client.get_quotes(symbols, output=self.output)
+
+    def _listeners(self, symbol: str) -> List[Callable[[QuoteUpdate], Any]]:
+        return [callback for callback, symbols in self._subscribers if symbols is None or symbol in symbols]
+
+    def poll(self) -> List[QuoteUpdate]:
+        """
+        Poll the symbols that are due once and notify subscribers (sync clients).
+
+        If the request fails, the polled symbols back off as if unchanged
+        before the error is raised, so a failing API is not polled in a loop.
+
+        Returns:
+            The updates emitted
+        """
+        symbols = self._due(time.monotonic())
+        if not symbols:
+            return []
+        try:
+            quotes = self._fetch_quotes(symbols)
+        except Exception:
+            self._failed(symbols, time.monotonic())
+            raise
+        updates = self._updates(symbols, quotes, time.monotonic())
+        for update in updates:
+            for callback in self._listeners(update.symbol):
+                callback(update)
+        return updates
+
+    async def poll_async(self) -> List[QuoteUpdate]:
+        """Poll the symbols that are due once and notify subscribers (async clients)."""
+        symbols = self._due(time.monotonic())
+        if not symbols:
+            return []
+        try:
+            quotes = await self._fetch_quotes(symbols)
+        except Exception:
+            self._failed(symbols, time.monotonic())
+            raise
+        updates = self._updates(symbols, quotes, time.monotonic())
+        for update in updates:
+            for callback in self._listeners(update.symbol):
+                result = callback(update)
+                if inspect.isawaitable(result):
+                    await result
+        return updates
+
+    def _handle(self, error: Exception) -> None:
+        if self.on_error is None:
+            raise error
+        self.on_error(error)
+
+    def run(self) -> None:
+        """Poll in the current thread until :meth:`stop` is called."""
+        self._stop.clear()
+        self._loop()
+
+    def _loop(self) -> None:
+        # Does not clear ``_stop``, so a stop() issued before the loop starts is kept.
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                self._handle(e)
+            self._stop.wait(self._delay(time.monotonic()))
+
+    def start(self) -> threading.Thread:
+        """Run :meth:`run` in a daemon thread and return it."""
+        if self._thread is not None and self._thread.is_alive():
+            raise RuntimeError("QuoteWatcher is already running")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="fmp-quote-watcher", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    async def run_async(self) -> None:
+        """Poll in the current task until :meth:`stop` is called or the task is cancelled."""
+        self._stop.clear()
+        while not self._stop.is_set():
+            try:
+                await self.poll_async()
+            except Exception as e:
+                self._handle(e)
+            await asyncio.sleep(self._delay(time.monotonic()))
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the runner, waiting up to ``timeout`` seconds for a started thread to finish."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+            self._thread = None
@@ -2,9 +2,10 @@
 
 import os
 from pathlib import Path
+import httpx
 import pytest
 from dotenv import load_dotenv
-from fmp import FMPClient
+from fmp import AsyncFMPClient, FMPClient
 
 # Load .env from project root
 env_path = Path(__file__).parent.parent / ".env"
@@ -26,3 +27,28 @@ def client(api_key):
     client = FMPClient(api_key=api_key)
     yield client
     client.close()
+
+
+@pytest.fixture
+def mock_client():
+    """Factory for FMP clients that answer requests from an in-process handler."""
+    clients = []
+
+    def factory(handler, **kwargs):
+        client = FMPClient(api_key="test-key", transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def mock_async_client():
+    """Factory for async FMP clients that answer requests from an in-process handler."""
+
+    def factory(handler, **kwargs):
+        return AsyncFMPClient(api_key="test-key", transport=httpx.MockTransport(handler), **kwargs)
+
+    return factory
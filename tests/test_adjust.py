@@ -0,0 +1,121 @@
+"""Tests for local split and dividend adjustment."""
+
+import httpx
+import pytest
+
+from fmp.models import Dividend, StockSplit
+
+np = pytest.importorskip("numpy")
+
+from fmp.adjust import AdjustedPrices, dividend_factors, raw_columns, split_factors  # noqa: E402
+
+SPLITS = [{"symbol": "AAPL", "date": "2024-01-06", "numerator": 4, "denominator": 1}]
+DIVIDENDS = [
+    {"symbol": "AAPL", "date": "2024-01-04", "dividend": 1.0, "adjDividend": 0.25},
+    {"symbol": "AAPL", "date": "2024-01-09", "dividend": 0.5, "adjDividend": 0.5},
+]
+
+
+def _raw_rows(days):
+    """Unadjusted ``non-split-adjusted`` rows: 100 before the 4:1 split on the 6th, 25 after."""
+    rows = []
+    for day in days:
+        price = 100.0 if day < 6 else 25.0
+        rows.append(
+            {
+                "symbol": "AAPL",
+                "date": f"2024-01-{day:02d}",
+                "adjOpen": price,
+                "adjHigh": price + 1,
+                "adjLow": price - 1,
+                "adjClose": price,
+                "volume": 1000,
+            }
+        )
+    return rows[::-1]
+
+
+def test_factors():
+    """Test cumulative split and dividend factors per bar."""
+    dates = np.array([f"2024-01-{day:02d}" for day in range(1, 11)], dtype="datetime64[D]")
+    assert split_factors(dates, SPLITS).tolist() == [4.0] * 5 + [1.0] * 5
+    close = np.array([100.0] * 5 + [25.0] * 5)
+    factors = dividend_factors(dates, close, DIVIDENDS)
+    np.testing.assert_allclose(factors, [0.99 * 0.98] * 3 + [0.98] * 5 + [1.0] * 2)
+    assert dividend_factors(dates[5:], close[5:], DIVIDENDS[:1]).tolist() == [1.0] * 5
+
+
+def test_adjusted_series_and_cache():
+    """Test split and total-return series, computed once and cached."""
+    prices = AdjustedPrices(raw_columns(_raw_rows(range(1, 11))), SPLITS, [Dividend(**row) for row in DIVIDENDS])
+
+    split = prices.split_adjusted()
+    assert split.close.tolist() == [25.0] * 10
+    assert split.volume.tolist() == [4000.0] * 5 + [1000.0] * 5
+    assert prices.split_adjusted() is split
+
+    total = prices.dividend_adjusted()
+    np.testing.assert_allclose(total.close, [25 * 0.99 * 0.98] * 3 + [25 * 0.98] * 5 + [25.0] * 2)
+    np.testing.assert_allclose(total.high[0], 101 / 4 * 0.99 * 0.98)
+    assert prices.raw.close.tolist()[:2] == [100.0, 100.0]
+
+
+def test_cache_invalidated_only_by_effective_events():
+    """Test unchanged or future events keep the cache and a newly effective event drops it."""
+    prices = AdjustedPrices(raw_columns(_raw_rows(range(1, 9))), [StockSplit(**SPLITS[0])], DIVIDENDS)
+    total = prices.dividend_adjusted()
+
+    assert not prices.update_events(splits=SPLITS, dividends=DIVIDENDS)
+    assert prices.dividend_adjusted() is total
+
+    # The dividend on the 9th is after the last bar: known, but not effective yet.
+    assert total.close[0] == pytest.approx(25 * 0.99)
+    future = SPLITS + [{"date": "2024-02-01", "numerator": 2, "denominator": 1}]
+    assert not prices.update_events(splits=future)
+
+    assert prices.append(_raw_rows(range(1, 9))) == 0
+    assert prices.append(_raw_rows([9, 10])) == 2
+    updated = prices.dividend_adjusted()
+    assert updated is not total
+    np.testing.assert_allclose(updated.close[0], 25 * 0.99 * 0.98)
+
+    split = prices.split_adjusted()
+    assert prices.update_events(splits=SPLITS + [{"date": "2024-01-08", "numerator": 2, "denominator": 1}])
+    assert prices.split_adjusted() is not split
+    assert prices.split_adjusted().close[0] == 12.5
+
+
+def test_append_extends_cache():
+    """Test appending bars without new events extends the cached series."""
+    prices = AdjustedPrices(raw_columns(_raw_rows(range(1, 9))), SPLITS, DIVIDENDS[:1])
+    before = prices.split_adjusted()
+    prices.append(_raw_rows([9, 10]))
+    after = prices.split_adjusted()
+    assert len(after) == 10
+    assert after.close.tolist() == [25.0] * 10
+    assert after.volume[:8].tolist() == before.volume.tolist()
+
+
+def test_get_adjusted_prices(mock_client):
+    """Test the client fetches raw bars and events together and models the events."""
+    calls = []
+
+    def handler(request):
+        path = request.url.path.rsplit("/stable/", 1)[-1]
+        calls.append(path)
+        if path == "splits":
+            return httpx.Response(200, json=SPLITS)
+        if path == "dividends":
+            return httpx.Response(200, json=DIVIDENDS)
+        return httpx.Response(200, json=_raw_rows(range(1, 11)))
+
+    client = mock_client(handler)
+    prices = client.get_adjusted_prices("AAPL", from_date="2024-01-01")
+
+    assert sorted(calls) == ["dividends", "historical-price-eod/non-split-adjusted", "splits"]
+    assert len(prices) == 10
+    assert prices.split_adjusted().close.tolist() == [25.0] * 10
+
+    assert client.get_splits("AAPL")[0].numerator == 4
+    dividend = client.get_dividends("AAPL")[0]
+    assert isinstance(dividend, Dividend) and dividend.adj_dividend == 0.25
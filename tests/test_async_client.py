@@ -0,0 +1,106 @@
+"""Tests for the asynchronous client."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from fmp import AsyncFMPClient, FMPAuthError, RetryPolicy
+from fmp.models import Quote, CryptoHistoricalPrice
+
+
+QUOTE = {"symbol": "AAPL", "name": "Apple Inc.", "price": 190.5, "changesPercentage": 1.2, "volume": 1000}
+
+
+def test_async_get_quote(mock_async_client):
+    """Test endpoint methods resolve to parsed models."""
+
+    def handler(request):
+        assert request.url.path.endswith("/quote")
+        assert request.url.params["symbol"] == "AAPL"
+        assert request.url.params["apikey"] == "test-key"
+        return httpx.Response(200, json=[QUOTE])
+
+    async def run():
+        async with mock_async_client(handler) as client:
+            return await client.get_quote("AAPL")
+
+    quotes = asyncio.run(run())
+    assert isinstance(quotes[0], Quote)
+    assert quotes[0].changes_percentage == 1.2
+
+
+def test_async_custom_parser(mock_async_client):
+    """Test endpoints with custom parsing share the sync implementation."""
+
+    def handler(request):
+        return httpx.Response(200, json=[{"date": "2024-01-02 09:30:00", "close": 42000.0, "volume": 3.5}])
+
+    async def run():
+        async with mock_async_client(handler) as client:
+            return await client.get_crypto_intraday("BTCUSD", interval="5min")
+
+    data = asyncio.run(run())
+    assert isinstance(data[0], CryptoHistoricalPrice)
+    assert data[0].symbol == "BTCUSD"
+    assert data[0].price == 42000.0
+
+
+def test_async_concurrency_limit(mock_async_client):
+    """Test no more than max_concurrency requests are in flight."""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=[QUOTE])
+
+    async def run():
+        async with mock_async_client(handler, max_concurrency=3) as client:
+            await asyncio.gather(*(client.get_quote(f"SYM{i}") for i in range(10)))
+
+    asyncio.run(run())
+    assert peak == 3
+
+
+def test_async_concurrency_limit_shared_by_clones(mock_async_client):
+    """Test with_options copies made before any request share the parent's max_concurrency."""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=[QUOTE])
+
+    async def run():
+        async with mock_async_client(handler, max_concurrency=2) as client:
+            clones = [client.with_options(retry=RetryPolicy()) for _ in range(10)]
+            await asyncio.gather(*(clone.get_quote(f"SYM{i}") for i, clone in enumerate(clones)))
+
+    asyncio.run(run())
+    assert peak == 2
+
+
+def test_async_auth_error(mock_async_client):
+    """Test 401 responses raise FMPAuthError."""
+
+    async def run():
+        async with mock_async_client(lambda request: httpx.Response(401)) as client:
+            await client.get_profile("AAPL")
+
+    with pytest.raises(FMPAuthError):
+        asyncio.run(run())
+
+
+def test_async_invalid_concurrency():
+    """Test max_concurrency must be positive."""
+    with pytest.raises(ValueError):
+        AsyncFMPClient(api_key="test-key", max_concurrency=0)
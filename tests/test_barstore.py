@@ -0,0 +1,98 @@
+"""Tests for the memory-mapped bar store."""
+
+import pytest
+
+from fmp.models import CryptoHistoricalPrice, HistoricalPrice
+
+np = pytest.importorskip("numpy")
+
+from fmp.barstore import BarStore  # noqa: E402
+from fmp.columnar import PriceColumns  # noqa: E402
+
+
+def _rows(days, hour="09:30:00"):
+    return [
+        {"date": f"2024-01-{day:02d} {hour}", "open": 1.0, "high": 2.0, "low": 0.5, "close": float(day), "volume": 10}
+        for day in days
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BarStore(tmp_path / "bars")
+    yield store
+    store.close()
+
+
+def test_append_only_adds_newer_bars(store):
+    """Test overlapping downloads append each bar once, in date order."""
+    assert store.append("AAPL", "1min", _rows(range(5, 0, -1))) == 5
+    assert store.append("AAPL", "1min", PriceColumns.from_records(_rows(range(3, 9)))) == 3
+    assert store.append("AAPL", "1min", _rows(range(1, 9))) == 0
+
+    bars = store.read("AAPL", "1min")
+    assert bars.close.tolist() == [float(day) for day in range(1, 9)]
+    assert store.last_date("AAPL", "1min") == np.datetime64("2024-01-08T09:30:00")
+    assert store.symbols("1min") == ["AAPL"]
+
+
+def test_range_query_returns_views(store):
+    """Test date-range reads are inclusive views into the mapped files."""
+    store.append("AAPL", "1min", _rows(range(1, 11)))
+
+    bars = store.read("AAPL", "1min", start="2024-01-03", end="2024-01-05")
+    assert bars.close.tolist() == [3.0, 4.0, 5.0]
+    assert isinstance(bars.close, np.memmap)
+    assert not bars.close.flags.writeable
+
+    assert len(store.read("AAPL", "1min", end="2024-01-05 09:30:00")) == 5
+    assert len(store.read("AAPL", "1min", end="2024-01-05 09:29:59")) == 4
+    assert len(store.read("AAPL", "1min", start="2024-02-01")) == 0
+    assert len(store.read("MSFT", "1min")) == 0
+
+
+def test_append_models_and_light_rows(store):
+    """Test models and single-price crypto rows can feed the store."""
+    prices = [HistoricalPrice(**row) for row in _rows([1, 2], hour="00:00:00")]
+    crypto = [CryptoHistoricalPrice(symbol="BTCUSD", date="2024-01-01", price=42000.0, volume=5.0)]
+
+    store.append("AAPL", "1day", prices)
+    store.append("BTC/USD", "1day", crypto)
+
+    assert store.read("AAPL", "1day").close.tolist() == [1.0, 2.0]
+    btc = store.read("BTC/USD", "1day")
+    assert btc.close.tolist() == [42000.0] and np.isnan(btc.open[0])
+    assert store.symbols("1day") == ["AAPL", "BTC/USD"]
+
+
+def test_reads_see_appends_and_ignore_torn_writes(store):
+    """Test new bars become visible and a partially written append is discarded."""
+    store.append("AAPL", "1min", _rows([1, 2]))
+    assert len(store.read("AAPL", "1min")) == 2
+
+    with open(store._dir("AAPL", "1min") / "close.bin", "ab") as f:
+        f.write(np.float64(99.0).tobytes())
+    assert len(store.read("AAPL", "1min")) == 2
+
+    store.append("AAPL", "1min", _rows([3]))
+    assert store.read("AAPL", "1min").close.tolist() == [1.0, 2.0, 3.0]
+
+
+def test_failed_append_is_not_marked_complete(tmp_path, monkeypatch):
+    """Test days are recorded as complete only after every column was written."""
+    store = BarStore(tmp_path / "bars")
+    assert store.append("AAPL", "1day", _rows([1]), complete=("2024-01-01", "2024-01-01")) == 1
+    real_open = open
+
+    def failing_open(path, *args, **kwargs):
+        if str(path).endswith("close.bin"):
+            raise OSError("disk full")
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", failing_open)
+    with pytest.raises(OSError):
+        store.append("AAPL", "1day", _rows([2, 3]), complete=("2024-01-02", "2024-01-03"))
+    monkeypatch.undo()
+    assert store.complete_ranges("AAPL", "1day") == [("2024-01-01", "2024-01-01")]
+    assert store.read("AAPL", "1day").close.tolist() == [1.0]
+    store.close()
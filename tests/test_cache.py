@@ -0,0 +1,102 @@
+"""Tests for response caching."""
+
+import time
+
+import httpx
+
+from fmp import FMPClient, ResponseCache
+from fmp.cache import MemoryCache, cache_key
+
+
+PROFILE = {"symbol": "AAPL", "price": 190.0, "companyName": "Apple Inc."}
+
+
+def _counting_handler(payload):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json=payload)
+
+    handler.calls = calls
+    return handler
+
+
+def test_cache_key_ignores_api_key_and_order():
+    """Test keys are normalized and never contain the API key."""
+    assert cache_key("profile", {"symbol": "AAPL", "apikey": "secret"}) == "profile?symbol=AAPL"
+    assert cache_key("/quote", {"b": 2, "a": 1}) == cache_key("quote", {"a": 1, "b": 2})
+
+
+def test_repeated_calls_hit_cache(mock_client):
+    """Test a cached endpoint is fetched once."""
+    handler = _counting_handler([PROFILE])
+    cache = ResponseCache()
+    client = mock_client(handler, cache=cache)
+
+    first = client.get_profile("AAPL")
+    second = client.get_profile("AAPL")
+
+    assert first == second
+    assert len(handler.calls) == 1
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+
+
+def test_uncached_endpoints_always_fetch(mock_client):
+    """Test endpoints without a TTL bypass the cache."""
+    handler = _counting_handler([])
+    client = mock_client(handler, cache=ResponseCache())
+
+    client.get_industry_pe("2024-01-02")
+    client.get_industry_pe("2024-01-02")
+    assert len(handler.calls) == 2
+
+
+def test_ttl_expiry(mock_client):
+    """Test entries expire after their endpoint TTL."""
+    handler = _counting_handler([{"symbol": "AAPL", "price": 1.0}])
+    client = mock_client(handler, cache=ResponseCache(ttls={"quote": 0.05}))
+
+    client.get_quote("AAPL")
+    time.sleep(0.06)
+    client.get_quote("AAPL")
+    assert len(handler.calls) == 2
+
+
+def test_ttl_lookup_by_endpoint_prefix():
+    """Test TTLs match full paths first, then the first path segment."""
+    cache = ResponseCache(ttls={"historical-chart": 30, "news/stock": 5})
+    assert cache.ttl_for("historical-chart/5min") == 30
+    assert cache.ttl_for("news/stock") == 5
+    assert cache.ttl_for("news/general-latest") == 60
+    assert cache.ttl_for("industry_pe") == 0
+
+
+def test_lru_eviction():
+    """Test the memory tier evicts least recently used entries."""
+    memory = MemoryCache(max_entries=2)
+    expires = time.time() + 60
+    memory.set("a", b"1", expires)
+    memory.set("b", b"2", expires)
+    memory.get("a")
+    memory.set("c", b"3", expires)
+
+    assert memory.get("b") is None
+    assert memory.get("a") == b"1"
+    assert memory.evictions == 1
+
+
+def test_disk_tier_persists(tmp_path):
+    """Test responses survive a new client through the on-disk store."""
+    handler = _counting_handler([PROFILE])
+    path = tmp_path / "cache.sqlite"
+
+    for _ in range(2):
+        cache = ResponseCache(path=path)
+        with FMPClient(api_key="test-key", cache=cache, transport=httpx.MockTransport(handler)) as client:
+            assert client.get_profile("AAPL")[0].company_name == "Apple Inc."
+        cache.close()
+
+    assert len(handler.calls) == 1
+    assert cache.stats["disk_hits"] == 1
@@ -0,0 +1,161 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from fmp import FMPAPIError
+from fmp.coalesce import RequestCoalescer
+
+
+def _slow_handler(status=200, delay=0.05):
+    calls = []
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            calls.append(request)
+        threading.Event().wait(delay)
+        return httpx.Response(status, json=[{"symbol": "SPY", "price": 500.0}])
+
+    handler.calls = calls
+    return handler
+
+
+def _run_threads(fn, count=8):
+    results, errors = [], []
+
+    def target():
+        try:
+            results.append(fn())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_identical_calls_share_request(mock_client):
+    """Test threads asking for the same quote trigger one HTTP request."""
+    handler = _slow_handler()
+    client = mock_client(handler)
+
+    results, errors = _run_threads(lambda: client.get_quote("SPY"))
+
+    assert not errors
+    assert len(results) == 8
+    assert len(handler.calls) == 1
+    assert client.coalescer.stats["coalesced"] == 7
+
+
+def test_errors_are_shared(mock_client):
+    """Test every waiter receives the leader's exception."""
+    handler = _slow_handler(status=500)
+    client = mock_client(handler)
+
+    results, errors = _run_threads(lambda: client.get_quote("SPY"), count=4)
+
+    assert not results
+    assert len(errors) == 4
+    assert all(isinstance(e, FMPAPIError) for e in errors)
+    assert len(handler.calls) == 1
+
+
+def test_different_params_not_coalesced(mock_client):
+    """Test distinct requests are sent separately."""
+    handler = _slow_handler(delay=0)
+    client = mock_client(handler)
+
+    client.get_quote("SPY")
+    client.get_quote("QQQ")
+    assert len(handler.calls) == 2
+
+
+def test_coalescing_can_be_disabled(mock_client):
+    """Test coalesce=False sends every call."""
+    handler = _slow_handler()
+    client = mock_client(handler, coalesce=False)
+
+    _run_threads(lambda: client.get_quote("SPY"), count=3)
+    assert client.coalescer is None
+    assert len(handler.calls) == 3
+
+
+def test_sequential_calls_are_not_memoized():
+    """Test finished calls are forgotten."""
+    coalescer = RequestCoalescer()
+    counter = iter(range(10))
+    assert coalescer.do("k", lambda: next(counter)) == 0
+    assert coalescer.do("k", lambda: next(counter)) == 1
+
+
+def test_async_coalescing(mock_async_client):
+    """Test concurrent coroutines share one request and its errors."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        if request.url.params["symbol"] == "BAD":
+            return httpx.Response(500)
+        return httpx.Response(200, json=[{"symbol": "SPY", "price": 500.0}])
+
+    async def run():
+        async with mock_async_client(handler) as client:
+            quotes = await asyncio.gather(*(client.get_quote("SPY") for _ in range(5)))
+            errors = await asyncio.gather(*(client.get_quote("BAD") for _ in range(3)), return_exceptions=True)
+            return quotes, errors, client.coalescer.stats
+
+    quotes, errors, stats = asyncio.run(run())
+    assert len(calls) == 2
+    assert all(q[0].symbol == "SPY" for q in quotes)
+    assert all(isinstance(e, FMPAPIError) for e in errors)
+    assert stats == {"coalesced": 6, "in_flight": 0}
+
+
+def test_async_follower_cancellation_does_not_cancel_leader(mock_async_client):
+    """Test a cancelled waiter leaves the shared request running."""
+
+    async def handler(request):
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json=[{"symbol": "SPY", "price": 500.0}])
+
+    async def run():
+        async with mock_async_client(handler) as client:
+            leader = asyncio.ensure_future(client.get_quote("SPY"))
+            follower = asyncio.ensure_future(client.get_quote("SPY"))
+            await asyncio.sleep(0.005)
+            follower.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await follower
+            return await leader
+
+    assert asyncio.run(run())[0].price == 500.0
+
+
+def test_async_leader_cancellation_does_not_cancel_followers(mock_async_client):
+    """Test cancelling the caller that started the request leaves the others' result intact."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json=[{"symbol": "SPY", "price": 500.0}])
+
+    async def run():
+        async with mock_async_client(handler) as client:
+            leader = asyncio.ensure_future(client.get_quote("SPY"))
+            await asyncio.sleep(0.005)
+            follower = asyncio.ensure_future(client.get_quote("SPY"))
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(leader, 0.005)
+            return await follower
+
+    assert asyncio.run(run())[0].price == 500.0
+    assert len(calls) == 1
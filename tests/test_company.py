@@ -1,5 +1,8 @@
 """Tests for company endpoints."""
 
+import httpx
+import pytest
+
 from fmp.models import CompanyProfile, SearchResult, StockScreenerResult, StockNews
 
 
@@ -68,3 +71,70 @@ def test_get_stock_news_latest(client):
     assert isinstance(results[0], StockNews)
     assert results[0].title is not None
     assert results[0].url is not None
+
+
+def _screener_rows():
+    # Build each label at runtime so equal values start out as distinct objects.
+    return [
+        {
+            "symbol": f"SYM{i}",
+            "companyName": f"Company {i}",
+            "sector": "".join(["Tech", "nology"]),
+            "industry": "".join(["Soft", "ware"]),
+            "exchange": "NASDAQ" if i % 2 else "".join(["NY", "SE"]),
+            "country": "".join(["U", "S"]),
+            "isEtf": i == 0,
+            "price": 10.0 + i,
+        }
+        for i in range(4)
+    ]
+
+
+def test_screen_stocks_interns_labels(mock_client):
+    """Test intern_strings shares one string object per distinct label."""
+    client = mock_client(lambda request: httpx.Response(200, json=_screener_rows()))
+
+    plain = client.screen_stocks()
+    interned = client.with_options(intern_strings=True).screen_stocks()
+
+    assert [row.model_dump() for row in plain] == [row.model_dump() for row in interned]
+    assert len({id(row.sector) for row in interned}) == 1
+    assert len({id(row.exchange) for row in interned}) == 2
+    assert interned[0].company_name == "Company 0"
+
+
+def test_iter_stock_list_interns_labels(mock_client):
+    """Test interning also applies to streamed dict records."""
+    rows = [{"symbol": f"S{i}", "exchangeShortName": "".join(["NY", "SE"]), "type": "stock"} for i in range(3)]
+    client = mock_client(lambda request: httpx.Response(200, json=rows), intern_strings=True)
+
+    records = list(client.iter_stock_list())
+
+    assert records == rows
+    assert len({id(record["exchangeShortName"]) for record in records}) == 1
+
+
+def test_screen_stocks_pandas_categoricals(mock_client):
+    """Test DataFrame output makes the labels categorical."""
+    pd = pytest.importorskip("pandas")
+    client = mock_client(lambda request: httpx.Response(200, json=_screener_rows()))
+
+    frame = client.screen_stocks(output="pandas")
+
+    assert isinstance(frame["sector"].dtype, pd.CategoricalDtype)
+    assert sorted(frame["exchange"].cat.categories) == ["NASDAQ", "NYSE"]
+    assert frame["is_etf"].dtype == "boolean"
+    assert frame["company_name"].tolist()[0] == "Company 0"
+
+
+def test_screen_stocks_arrow_dictionary(mock_client):
+    """Test Arrow output dictionary-encodes the labels."""
+    pa = pytest.importorskip("pyarrow")
+    client = mock_client(lambda request: httpx.Response(200, json=_screener_rows()))
+
+    table = client.screen_stocks(output="arrow")
+
+    assert pa.types.is_dictionary(table.schema.field("industry").type)
+    assert table.column("exchange").to_pylist() == ["NYSE", "NASDAQ", "NYSE", "NASDAQ"]
+    assert table.schema.field("is_etf").type == pa.bool_()
+    assert table.schema.field("company_name").type == pa.string()
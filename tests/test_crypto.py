@@ -1,7 +1,11 @@
 """Tests for cryptocurrency endpoints."""
 
+import asyncio
+
+import httpx
 import pytest
 from fmp.models import CryptoQuote, CryptoInfo, CryptoHistoricalPrice, CryptoNews
+from fmp.records import CryptoHistoricalPriceRecord
 
 
 def test_get_crypto_quote(client):
@@ -51,3 +55,49 @@ def test_search_crypto_news(client):
     assert len(news) > 0
     assert isinstance(news[0], CryptoNews)
     assert news[0].title is not None
+
+
+def test_get_crypto_quotes(mock_async_client):
+    """Test batched crypto quotes on the async client."""
+
+    def handler(request):
+        symbols = request.url.params["symbols"].split(",")
+        return httpx.Response(200, json=[{"symbol": s, "price": 2.0} for s in symbols if s != "NOPEUSD"])
+
+    async def run():
+        async with mock_async_client(handler) as client:
+            return await client.get_crypto_quotes(["BTCUSD", "ETHUSD", "NOPEUSD"])
+
+    quotes = asyncio.run(run())
+    assert isinstance(quotes["BTCUSD"], CryptoQuote)
+    assert set(quotes) == {"BTCUSD", "ETHUSD"}
+    assert quotes.missing == ["NOPEUSD"]
+
+
+def test_get_crypto_intraday_records(mock_client):
+    """Test intraday record output fills the symbol and maps close to price."""
+    bars = [{"date": "2024-01-02 09:30:00", "open": 1.0, "close": 1.2, "volume": 5.0}]
+    client = mock_client(lambda request: httpx.Response(200, json=bars))
+
+    records = client.get_crypto_intraday("BTCUSD", output="records")
+
+    assert records == [CryptoHistoricalPriceRecord(symbol="BTCUSD", date="2024-01-02 09:30:00", price=1.2, volume=5.0)]
+    assert isinstance(records[0].to_model(), CryptoHistoricalPrice)
+
+
+def test_get_crypto_intraday_splits_long_ranges(mock_async_client):
+    """Test long crypto ranges are fetched as concurrent windows on the async client."""
+
+    def handler(request):
+        start = request.url.params["from"]
+        if start == "2024-01-04":
+            return httpx.Response(200, json=[])
+        return httpx.Response(200, json=[{"date": f"{start} 00:00:00", "close": 1.0, "volume": 2.0}])
+
+    async def run():
+        async with mock_async_client(handler) as client:
+            return await client.get_crypto_intraday("BTCUSD", from_date="2024-01-01", to_date="2024-01-09")
+
+    bars = asyncio.run(run())
+    assert [bar.date for bar in bars] == ["2024-01-07 00:00:00", "2024-01-01 00:00:00"]
+    assert bars.gaps == [("2024-01-04", "2024-01-06")]
@@ -0,0 +1,84 @@
+"""Tests for typed date fields."""
+
+from datetime import date, datetime
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from fmp.dates import typed_model
+from fmp.models import CryptoInfo, HistoricalPrice, IncomeStatement
+
+INCOME_ROW = {
+    "date": "2024-09-28",
+    "symbol": "AAPL",
+    "reportedCurrency": "USD",
+    "cik": "0000320193",
+    "fillingDate": "",
+    "acceptedDate": "2024-11-01 06:01:36",
+    "period": "FY",
+    "revenue": 391035000000,
+}
+
+
+def test_typed_model_fields():
+    """Test the typed variant only changes the date fields."""
+    typed = typed_model(IncomeStatement)
+    assert typed is typed_model(IncomeStatement)
+    assert issubclass(typed, IncomeStatement)
+
+    statement = typed.model_validate(INCOME_ROW)
+    assert statement.date == date(2024, 9, 28)
+    assert statement.accepted_date == datetime(2024, 11, 1, 6, 1, 36)
+    assert statement.filling_date is None
+    assert statement.revenue == 391035000000.0
+
+
+def test_typed_model_rejects_bad_dates():
+    """Test malformed dates still fail validation."""
+    with pytest.raises(ValidationError):
+        typed_model(IncomeStatement).model_validate({**INCOME_ROW, "date": "28/09/2024"})
+
+
+def test_client_typed_dates(mock_client):
+    """Test typed_dates swaps models for their typed-date variants."""
+    client = mock_client(lambda request: httpx.Response(200, json=[INCOME_ROW]))
+
+    [plain] = client.get_income_statement("AAPL")
+    [typed] = client.with_options(typed_dates=True).get_income_statement("AAPL")
+
+    assert plain.date == "2024-09-28"
+    assert isinstance(typed, IncomeStatement)
+    assert typed.date == date(2024, 9, 28)
+    assert typed.accepted_date == datetime(2024, 11, 1, 6, 1, 36)
+    assert typed.filling_date is None
+
+
+def test_price_dates_keep_time_of_day(mock_client):
+    """Test price bars type their dates as datetimes for intraday series."""
+    bars = [
+        {"date": "2024-01-02 09:30:00", "open": 1.0, "high": 1.5, "low": 0.5, "close": 1.2, "volume": 100},
+        {"date": "2024-01-02", "open": 1.0, "high": 1.5, "low": 0.5, "close": 1.2, "volume": 100},
+    ]
+    client = mock_client(lambda request: httpx.Response(200, json=bars), typed_dates=True)
+
+    prices = client.get_historical_chart("AAPL", interval="5min")
+
+    assert isinstance(prices[0], HistoricalPrice)
+    assert [bar.date for bar in prices] == [datetime(2024, 1, 2, 9, 30), datetime(2024, 1, 2)]
+
+
+def test_crypto_typed_dates(mock_client):
+    """Test the custom crypto parsers and streams honour typed_dates."""
+
+    def handler(request):
+        if request.url.path.endswith("cryptocurrency-list"):
+            return httpx.Response(200, json=[{"symbol": "BTCUSD", "name": "Bitcoin", "icoDate": "2009-01-03"}])
+        return httpx.Response(200, json=[{"date": "2024-01-02 09:30:00", "close": 1.2, "volume": 5.0}])
+
+    client = mock_client(handler, typed_dates=True)
+
+    assert client.get_crypto_intraday("BTCUSD")[0].date == datetime(2024, 1, 2, 9, 30)
+    [info] = client.iter_crypto_list()
+    assert isinstance(info, CryptoInfo)
+    assert info.ico_date == date(2009, 1, 3)
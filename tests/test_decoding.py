@@ -0,0 +1,38 @@
+"""Tests for JSON decode backends."""
+
+import math
+
+import pytest
+
+from fmp import decoding
+
+
+@pytest.mark.parametrize("backend", decoding.available_backends())
+def test_backends_agree(backend):
+    """Test every installed backend decodes API payloads identically."""
+    body = b'[{"symbol": "AAPL", "price": 190.5, "volume": 123456789, "name": "\\u00c9cole", "isEtf": false}]'
+    assert decoding.get_loads(backend)(body) == decoding.get_loads("json")(body)
+
+
+@pytest.mark.parametrize("backend", decoding.available_backends())
+def test_falls_back_to_stdlib(backend):
+    """Test bodies a fast backend rejects still decode."""
+    assert math.isnan(decoding.get_loads(backend)(b'[{"pe": NaN}]')[0]["pe"])
+
+
+def test_stdlib_always_available():
+    """Test the standard library backend is the last resort."""
+    assert decoding.available_backends()[-1] == "json"
+    assert decoding.BACKEND in decoding.available_backends()
+
+
+def test_unknown_backend():
+    """Test unknown backend names are rejected."""
+    with pytest.raises(ValueError):
+        decoding.get_loads("yaml")
+
+
+def test_invalid_json_raises_value_error():
+    """Test malformed bodies raise ValueError regardless of backend."""
+    with pytest.raises(ValueError):
+        decoding.loads(b"[1,")
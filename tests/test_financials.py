@@ -1,6 +1,13 @@
 """Tests for financial statements endpoints."""
 
+import json
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
 from fmp.models import IncomeStatement, BalanceSheet, CashFlowStatement, FinancialGrowth
+from fmp.parsing import model_list
 
 
 def test_get_income_statement(client):
@@ -41,3 +48,71 @@ def test_get_financial_growth(client):
     assert len(growth) > 0
     assert isinstance(growth[0], FinancialGrowth)
     assert growth[0].symbol == "AAPL"
+
+
+INCOME_ROW = {
+    "date": "2024-09-28",
+    "symbol": "AAPL",
+    "reportedCurrency": "USD",
+    "cik": "0000320193",
+    "acceptedDate": "2024-11-01 06:01:36",
+    "period": "FY",
+    "revenue": 391035000000,
+    "netIncome": 93736000000,
+    "epsdiluted": 6.08,
+}
+
+
+def test_income_statement_validated_from_bytes(mock_client):
+    """Test statements are validated straight from the response body."""
+    client = mock_client(lambda request: httpx.Response(200, json=[INCOME_ROW]))
+    statements = client.get_income_statement("AAPL")
+    assert statements == [IncomeStatement(**INCOME_ROW)]
+    assert statements[0].eps_diluted == 6.08
+
+
+def test_bulk_validation_matches_per_row():
+    """Test the bulk parser accepts the same input as per-row construction."""
+    parser = model_list(IncomeStatement)
+    assert parser is model_list(IncomeStatement)
+    assert parser.from_json(json.dumps([INCOME_ROW]).encode()) == parser([INCOME_ROW])
+
+
+def test_bulk_validation_errors(mock_client):
+    """Test invalid rows raise pydantic validation errors."""
+    client = mock_client(lambda request: httpx.Response(200, json=[{"symbol": "AAPL"}]))
+    with pytest.raises(ValidationError):
+        client.get_balance_sheet("AAPL")
+
+
+def test_income_statement_pandas(mock_client):
+    """Test DataFrame output uses field names, float64 numbers and datetime dates."""
+    pd = pytest.importorskip("pandas")
+    client = mock_client(lambda request: httpx.Response(200, json=[INCOME_ROW, {**INCOME_ROW, "fillingDate": ""}]))
+
+    frame = client.get_income_statement("AAPL", output="pandas")
+
+    assert list(frame.columns) == list(IncomeStatement.model_fields)
+    assert frame["revenue"].dtype == "float64"
+    assert frame["eps_diluted"].tolist() == [6.08, 6.08]
+    assert pd.api.types.is_datetime64_any_dtype(frame["date"])
+    assert frame["accepted_date"][0] == pd.Timestamp("2024-11-01 06:01:36")
+    assert frame["filling_date"].isna().all()
+    assert frame["gross_profit"].isna().all()
+    assert frame["symbol"].tolist() == ["AAPL", "AAPL"]
+
+
+def test_financial_growth_arrow(mock_client):
+    """Test Arrow output types dates and numbers without building models."""
+    pa = pytest.importorskip("pyarrow")
+    row = {"symbol": "AAPL", "date": "2024-09-28", "period": "FY", "revenueGrowth": 0.02, "ebitgrowth": None}
+    client = mock_client(lambda request: httpx.Response(200, json=[row]))
+
+    table = client.get_financial_growth("AAPL", output="arrow")
+
+    assert table.num_rows == 1
+    assert table.schema.field("date").type == pa.date32()
+    assert table.schema.field("revenue_growth").type == pa.float64()
+    assert table.column("revenue_growth").to_pylist() == [0.02]
+    assert table.column("ebit_growth").null_count == 1
+    assert table.schema.field("symbol").type == pa.string()
@@ -0,0 +1,60 @@
+"""Tests that importing the package stays cheap."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run(code):
+    """Run ``code`` in a fresh interpreter and return its stdout and stderr."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return result.stdout, result.stderr
+
+
+def _import_time_us(stderr, module):
+    """Cumulative import time of ``module`` in microseconds from ``-X importtime`` output."""
+    for line in stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1])
+    raise AssertionError(f"{module} not in import trace")
+
+
+def test_import_fmp_is_lazy():
+    """Test ``import fmp`` loads neither httpx nor any model module."""
+    stdout, stderr = _run(
+        "import sys, fmp; print(sorted(m for m in sys.modules if m == 'httpx' or m.startswith('fmp.')))"
+    )
+    assert stdout.strip() == "['fmp.exceptions']"
+    # Eager imports took ~300ms; allow plenty of headroom for slow machines.
+    assert _import_time_us(stderr, "fmp") < 50_000
+
+
+def test_client_import_defers_model_schemas():
+    """Test importing the client does not build model schemas until they are used."""
+    stdout, _ = _run(
+        "from fmp import FMPClient\n"
+        "from fmp.models import IncomeStatement, Quote\n"
+        "print(IncomeStatement.__pydantic_complete__, Quote.__pydantic_complete__)\n"
+        "Quote.model_validate({'symbol': 'AAPL', 'price': 1.0})\n"
+        "print(IncomeStatement.__pydantic_complete__, Quote.__pydantic_complete__)"
+    )
+    assert stdout.split() == ["False", "False", "False", "True"]
+
+
+def test_lazy_attributes():
+    """Test lazy names resolve, are listed, and unknown names still raise."""
+    import fmp
+    import fmp.models
+
+    assert fmp.FMPClient.__name__ == "FMPClient"
+    assert fmp.models.Quote is fmp.Quote
+    assert set(fmp.__all__) <= set(dir(fmp))
+    with pytest.raises(AttributeError):
+        fmp.NotAThing
@@ -0,0 +1,130 @@
+"""Tests for the vectorized indicators."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fmp.columnar import PriceColumns, PriceMatrix  # noqa: E402
+from fmp.indicators import ATR, EMA, RSI, SMA, VWAP, Bollinger, atr, bollinger, ema, rsi, sma, vwap  # noqa: E402
+
+
+@pytest.fixture
+def bars():
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(size=500))
+    return {
+        "high": close + rng.uniform(0, 1, 500),
+        "low": close - rng.uniform(0, 1, 500),
+        "close": close,
+        "volume": rng.integers(1, 1000, 500).astype(float),
+        "date": np.datetime64("2024-01-02T09:30") + np.arange(500) * np.timedelta64(5, "m"),
+    }
+
+
+def _wilder(values, period):
+    average, out = values[0], []
+    for value in values:
+        average += (value - average) / period
+        out.append(average)
+    return np.array(out)
+
+
+def test_matches_reference_loops(bars):
+    """Test each indicator against a straightforward per-bar implementation."""
+    close, high, low = bars["close"], bars["high"], bars["low"]
+
+    expected_sma = [np.nan] * 9 + [close[i - 9 : i + 1].mean() for i in range(9, 500)]
+    np.testing.assert_allclose(sma(close, 10), expected_sma)
+
+    alpha, average, expected_ema = 2 / 21, close[0], []
+    for value in close:
+        average = (1 - alpha) * average + alpha * value
+        expected_ema.append(average)
+    np.testing.assert_allclose(ema(close, 20), expected_ema)
+
+    change = np.diff(close)
+    gain, loss = _wilder(np.maximum(change, 0), 14), _wilder(np.maximum(-change, 0), 14)
+    expected_rsi = 100 - 100 / (1 + gain / loss)
+    result = rsi(close)
+    assert np.isnan(result[:14]).all()
+    np.testing.assert_allclose(result[14:], expected_rsi[13:])
+
+    previous = np.r_[np.nan, close[:-1]]
+    true_range = np.nanmax([high - low, np.abs(high - previous), np.abs(low - previous)], axis=0)
+    np.testing.assert_allclose(atr(high, low, close)[13:], _wilder(true_range, 14)[13:])
+
+    middle, upper, lower = bollinger(close)
+    std = np.array([close[i - 19 : i + 1].std() for i in range(19, 500)])
+    np.testing.assert_allclose(upper[19:] - middle[19:], 2 * std, atol=1e-9)
+    np.testing.assert_allclose(middle[19:] - lower[19:], 2 * std, atol=1e-9)
+
+
+def test_vwap_restarts_each_day(bars):
+    """Test the session VWAP restarts at midnight and the running VWAP does not."""
+    typical = (bars["high"] + bars["low"] + bars["close"]) / 3
+    volume = bars["volume"]
+    # 500 five-minute bars from 09:30 cross midnight at bar 174.
+    split = 174
+    session = vwap(bars["high"], bars["low"], bars["close"], volume, bars["date"])
+    np.testing.assert_allclose(session[split - 1], np.sum(typical[:split] * volume[:split]) / volume[:split].sum())
+    np.testing.assert_allclose(session[split], typical[split])
+    running = vwap(bars["high"], bars["low"], bars["close"], volume)
+    np.testing.assert_allclose(running[-1], np.sum(typical * volume) / volume.sum())
+
+
+@pytest.mark.parametrize("cuts", [(1,), (13, 14, 15), (250,), (499,)])
+def test_incremental_updates_match_full_computation(bars, cuts):
+    """Test feeding bars in pieces gives the same output as one full computation."""
+    pieces = np.split(np.arange(500), cuts)
+
+    def feed(indicator, *names):
+        outputs = [indicator.update(*(bars[name][piece] for name in names)) for piece in pieces]
+        if isinstance(outputs[0], tuple):
+            return tuple(np.concatenate(parts) for parts in zip(*outputs))
+        return np.concatenate(outputs)
+
+    close = bars["close"]
+    np.testing.assert_allclose(feed(SMA(20), "close"), sma(close, 20))
+    np.testing.assert_allclose(feed(EMA(30), "close"), ema(close, 30))
+    np.testing.assert_allclose(feed(RSI(), "close"), rsi(close))
+    np.testing.assert_allclose(feed(ATR(), "high", "low", "close"), atr(bars["high"], bars["low"], close))
+    np.testing.assert_allclose(feed(Bollinger(), "close"), bollinger(close))
+    np.testing.assert_allclose(
+        feed(VWAP(), "high", "low", "close", "volume", "date"),
+        vwap(bars["high"], bars["low"], close, bars["volume"], bars["date"]),
+    )
+
+
+def test_matrix_rows_match_single_series(bars):
+    """Test a symbol x time matrix gives each row's own result, with NaN where a symbol has no bar."""
+    close = bars["close"]
+    nan = np.full(500, np.nan)
+    full = PriceColumns(bars["date"], close, bars["high"], bars["low"], close, bars["volume"], nan)
+    doubled = close[100:] * 2
+    late = PriceColumns(bars["date"][100:], doubled, doubled, doubled, doubled, bars["volume"][100:], nan[100:])
+    matrix = PriceMatrix.from_columns({"AAA": full, "BBB": late})
+    assert matrix.close.shape == (2, 500)
+    assert np.isnan(matrix.close[1, :100]).all()
+    assert matrix.row("BBB").close.tolist() == late.close.tolist()
+
+    for compute in (lambda x: sma(x, 10), lambda x: ema(x, 10), rsi, lambda x: bollinger(x)[1]):
+        result = compute(matrix.close)
+        np.testing.assert_allclose(result[0], compute(close))
+        assert np.isnan(result[1, :100]).all()
+        np.testing.assert_allclose(result[1, 100:], compute(late.close))
+
+
+def test_missing_bars_are_skipped():
+    """Test NaN bars give NaN output without resetting exponential averages."""
+    values = np.array([1.0, 2.0, np.nan, 4.0])
+    result = ema(values, 3)
+    assert np.isnan(result[2])
+    assert result[3] == pytest.approx(0.5 * 1.5 + 0.5 * 4.0)
+    assert np.isnan(sma(values, 2)[2:]).all()
+
+    with pytest.raises(ValueError):
+        EMA(1)
+    indicator = SMA(3)
+    indicator.update(np.ones((2, 5)))
+    with pytest.raises(ValueError):
+        indicator.update(np.ones((3, 5)))
@@ -1,6 +1,13 @@
 """Tests for client initialization."""
 
-from fmp import FMPClient
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from fmp import AsyncFMPClient, FMPClient
 
 
 def test_client_initialization(api_key):
@@ -30,3 +37,89 @@ def test_context_manager(api_key):
     """Test client works as context manager."""
     with FMPClient(api_key=api_key) as client:
         assert client.api_key == api_key
+
+
+@pytest.fixture
+def local_server():
+    """Run a keep-alive HTTP/1.1 server answering every request with an empty JSON list."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"[]")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_connection_pool_options():
+    """Test pool, keep-alive and timeout settings reach the HTTP client."""
+    with FMPClient(
+        api_key="test-key",
+        timeout=20.0,
+        connect_timeout=3.0,
+        read_timeout=45.0,
+        max_connections=50,
+        max_keepalive_connections=10,
+        keepalive_expiry=30.0,
+    ) as client:
+        timeout = client._client.timeout
+        assert (timeout.connect, timeout.read, timeout.write) == (3.0, 45.0, 20.0)
+        pool = client._client._transport._pool
+        assert pool._max_connections == 50
+        assert pool._max_keepalive_connections == 10
+        assert pool._keepalive_expiry == 30.0
+
+
+def test_custom_transport():
+    """Test an injected transport is used for requests."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+    with FMPClient(api_key="test-key", transport=transport) as client:
+        assert client._client._transport is transport
+        assert client.get_quote("AAPL") == []
+
+
+def test_connection_reuse_stats(local_server):
+    """Test keep-alive connections are reused and counted."""
+    with FMPClient(api_key="test-key", base_url=local_server, coalesce=False) as client:
+        for _ in range(5):
+            client.get_industry_pe("2024-01-02")
+        stats = client.connection_stats.stats
+
+    assert stats["requests"] == 5
+    assert stats["connections_opened"] == 1
+    assert stats["reused"] == 4
+    assert stats["reuse_ratio"] == 0.8
+
+
+def test_async_connection_reuse_stats(local_server):
+    """Test the async client reports connection reuse too."""
+
+    async def run():
+        async with AsyncFMPClient(api_key="test-key", base_url=local_server) as client:
+            for _ in range(3):
+                await client.get_industry_pe("2024-01-02")
+            return client.connection_stats.stats
+
+    stats = asyncio.run(run())
+    assert stats["requests"] == 3
+    assert stats["connections_opened"] == 1
+
+
+def test_http2_enabled():
+    """Test HTTP/2 can be switched on when h2 is installed."""
+    pytest.importorskip("h2")
+    with FMPClient(api_key="test-key", http2=True) as client:
+        assert client._client._transport._pool._http2 is True
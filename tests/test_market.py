@@ -1,6 +1,14 @@
 """Tests for market endpoints."""
 
-from fmp.models import Quote, HistoricalPrice
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from fmp.columnar import PriceColumns
+from fmp.models import Quote, QuoteBatch, HistoricalPrice
+from fmp.parsing import chunk_symbols
+from fmp.ranges import PriceSeries, date_windows
+from fmp.records import HistoricalPriceRecord, QuoteRecord
 
 
 def test_get_quote(client):
@@ -37,3 +45,221 @@ def test_get_historical_price_light(client):
     data = client.get_historical_price("AAPL", price_type="light", timeseries=5)
     assert isinstance(data, list)
     assert len(data) > 0
+
+
+def _batch_quote_handler(calls):
+    """Answer batch-quote requests with a quote for every symbol except 'MISSING'."""
+
+    def handler(request):
+        symbols = request.url.params["symbols"].split(",")
+        calls.append(symbols)
+        return httpx.Response(
+            200, json=[{"symbol": s, "price": 1.0} for s in symbols if s != "MISSING"]
+        )
+
+    return handler
+
+
+def test_get_quotes_batches_symbols(mock_client):
+    """Test get_quotes splits large watchlists and merges the results."""
+    calls = []
+    client = mock_client(_batch_quote_handler(calls))
+    symbols = [f"SYM{i}" for i in range(1000)] + ["MISSING", "SYM1"]
+
+    quotes = client.get_quotes(symbols)
+
+    assert isinstance(quotes, QuoteBatch)
+    assert len(calls) > 1
+    assert sum(len(batch) for batch in calls) == 1001
+    assert len(quotes) == 1000
+    assert isinstance(quotes["SYM999"], Quote)
+    assert quotes.missing == ["MISSING"]
+
+
+def test_chunk_symbols_respects_budget():
+    """Test symbol chunks never exceed the character budget."""
+    chunks = chunk_symbols([f"S{i}" for i in range(500)], 100)
+    assert all(len("%2C".join(chunk)) <= 100 for chunk in chunks)
+    assert [s for chunk in chunks for s in chunk] == [f"S{i}" for i in range(500)]
+
+
+def test_get_historical_chart_columns(mock_client):
+    """Test columnar output builds sorted NumPy arrays."""
+    np = pytest.importorskip("numpy")
+    bars = [
+        {"date": "2024-01-02 09:35:00", "open": 2.0, "high": 2.5, "low": 1.5, "close": 2.2, "volume": 200},
+        {"date": "2024-01-02 09:30:00", "open": 1.0, "high": 1.5, "low": 0.5, "close": 1.2, "volume": 100,
+         "vwap": 1.1},
+    ]
+    client = mock_client(lambda request: httpx.Response(200, json=bars))
+
+    columns = client.get_historical_chart("AAPL", interval="5min", output="columns")
+
+    assert isinstance(columns, PriceColumns)
+    assert len(columns) == 2
+    assert columns.date.dtype == np.dtype("datetime64[s]")
+    assert columns.date[0] == np.datetime64("2024-01-02T09:30:00")
+    assert columns.open.tolist() == [1.0, 2.0]
+    assert columns.volume.tolist() == [100.0, 200.0]
+    assert columns.vwap[0] == 1.1 and np.isnan(columns.vwap[1])
+    assert all(getattr(columns, name).flags["C_CONTIGUOUS"] for name in PriceColumns.FIELDS)
+
+
+def test_get_historical_chart_invalid_output(mock_client):
+    """Test unknown output modes are rejected."""
+    client = mock_client(lambda request: httpx.Response(200, json=[]))
+    with pytest.raises(ValueError, match="'records'"):
+        client.get_historical_chart("AAPL", output="frames")
+
+
+def test_get_quotes_records(mock_client):
+    """Test record output keeps model attribute names without validating."""
+    client = mock_client(_batch_quote_handler([]))
+
+    quotes = client.get_quotes(["AAPL", "MISSING"], output="records")
+
+    record = quotes["AAPL"]
+    assert isinstance(record, QuoteRecord)
+    assert record.price == 1.0 and record.changes_percentage is None
+    assert not hasattr(record, "__dict__")
+    assert quotes.missing == ["MISSING"]
+    assert record.to_model() == Quote(symbol="AAPL", price=1.0)
+
+
+def test_records_sampled_validation(mock_client):
+    """Test validate_every validates one record response in N, across with_options copies."""
+    row = {"symbol": "AAPL", "price": "drifted", "changesPercentage": 1.5}
+    client = mock_client(lambda request: httpx.Response(200, json=[row]), validate_every=3)
+
+    outcomes = []
+    for call in range(6):
+        target = client.with_options(retry=None) if call % 2 else client
+        try:
+            quote = target.get_quote("AAPL", output="records")[0]
+        except ValidationError:
+            outcomes.append("invalid")
+        else:
+            assert quote.price == "drifted" and quote.changes_percentage == 1.5
+            outcomes.append("ok")
+
+    assert outcomes == ["invalid", "ok", "ok", "invalid", "ok", "ok"]
+
+
+def test_records_not_validated_by_default(mock_client):
+    """Test record output never validates without validate_every."""
+    client = mock_client(lambda request: httpx.Response(200, json=[{"symbol": "AAPL", "price": "drifted"}]))
+    assert [client.get_quote("AAPL", output="records")[0].price for _ in range(3)] == ["drifted"] * 3
+    with pytest.raises(ValueError, match="validate_every"):
+        mock_client(lambda request: httpx.Response(200, json=[]), validate_every=-1)
+
+
+def test_get_historical_chart_records(mock_client):
+    """Test record output for price bars maps to the model's fields."""
+    bar = {"date": "2024-01-02 09:30:00", "open": 1.0, "high": 1.5, "low": 0.5, "close": 1.2, "volume": 100}
+    client = mock_client(lambda request: httpx.Response(200, json=[bar]))
+
+    records = client.get_historical_chart("AAPL", interval="5min", output="records")
+
+    assert records == [HistoricalPriceRecord(**bar)]
+    assert records[0].close == 1.2
+    assert records[0].to_model() == HistoricalPrice(**bar)
+
+
+def test_date_windows():
+    """Test long intraday ranges split into consecutive inclusive windows."""
+    assert date_windows("1min", "2024-01-01", "2024-01-03") == []
+    assert date_windows("1day", "2020-01-01", "2024-01-01") == []
+    assert date_windows("1min", "2024-01-01", "2024-01-07") == [
+        ("2024-01-01", "2024-01-03"),
+        ("2024-01-04", "2024-01-06"),
+        ("2024-01-07", "2024-01-07"),
+    ]
+
+
+def _windowed_chart_handler(calls):
+    """Serve one bar per day from the day before each window; the 2024-01-04 window is empty."""
+
+    def handler(request):
+        start, end = request.url.params["from"], request.url.params["to"]
+        calls.append((start, end))
+        if start == "2024-01-04":
+            return httpx.Response(200, json=[])
+        days = range(max(int(start[-2:]) - 1, 1), int(end[-2:]) + 1)
+        bars = [
+            {"date": f"2024-01-{day:02d} 09:30:00", "open": 1.0, "high": 1.0, "low": 1.0, "close": day, "volume": 1}
+            for day in days
+        ]
+        return httpx.Response(200, json=bars[::-1])
+
+    return handler
+
+
+def test_get_historical_chart_splits_long_ranges(mock_client):
+    """Test windows are merged, de-duplicated, sorted newest first and empty ones reported."""
+    calls = []
+    client = mock_client(_windowed_chart_handler(calls))
+
+    bars = client.get_historical_chart("AAPL", interval="1min", from_date="2024-01-01", to_date="2024-01-12")
+
+    assert len(calls) == 4
+    assert isinstance(bars, PriceSeries)
+    assert [bar.close for bar in bars] == [12.0, 11.0, 10.0, 9.0, 8.0, 7.0, 6.0, 3.0, 2.0, 1.0]
+    assert bars.gaps == [("2024-01-04", "2024-01-06")]
+
+
+def test_get_historical_chart_splits_columns(mock_client):
+    """Test split requests also merge columnar output."""
+    pytest.importorskip("numpy")
+    client = mock_client(_windowed_chart_handler([]))
+
+    columns = client.get_historical_chart(
+        "AAPL", interval="1min", from_date="2024-01-01", to_date="2024-01-12", output="columns"
+    )
+
+    assert columns.close.tolist() == [1.0, 2.0, 3.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0]
+    assert columns.gaps == [("2024-01-04", "2024-01-06")]
+
+
+def test_get_historical_chart_tables(mock_client):
+    """Test DataFrame and Arrow output of split chart requests, merged oldest first."""
+    pd = pytest.importorskip("pandas")
+    pa = pytest.importorskip("pyarrow")
+    client = mock_client(_windowed_chart_handler([]))
+    kwargs = {"interval": "1min", "from_date": "2024-01-01", "to_date": "2024-01-12"}
+
+    frame = client.get_historical_chart("AAPL", output="pandas", **kwargs)
+    assert list(frame.columns) == list(PriceColumns.FIELDS)
+    assert frame["date"].dtype == "datetime64[s]"
+    assert frame["date"].is_monotonic_increasing
+    assert frame["close"].tolist() == [1.0, 2.0, 3.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0]
+    assert all(frame[name].dtype == "float64" for name in PriceColumns.FIELDS[1:])
+
+    table = client.get_historical_chart("AAPL", output="arrow", **kwargs)
+    assert table.schema.field("date").type == pa.timestamp("s")
+    assert table.schema.field("close").type == pa.float64()
+    assert table.column("close").to_pylist() == frame["close"].tolist()
+    assert pd.Timestamp(table.column("date")[0].as_py()) == frame["date"].iloc[0]
+
+
+def test_get_historical_price_tables(mock_client):
+    """Test the EOD variants' keys map onto the table columns."""
+    pytest.importorskip("pandas")
+    pa = pytest.importorskip("pyarrow")
+    rows = {
+        "full": [{"symbol": "AAPL", "date": "2024-01-03", "open": 1.0, "close": 2.0, "volume": 10, "vwap": 1.5}],
+        "dividend-adjusted": [{"symbol": "AAPL", "date": "2024-01-03", "adjOpen": 1.0, "adjClose": 2.0}],
+        "light": [{"symbol": "AAPL", "date": "2024-01-03", "price": 2.0, "volume": 10}],
+    }
+    client = mock_client(lambda request: httpx.Response(200, json=rows[request.url.path.rsplit("/", 1)[-1]]))
+
+    for price_type in rows:
+        frame = client.get_historical_price("AAPL", price_type, output="pandas")
+        assert frame["close"].tolist() == [2.0]
+        assert str(frame["date"].iloc[0]) == "2024-01-03 00:00:00"
+
+    table = client.get_historical_price("AAPL", "light", output="arrow")
+    assert table.schema.field("date").type == pa.timestamp("s")
+    assert table.column("open").to_pylist() == [None]
+    assert client.get_historical_price("AAPL", "full") == rows["full"]
+    with pytest.raises(ValueError, match="'arrow'"):
+        client.get_historical_price("AAPL", output="models")
@@ -0,0 +1,73 @@
+"""Tests for the client-side rate limiter."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from fmp import RateLimiter
+
+
+def test_burst_is_not_delayed():
+    """Test calls within the burst size go through immediately."""
+    limiter = RateLimiter.per_second(10, burst=5)
+    waits = [limiter.acquire() for _ in range(5)]
+    assert waits == [0.0] * 5
+    assert limiter.stats["delayed"] == 0
+
+
+def test_waits_once_bucket_is_empty():
+    """Test callers wait for a token instead of exceeding the rate."""
+    limiter = RateLimiter.per_second(20, burst=1)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    assert elapsed >= 4 / 20 * 0.9
+    stats = limiter.stats
+    assert stats["acquired"] == 5
+    assert stats["delayed"] == 4
+    assert stats["total_wait"] > 0
+    assert stats["max_wait"] >= stats["avg_wait"]
+
+
+def test_shared_across_threads():
+    """Test concurrent threads share one budget."""
+    limiter = RateLimiter.per_second(50, burst=1)
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(10)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - start >= 9 / 50 * 0.9
+    assert limiter.stats["acquired"] == 10
+
+
+def test_shared_between_sync_and_async_clients(mock_client, mock_async_client):
+    """Test one limiter throttles both client flavours."""
+    limiter = RateLimiter.per_second(10, burst=2)
+    handler = lambda request: httpx.Response(200, json=[])  # noqa: E731
+
+    sync_client = mock_client(handler, rate_limiter=limiter)
+    sync_client.get_quote("AAPL")
+    sync_client.get_quote("AAPL")
+
+    async def run():
+        async with mock_async_client(handler, rate_limiter=limiter) as client:
+            await asyncio.gather(*(client.get_quote(f"SYM{i}") for i in range(3)))
+
+    asyncio.run(run())
+    assert limiter.stats["acquired"] == 5
+    assert limiter.stats["delayed"] >= 2
+
+
+@pytest.mark.parametrize("kwargs", [{"calls": 0}, {"calls": 1, "period": 0}, {"calls": 1, "burst": 0}])
+def test_invalid_configuration(kwargs):
+    """Test nonsensical limits are rejected."""
+    with pytest.raises(ValueError):
+        RateLimiter(**kwargs)
@@ -0,0 +1,176 @@
+"""Tests for local bar resampling."""
+
+import asyncio
+from datetime import date, timedelta
+
+import httpx
+import pytest
+
+from fmp.models import CryptoHistoricalPrice, HistoricalPrice
+
+np = pytest.importorskip("numpy")
+
+from fmp.barstore import BarStore  # noqa: E402
+from fmp.columnar import PriceColumns  # noqa: E402
+from fmp.resample import resample, resample_stored  # noqa: E402
+
+
+def _minute_bars(day, start="09:30", count=390):
+    """One bar per minute from ``start``: close rises by 1 per bar, volume is 10, no VWAP."""
+    hours, minutes = map(int, start.split(":"))
+    first = np.datetime64(f"{day}T{hours:02d}:{minutes:02d}:00")
+    close = np.arange(1, count + 1, dtype=np.float64)
+    return PriceColumns(
+        date=first + np.arange(count).astype("timedelta64[m]"),
+        open=close - 0.5,
+        high=close + 1,
+        low=close - 1,
+        close=close,
+        volume=np.full(count, 10.0),
+        vwap=np.full(count, np.nan),
+    )
+
+
+def test_resample_aggregates_buckets():
+    """Test OHLC, summed volume and volume-weighted VWAP of 5-minute buckets."""
+    bars = _minute_bars("2024-01-02", count=12)
+    bars.volume[:5] = [1, 2, 3, 4, 0]
+
+    five = resample(bars, "5min")
+
+    assert five.date.astype(str).tolist() == ["2024-01-02T09:30:00", "2024-01-02T09:35:00", "2024-01-02T09:40:00"]
+    assert five.open.tolist() == [0.5, 5.5, 10.5]
+    assert five.high.tolist() == [6.0, 11.0, 13.0]
+    assert five.low.tolist() == [0.0, 5.0, 10.0]
+    assert five.close.tolist() == [5.0, 10.0, 12.0]
+    assert five.volume.tolist() == [10.0, 50.0, 20.0]
+    assert five.vwap[0] == pytest.approx((1 * 1 + 2 * 2 + 3 * 3 + 4 * 4) / 10)
+
+
+def test_resample_aligns_to_session_and_day():
+    """Test hourly buckets start at the session open and never span midnight."""
+    bars = PriceColumns.merge([_minute_bars("2024-01-02", start="08:00", count=120), _minute_bars("2024-01-03")])
+
+    hourly = resample(bars, "1hour")
+    assert hourly.date.astype(str).tolist()[:4] == [
+        "2024-01-02T07:30:00",
+        "2024-01-02T08:30:00",
+        "2024-01-02T09:30:00",
+        "2024-01-03T09:30:00",
+    ]
+    four = resample(bars, "4hour")
+    assert four.date.astype(str).tolist() == [
+        "2024-01-02T05:30:00",
+        "2024-01-02T09:30:00",
+        "2024-01-03T09:30:00",
+        "2024-01-03T13:30:00",
+    ]
+    assert resample(bars, "1hour", session_start="00:00").date[0] == np.datetime64("2024-01-02T08:00:00")
+    assert resample(bars, "1day").date.astype(str).tolist() == ["2024-01-02T00:00:00", "2024-01-03T00:00:00"]
+    assert len(resample(bars, "5min")) == 120 // 5 + 390 // 5
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BarStore(tmp_path / "bars")
+    days = ("2024-01-02", "2024-01-03")
+    store.append("AAPL", "1min", PriceColumns.merge([_minute_bars(day) for day in days]), complete=days)
+    store.append("AAPL", "15min", resample(store.read("AAPL", "1min"), "15min"), complete=days)
+    yield store
+    store.close()
+
+
+def test_resample_stored_uses_coarsest_source(store):
+    """Test the coarsest dividing interval is used and uncovered ranges are refused."""
+    hourly = resample_stored(store, "AAPL", "1hour", "2024-01-02", "2024-01-03")
+    assert len(hourly) == 14
+    assert hourly.close.tolist()[:2] == [60.0, 120.0]
+
+    assert len(resample_stored(store, "AAPL", "5min", "2024-01-03", "2024-01-03")) == 78
+    assert resample_stored(store, "AAPL", "1hour", "2024-01-01", "2024-01-03") is None
+    assert resample_stored(store, "AAPL", "1hour", "2024-01-02", "2024-01-04") is None
+    assert resample_stored(store, "AAPL", "1hour", "2024-01-02", None) is None
+    assert resample_stored(store, "AAPL", "1min", "2024-01-02", "2024-01-03") is None
+    assert resample_stored(store, "MSFT", "1hour", "2024-01-02", "2024-01-03") is None
+
+
+def test_resample_stored_requires_complete_days(store):
+    """Test holes between appends and days not recorded as complete are refused."""
+    store.append("AAPL", "1min", _minute_bars("2024-01-22"), complete=("2024-01-22", "2024-01-22"))
+    assert store.complete_ranges("AAPL", "1min") == [("2024-01-02", "2024-01-03"), ("2024-01-22", "2024-01-22")]
+    assert resample_stored(store, "AAPL", "1hour", "2024-01-10", "2024-01-11") is None
+    assert resample_stored(store, "AAPL", "1hour", "2024-01-03", "2024-01-22") is None
+    assert len(resample_stored(store, "AAPL", "1hour", "2024-01-22", "2024-01-22")) == 7
+
+    # Bars appended without ``complete`` (e.g. mid-session) are never served locally.
+    store.append("AAPL", "1min", _minute_bars("2024-01-23"))
+    assert resample_stored(store, "AAPL", "1hour", "2024-01-23", "2024-01-23") is None
+
+    # Older bars are dropped by append, so their days are not recorded either.
+    store.append("AAPL", "1min", _minute_bars("2024-01-10"), complete=("2024-01-10", "2024-01-10"))
+    assert resample_stored(store, "AAPL", "1hour", "2024-01-10", "2024-01-10") is None
+
+
+def test_mark_complete_skips_today(tmp_path):
+    """Test days from today on are never recorded as complete."""
+    store = BarStore(tmp_path / "bars")
+    today = date.today()
+    store.mark_complete("AAPL", "1min", (today - timedelta(days=2)).isoformat(), today.isoformat())
+    yesterday = (today - timedelta(days=1)).isoformat()
+    assert store.complete_ranges("AAPL", "1min") == [((today - timedelta(days=2)).isoformat(), yesterday)]
+    assert not store.covers("AAPL", "1min", yesterday, today.isoformat())
+
+
+def _no_requests(request):
+    raise AssertionError(f"unexpected request {request.url}")
+
+
+def test_client_serves_chart_from_store(mock_client, store):
+    """Test coarser chart requests are answered from the bar store without HTTP calls."""
+    client = mock_client(_no_requests, bar_store=store)
+
+    bars = client.get_historical_chart("AAPL", interval="1hour", from_date="2024-01-02", to_date="2024-01-02")
+    assert isinstance(bars[0], HistoricalPrice)
+    assert [bar.date for bar in bars[:2]] == ["2024-01-02 15:30:00", "2024-01-02 14:30:00"]
+    assert (bars[0].close, bars[0].volume) == (390.0, 300)
+
+    columns = client.get_historical_chart(
+        "AAPL", interval="30min", from_date="2024-01-02", to_date="2024-01-03", output="columns"
+    )
+    assert len(columns) == 26
+
+    crypto = client.get_crypto_intraday("AAPL", interval="1hour", from_date="2024-01-02", to_date="2024-01-02")
+    assert isinstance(crypto[0], CryptoHistoricalPrice)
+    assert crypto[-1].date == "2024-01-02 09:00:00"
+
+
+def test_client_fetches_what_store_cannot_serve(mock_client, store):
+    """Test requests outside the stored range still go to the API."""
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json=[])
+
+    client = mock_client(handler, bar_store=store)
+    client.get_historical_chart("AAPL", interval="1hour", from_date="2024-01-02", to_date="2024-01-05")
+    client.get_historical_chart("AAPL", interval="1min", from_date="2024-01-02", to_date="2024-01-02")
+    assert len(calls) == 2
+
+
+def test_async_client_serves_chart_from_store(mock_async_client, store):
+    """Test the async client returns locally resampled bars as an awaitable."""
+
+    async def run():
+        async with mock_async_client(_no_requests, bar_store=store) as client:
+            return await client.get_historical_chart(
+                "AAPL", interval="4hour", from_date="2024-01-02", to_date="2024-01-03", output="records"
+            )
+
+    bars = asyncio.run(run())
+    assert [bar.date for bar in bars] == [
+        "2024-01-03 13:30:00",
+        "2024-01-03 09:30:00",
+        "2024-01-02 13:30:00",
+        "2024-01-02 09:30:00",
+    ]
@@ -0,0 +1,129 @@
+"""Tests for retry handling."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from fmp import FMPAPIError, FMPAuthError, RetryPolicy
+
+
+def _flaky(responses):
+    """Return a handler that replays ``responses`` and records each call."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        response = responses[min(len(calls), len(responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    handler.calls = calls
+    return handler
+
+
+def fast_policy(**kwargs):
+    """Policy without real sleeping delays."""
+    return RetryPolicy(backoff_factor=0, **kwargs)
+
+
+def test_retries_transient_status(mock_client):
+    """Test 5xx responses are retried until success."""
+    handler = _flaky([httpx.Response(503), httpx.Response(502), httpx.Response(200, json=[])])
+    policy = fast_policy(max_attempts=3)
+    client = mock_client(handler, retry=policy)
+
+    assert client.get_quote("AAPL") == []
+    assert len(handler.calls) == 3
+    assert policy.stats == {"retries": 2, "exhausted": 0, "by_reason": {"503": 1, "502": 1}}
+
+
+def test_retries_network_errors(mock_client):
+    """Test transport errors are retried."""
+    handler = _flaky([httpx.ConnectError("boom"), httpx.Response(200, json=[])])
+    client = mock_client(handler, retry=fast_policy())
+
+    assert client.get_quote("AAPL") == []
+    assert len(handler.calls) == 2
+
+
+def test_gives_up_after_max_attempts(mock_client):
+    """Test the last failure is raised once attempts run out."""
+    handler = _flaky([httpx.Response(500, text="down")])
+    policy = fast_policy(max_attempts=2)
+    client = mock_client(handler, retry=policy)
+
+    with pytest.raises(FMPAPIError) as exc_info:
+        client.get_quote("AAPL")
+    assert exc_info.value.status_code == 500
+    assert len(handler.calls) == 2
+    assert policy.stats["exhausted"] == 1
+
+
+@pytest.mark.parametrize("status", [401, 403])
+def test_auth_errors_fail_fast(mock_client, status):
+    """Test auth failures are never retried, even if configured."""
+    handler = _flaky([httpx.Response(status)])
+    client = mock_client(handler, retry=fast_policy(retry_statuses=(401, 403, 500)))
+
+    with pytest.raises(FMPAuthError):
+        client.get_quote("AAPL")
+    assert len(handler.calls) == 1
+
+
+def test_no_policy_means_single_attempt(mock_client):
+    """Test clients without a policy keep failing on the first error."""
+    handler = _flaky([httpx.Response(503)])
+    client = mock_client(handler)
+
+    with pytest.raises(FMPAPIError):
+        client.get_quote("AAPL")
+    assert len(handler.calls) == 1
+
+
+def test_per_call_override(mock_client):
+    """Test with_options swaps the policy for a single call."""
+    handler = _flaky([httpx.Response(503), httpx.Response(200, json=[])])
+    client = mock_client(handler)
+
+    assert client.with_options(retry=fast_policy()).get_quote("AAPL") == []
+    assert client.retry is None
+    with pytest.raises(TypeError):
+        client.with_options(not_an_option=1)
+
+
+def test_retry_after_header():
+    """Test Retry-After overrides the backoff curve and is capped."""
+    policy = RetryPolicy(backoff_factor=100, max_backoff=5)
+    assert policy.next_delay(1, response=httpx.Response(429, headers={"Retry-After": "2"})) == 2.0
+    assert policy.next_delay(1, response=httpx.Response(429, headers={"Retry-After": "120"})) == 5.0
+    ignoring = RetryPolicy(backoff_factor=1, jitter=0, respect_retry_after=False)
+    assert ignoring.next_delay(2, response=httpx.Response(429, headers={"Retry-After": "9"})) == 2.0
+
+
+def test_retry_after_http_date():
+    """Test Retry-After dates, including "-0000" ones that parse as naive datetimes."""
+    policy = RetryPolicy(backoff_factor=100, max_backoff=5)
+    for value in ("Wed, 21 Oct 2015 07:28:00 GMT", "Wed, 21 Oct 2015 07:28:00 -0000"):
+        assert policy.next_delay(1, response=httpx.Response(503, headers={"Retry-After": value})) == 0.0
+
+
+def test_backoff_curve_and_jitter():
+    """Test delays grow exponentially and jitter only shortens them."""
+    policy = RetryPolicy(backoff_factor=1, max_backoff=10, jitter=0)
+    assert [policy.backoff(n) for n in range(1, 6)] == [1, 2, 4, 8, 10]
+    jittered = RetryPolicy(backoff_factor=1, jitter=0.5)
+    assert all(1 <= jittered.backoff(2) <= 2 for _ in range(50))
+
+
+def test_async_retry(mock_async_client):
+    """Test the async client shares the retry behaviour."""
+    handler = _flaky([httpx.Response(429), httpx.Response(200, json=[])])
+
+    async def run():
+        async with mock_async_client(handler, retry=fast_policy()) as client:
+            return await client.get_quote("AAPL")
+
+    assert asyncio.run(run()) == []
+    assert len(handler.calls) == 2
@@ -0,0 +1,144 @@
+"""Tests for trading days and date-range snapshot backfills."""
+
+import asyncio
+from datetime import date
+
+import httpx
+import pytest
+
+from fmp.cache import PERMANENT, ResponseCache
+from fmp.market_calendar import is_trading_day, market_holidays, trading_days
+from fmp.models import SectorPE, SectorPerformance
+
+
+def _sector_pe_handler(requested):
+    def handler(request: httpx.Request) -> httpx.Response:
+        day = request.url.params["date"]
+        requested.append(day)
+        return httpx.Response(
+            200,
+            json=[
+                {"date": day, "sector": "Energy", "exchange": "NYSE", "pe": 10.0},
+                {"date": day, "sector": "Technology", "exchange": "NYSE", "pe": 30.0},
+            ],
+        )
+
+    return handler
+
+
+def test_market_holidays():
+    """Test observed holidays, including the Saturday New Year's exception."""
+    assert market_holidays(2024) == {
+        date(2024, 1, 1),
+        date(2024, 1, 15),
+        date(2024, 2, 19),
+        date(2024, 3, 29),
+        date(2024, 5, 27),
+        date(2024, 6, 19),
+        date(2024, 7, 4),
+        date(2024, 9, 2),
+        date(2024, 11, 28),
+        date(2024, 12, 25),
+    }
+    # 2022-01-01 was a Saturday: no holiday on 2021-12-31.
+    assert is_trading_day(date(2021, 12, 31))
+    assert not is_trading_day(date(2021, 7, 5))
+    assert date(2021, 6, 18) not in market_holidays(2021)
+    assert len(trading_days("2024-01-01", "2024-12-31")) == 252
+
+
+def test_trading_days_skip_weekends_and_holidays():
+    """Test that a range skips the weekend and Good Friday."""
+    assert trading_days("2024-03-27", "2024-04-02") == ["2024-03-27", "2024-03-28", "2024-04-01", "2024-04-02"]
+    assert trading_days("2024-03-30", "2024-03-31") == []
+
+
+def test_sector_pe_range(mock_client):
+    """Test that a range fetches each trading day once and returns one table, oldest first."""
+    requested = []
+    client = mock_client(_sector_pe_handler(requested))
+
+    rows = client.get_sector_pe_range("2024-03-27", "2024-04-02", exchange="NYSE")
+
+    assert sorted(requested) == ["2024-03-27", "2024-03-28", "2024-04-01", "2024-04-02"]
+    assert all(isinstance(row, SectorPE) for row in rows)
+    assert [(row.date, row.sector) for row in rows[:3]] == [
+        ("2024-03-27", "Energy"),
+        ("2024-03-27", "Technology"),
+        ("2024-03-28", "Energy"),
+    ]
+    assert rows[-1].pe == 30.0
+
+
+def test_range_caches_past_days_permanently(mock_client, tmp_path):
+    """Test that past days are served from the cache, even from a new client."""
+    requested = []
+    path = tmp_path / "cache.db"
+    client = mock_client(_sector_pe_handler(requested), cache=ResponseCache(path=path))
+    client.get_sector_pe_range("2024-03-27", "2024-03-28")
+    assert len(requested) == 2
+
+    requested.clear()
+    client = mock_client(_sector_pe_handler(requested), cache=ResponseCache(path=path))
+    rows = client.get_sector_pe_range("2024-03-27", "2024-04-01")
+    assert requested == ["2024-04-01"]
+    assert [row.date for row in rows] == ["2024-03-27"] * 2 + ["2024-03-28"] * 2 + ["2024-04-01"] * 2
+
+
+def test_range_does_not_keep_empty_days(mock_client):
+    """Test a day requested before it was published is fetched again later, and bodies are cached as sent."""
+    requested = []
+    published = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        day = request.url.params["date"]
+        requested.append(day)
+        return httpx.Response(200, content=published.get(day, b"[]"))
+
+    cache = ResponseCache()
+    client = mock_client(handler, cache=cache)
+    assert client.get_sector_pe_range("2024-04-01", "2024-04-01") == []
+
+    published["2024-04-01"] = b'[ {"sector": "Energy", "pe": 10.0} ]'
+    rows = client.get_sector_pe_range("2024-04-01", "2024-04-01")
+    assert [(row.date, row.pe) for row in rows] == [("2024-04-01", 10.0)]
+    assert requested == ["2024-04-01", "2024-04-01"]
+
+    client.get_sector_pe_range("2024-04-01", "2024-04-01")
+    assert len(requested) == 2
+    assert cache.get("sector_pe", {"date": "2024-04-01"}, ttl=PERMANENT) == published["2024-04-01"]
+
+
+def test_range_fills_missing_dates(mock_client):
+    """Test that rows without a date get the day they were requested for."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[{"sector": "Energy", "exchange": "NYSE", "averageChange": 0.5}])
+
+    client = mock_client(handler)
+    rows = client.get_industry_performance_range("2024-04-01", "2024-04-02")
+    assert all(isinstance(row, SectorPerformance) for row in rows)
+    assert [(row.date, row.average_change) for row in rows] == [("2024-04-01", 0.5), ("2024-04-02", 0.5)]
+
+
+def test_range_pandas_output(mock_client):
+    """Test the tidy DataFrame output."""
+    pytest.importorskip("pandas")
+    client = mock_client(_sector_pe_handler([]))
+    frame = client.get_sector_pe_range("2024-04-01", "2024-04-02", output="pandas")
+    assert list(frame.columns) == ["date", "sector", "exchange", "pe"]
+    assert len(frame) == 4
+    assert str(frame["date"].dtype).startswith("datetime64")
+
+
+def test_async_range(mock_async_client):
+    """Test the async client fetches the days concurrently."""
+    requested = []
+
+    async def run():
+        async with mock_async_client(_sector_pe_handler(requested)) as client:
+            return await client.get_industry_pe_range("2024-04-01", "2024-04-03")
+
+    rows = asyncio.run(run())
+    assert sorted(requested) == ["2024-04-01", "2024-04-02", "2024-04-03"]
+    assert [row.date for row in rows] == ["2024-04-01"] * 2 + ["2024-04-02"] * 2 + ["2024-04-03"] * 2
@@ -0,0 +1,88 @@
+"""Tests for streaming list endpoints."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from fmp import FMPAPIError
+from fmp.models import CryptoInfo
+from fmp.streaming import JSONArrayParser, iter_json_array
+
+
+RECORDS = [{"symbol": f"S{i}", "name": f"Name {i} ü", "price": i + 0.25, "exchange": None} for i in range(200)]
+
+
+def _chunks(payload, size):
+    body = json.dumps(payload, ensure_ascii=False).encode()
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 64, 100_000])
+def test_parser_handles_any_chunking(size):
+    """Test elements are reassembled whatever the chunk boundaries."""
+    payload = RECORDS + [1, 2.5, -3e5, "x]", True, None, [1, [2]]]
+    assert list(iter_json_array(_chunks(payload, size))) == payload
+
+
+def test_parser_buffer_stays_small():
+    """Test only the unparsed tail is buffered."""
+    parser = JSONArrayParser()
+    peak = 0
+    for chunk in _chunks(RECORDS * 50, 256):
+        parser.feed(chunk)
+        peak = max(peak, len(parser._buffer))
+    assert peak < 512
+
+
+def test_parser_rejects_truncated_body():
+    """Test a body cut off mid-array is an error."""
+    with pytest.raises(FMPAPIError):
+        list(iter_json_array([b'[{"a": 1}, {"a"']))
+
+
+def test_iter_stock_list(mock_client):
+    """Test stock list records are yielded one at a time from a chunked body."""
+
+    def handler(request):
+        assert request.url.path.endswith("/stock/list")
+        return httpx.Response(200, content=iter(_chunks(RECORDS, 100)))
+
+    client = mock_client(handler)
+    records = client.iter_stock_list()
+    assert next(records) == RECORDS[0]
+    assert list(records) == RECORDS[1:]
+
+
+def test_iter_stream_api_error(mock_client):
+    """Test an error object instead of an array raises."""
+    client = mock_client(lambda request: httpx.Response(200, json={"Error Message": "Limit reached"}))
+    with pytest.raises(FMPAPIError, match="Limit reached"):
+        list(client.iter_stock_list())
+
+
+def test_iter_stream_http_error(mock_client):
+    """Test HTTP errors are raised before anything is yielded."""
+    client = mock_client(lambda request: httpx.Response(502, text="bad gateway"))
+    with pytest.raises(FMPAPIError) as exc_info:
+        list(client.iter_stock_list())
+    assert exc_info.value.status_code == 502
+
+
+def test_async_iter_crypto_list(mock_async_client):
+    """Test the async client yields models from a streamed body."""
+    payload = [{"symbol": "BTCUSD", "name": "Bitcoin"}, {"symbol": "ETHUSD", "name": "Ethereum"}]
+
+    async def body():
+        for chunk in _chunks(payload, 7):
+            yield chunk
+
+    async def run():
+        handler = lambda request: httpx.Response(200, content=body())  # noqa: E731
+        async with mock_async_client(handler) as client:
+            return [item async for item in client.iter_crypto_list()]
+
+    cryptos = asyncio.run(run())
+    assert all(isinstance(c, CryptoInfo) for c in cryptos)
+    assert [c.symbol for c in cryptos] == ["BTCUSD", "ETHUSD"]
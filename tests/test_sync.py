@@ -0,0 +1,158 @@
+"""Tests for incremental price syncing."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from fmp.sync import PriceStore
+
+
+def _bar(day, close):
+    return {
+        "symbol": "AAPL",
+        "date": f"2024-01-{day:02d}",
+        "open": close - 1,
+        "high": close + 1,
+        "low": close - 2,
+        "close": close,
+        "volume": 1000 + day,
+        "vwap": close,
+    }
+
+
+class FakeHistory:
+    """Serves daily bars newest first, honouring ``from``, and records the requests."""
+
+    def __init__(self, days):
+        self.bars = {day: _bar(day, 100.0 + day) for day in days}
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append((request.url.path, dict(request.url.params)))
+        start = request.url.params.get("from", "")
+        rows = [bar for _, bar in sorted(self.bars.items(), reverse=True) if bar["date"] >= start]
+        return httpx.Response(200, json=rows)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PriceStore(tmp_path / "prices.db")
+    yield store
+    store.close()
+
+
+def test_first_sync_then_delta(mock_client, store):
+    """Test a first sync stores everything and later syncs fetch only the delta."""
+    history = FakeHistory(range(2, 12))
+    client = mock_client(history)
+
+    [first] = client.sync_prices(["AAPL"], store).values()
+    assert (first.written, first.revised, first.last_date) == (10, False, "2024-01-11")
+    assert history.requests[-1] == ("/stable/historical-price-eod/full", {"symbol": "AAPL", "apikey": "test-key"})
+
+    history.bars[12] = _bar(12, 112.0)
+    result = client.sync_prices(["AAPL"], store, overlap=3)["AAPL"]
+    assert (result.written, result.revised, result.last_date) == (1, False, "2024-01-12")
+    assert history.requests[-1][1]["from"] == "2024-01-09"
+
+    again = client.sync_prices(["AAPL"], store)["AAPL"]
+    assert (again.written, again.revised) == (0, False)
+    bars = store.read("AAPL", "1day")
+    assert [bar["date"] for bar in bars] == [f"2024-01-{day:02d}" for day in range(2, 13)]
+    assert bars[-1]["close"] == 112.0
+
+
+def test_revision_triggers_redownload(mock_client, store):
+    """Test changed bars in the overlap window replace the history from its oldest bar."""
+    history = FakeHistory(range(2, 12))
+    client = mock_client(history)
+    client.sync_prices(["AAPL"], store)
+
+    # A 2:1 split adjusts every historical bar.
+    for bar in history.bars.values():
+        bar["close"] /= 2
+    history.bars[12] = _bar(12, 56.0)
+    result = client.sync_prices(["AAPL"], store)["AAPL"]
+
+    assert result.revised and result.written == 11
+    assert history.requests[-1][1]["from"] == "2024-01-02"
+    assert store.read("AAPL", "1day", end="2024-01-02")[0]["close"] == 51.0
+
+
+def test_empty_delta_keeps_history(mock_client, store):
+    """Test an empty delta response is not mistaken for a revision."""
+    history = FakeHistory(range(2, 6))
+    client = mock_client(history)
+    client.sync_prices(["AAPL"], store)
+
+    history.bars.clear()
+    result = client.sync_prices(["AAPL"], store)["AAPL"]
+
+    assert (result.written, result.revised, result.last_date) == (0, False, "2024-01-05")
+    assert len(store.read("AAPL", "1day")) == 4
+
+
+class CappedChart:
+    """Serves one minute bar per day at 09:30, honouring ``from``/``to`` but capped like ``historical-chart``."""
+
+    def __init__(self, days, cap):
+        self.bars = {day: {**_bar(day, 100.0 + day), "date": f"2024-01-{day:02d} 09:30:00"} for day in days}
+        self.cap = cap
+        self.requests = []
+
+    def __call__(self, request):
+        params = dict(request.url.params)
+        self.requests.append(params)
+        start, end = params.get("from", ""), params.get("to", "9999") + " 99"
+        rows = [bar for _, bar in sorted(self.bars.items(), reverse=True) if start <= bar["date"] <= end]
+        return httpx.Response(200, json=rows[: self.cap])
+
+
+def test_intraday_sync_windows_capped_responses(mock_client, store):
+    """Test intraday syncs fetch in windows, so a capped response never truncates the store."""
+    chart = CappedChart(range(2, 12), cap=3)
+    client = mock_client(chart)
+
+    first = client.sync_prices(["AAPL"], store, interval="1min", from_date="2024-01-02")["AAPL"]
+    assert first.written == 10
+    assert (chart.requests[0]["from"], chart.requests[0]["to"]) == ("2024-01-02", "2024-01-04")
+
+    # A revised bar in the overlap triggers a re-download from the oldest stored day.
+    chart.bars[11]["close"] = 1.0
+    chart.requests.clear()
+    result = client.sync_prices(["AAPL"], store, interval="1min", overlap=2)["AAPL"]
+    assert result.revised
+    assert any(request["from"] == "2024-01-02" for request in chart.requests)
+    bars = store.read("AAPL", "1min")
+    assert len(bars) == 10
+    assert bars[-1]["close"] == 1.0
+
+
+def test_intraday_first_sync_defaults_to_one_window(mock_client, store):
+    """Test an open-ended intraday first sync asks for one explicit window instead of a capped full history."""
+    chart = CappedChart([], cap=3)
+    client = mock_client(chart)
+    client.sync_prices(["AAPL"], store, interval="1min")
+    assert len(chart.requests) == 1 and "from" in chart.requests[0]
+
+
+def test_async_intraday_sync(mock_async_client, store):
+    """Test the async client syncs intraday intervals from the chart endpoint."""
+    paths = []
+
+    bar = {"date": "2024-01-02 09:35:00", "open": 1, "high": 2, "low": 0.5, "close": 1.5, "volume": 10}
+
+    def handler(request):
+        paths.append(request.url.path)
+        return httpx.Response(200, json=[bar])
+
+    async def run():
+        async with mock_async_client(handler) as client:
+            return await client.sync_prices(["AAPL", "MSFT"], store, interval="5min")
+
+    results = asyncio.run(run())
+    assert set(results) == {"AAPL", "MSFT"}
+    assert paths == ["/stable/historical-chart/5min"] * 2
+    assert store.last_date("MSFT", "5min") == "2024-01-02 09:35:00"
+    assert store.read("MSFT", "5min")[0]["vwap"] is None
@@ -0,0 +1,201 @@
+"""Tests for the quote watcher."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from fmp import FMPAPIError, RateLimiter
+from fmp.records import CryptoQuoteRecord
+from fmp.watch import QuoteWatcher
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("fmp.watch.time.monotonic", clock)
+    return clock
+
+
+def _quote_handler(prices, calls):
+    """Answer batch-quote requests from the ``prices`` dict, with a fresh timestamp each time."""
+
+    def handler(request):
+        symbols = request.url.params["symbols"].split(",")
+        calls.append(symbols)
+        return httpx.Response(
+            200,
+            json=[
+                {"symbol": s, "price": prices[s], "volume": 100, "timestamp": len(calls)}
+                for s in symbols
+                if s in prices
+            ],
+        )
+
+    return handler
+
+
+def test_emits_only_changed_fields(mock_client, clock):
+    """Test subscribers see every field first, then only what changed."""
+    prices = {"AAPL": 10.0, "MSFT": 20.0}
+    client = mock_client(_quote_handler(prices, []))
+    watcher = QuoteWatcher(client, ["AAPL", "MSFT"])
+    seen = []
+    watcher.subscribe(seen.append)
+    msft = watcher.subscribe(lambda update: None, symbols=["MSFT"])
+
+    first = watcher.poll()
+    assert {update.symbol for update in first} == {"AAPL", "MSFT"}
+    assert first[0].changes == {"symbol": "AAPL", "price": 10.0, "volume": 100}
+
+    prices["AAPL"] = 11.0
+    clock.now += 1
+    updates = watcher.poll()
+    assert len(updates) == 1
+    assert updates[0].changes == {"price": 11.0}
+    assert updates[0].previous == {"price": 10.0}
+    assert updates[0].quote.price == 11.0
+    assert len(seen) == 3
+
+    watcher.unsubscribe(msft)
+    watcher.remove(["MSFT"])
+    assert watcher.symbols == ["AAPL"]
+
+
+def test_adaptive_intervals(mock_client, clock):
+    """Test idle symbols back off and active ones return to the minimum interval."""
+    prices = {"AAPL": 10.0, "MSFT": 20.0}
+    calls = []
+    client = mock_client(_quote_handler(prices, calls))
+    watcher = QuoteWatcher(client, ["AAPL", "MSFT"], min_interval=1, max_interval=4)
+
+    watcher.poll()
+    for _ in range(3):
+        prices["AAPL"] += 1
+        clock.now += 1
+        watcher.poll()
+    assert watcher.interval("AAPL") == 1
+    assert watcher.interval("MSFT") == 4
+    # MSFT was due after 1s and 2s of idling, then backed off to 4s.
+    assert calls == [["AAPL", "MSFT"], ["AAPL", "MSFT"], ["AAPL"], ["AAPL", "MSFT"]]
+
+    clock.now += 1
+    assert watcher.poll() == []
+    assert watcher.interval("AAPL") == 2
+
+
+def test_request_budget(mock_client, clock):
+    """Test polls never send more requests than the budget allows."""
+    prices = {f"S{i:03d}": 1.0 for i in range(600)}
+    calls = []
+    client = mock_client(_quote_handler(prices, calls), rate_limiter=RateLimiter.per_minute(120))
+    watcher = QuoteWatcher(client, prices)
+    assert watcher.requests_per_minute == 120
+
+    watcher.poll()
+    assert len(calls) == 2
+    polled = {symbol for batch in calls for symbol in batch}
+    assert len(polled) < len(prices)
+
+    assert watcher.poll() == []
+    assert watcher._delay(clock.now) == pytest.approx(0.5)
+    clock.now += 0.5
+    watcher.poll()
+    assert len(calls) == 3
+    assert not polled.intersection(calls[-1])
+
+
+def test_thread_runner(mock_client):
+    """Test the thread runner polls until stopped."""
+    client = mock_client(_quote_handler({"AAPL": 10.0}, []))
+    watcher = QuoteWatcher(client, ["AAPL"], min_interval=0.01)
+    received = threading.Event()
+    watcher.subscribe(lambda update: received.set())
+
+    watcher.start()
+    assert received.wait(5)
+    watcher.stop(timeout=5)
+    assert watcher._thread is None
+
+
+def test_async_runner_and_errors(mock_async_client):
+    """Test the asyncio runner awaits coroutine callbacks and reports errors."""
+    calls = []
+
+    def handler(request):
+        calls.append(1)
+        if len(calls) == 1:
+            return httpx.Response(500, text="boom")
+        return _quote_handler({"BTCUSD": 42000.0}, [])(request)
+
+    async def run():
+        async with mock_async_client(handler) as client:
+            errors = []
+            watcher = QuoteWatcher(
+                client, ["BTCUSD"], crypto=True, min_interval=0.01, output="records", on_error=errors.append
+            )
+            updates = []
+
+            async def on_update(update):
+                updates.append(update)
+                watcher.stop()
+
+            watcher.subscribe(on_update)
+            await asyncio.wait_for(watcher.run_async(), 5)
+            return errors, updates
+
+    errors, updates = asyncio.run(run())
+    assert len(errors) == 1
+    assert isinstance(updates[0].quote, CryptoQuoteRecord) and updates[0].changes["price"] == 42000.0
+
+
+def test_failed_poll_backs_off(mock_client, clock):
+    """Test symbols of a failed poll are rescheduled with backoff instead of polled again at once."""
+    calls = []
+
+    def handler(request):
+        calls.append(1)
+        return httpx.Response(500, text="boom")
+
+    client = mock_client(handler)
+    watcher = QuoteWatcher(client, ["AAPL"], min_interval=1, max_interval=4)
+
+    for expected in (2, 4, 4):
+        with pytest.raises(FMPAPIError):
+            watcher.poll()
+        assert watcher.interval("AAPL") == expected
+        assert watcher._delay(clock.now) == 1
+        assert watcher.poll() == []
+        clock.now += expected
+    assert len(calls) == 3
+
+
+def test_stop_before_first_poll(mock_client):
+    """Test a stop() issued before the started thread runs is not lost."""
+    client = mock_client(_quote_handler({"AAPL": 10.0}, []))
+    watcher = QuoteWatcher(client, ["AAPL"], min_interval=0.01)
+    entered = threading.Event()
+    release = threading.Event()
+    loop = watcher._loop
+
+    def delayed_loop():
+        entered.set()
+        release.wait(5)
+        loop()
+
+    watcher._loop = delayed_loop
+    thread = watcher.start()
+    assert entered.wait(5)
+    watcher.stop(timeout=0)
+    release.set()
+    thread.join(5)
+    assert not thread.is_alive()